@@ -44,6 +44,7 @@ from .measure import expval, var, sample, probs
 from .ops import *
 from .optimize import *
 from .qnodes import qnode, QNode, QuantumFunctionError
+from .result_cache import ResultCache
 from .utils import inv
 from ._version import __version__
 from .io import *
@@ -113,6 +114,13 @@ def device(name, *args, **kwargs):
       of qubit-based quantum circuit architectures which allows
       automatic differentiation through the simulation via python's autograd library.
 
+    * :mod:`'default.qubit.parallel' <pennylane.devices.default_qubit_parallel>`: a state
+      simulator of qubit-based quantum circuit architectures that distributes the state
+      vector over multiple processes using shared memory.
+
+    * :mod:`'default.clifford' <pennylane.devices.default_clifford>`: a stabilizer simulator
+      of Clifford circuits that scales polynomially in the number of qubits.
+
     In addition, additional devices are supported through plugins — see
     the  `available plugins <https://pennylane.ai/plugins.html>`_ for more
     details.
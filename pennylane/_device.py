@@ -16,6 +16,10 @@ This module contains the :class:`Device` abstract base class.
 """
 # pylint: disable=too-many-format-args
 import abc
+import asyncio
+import functools
+import threading
+import weakref
 
 import numpy as np
 
@@ -30,9 +34,45 @@ from pennylane.operation import (
     Tensor,
 )
 from pennylane.qnodes import QuantumFunctionError
+from pennylane.variable import Variable
 from pennylane.wires import Wires, WireError
 
 
+# maximum number of mapped wires cached by each device
+_MAX_MAPPED_WIRES = 10000
+
+# locks serializing the asynchronous executions on each device
+_execution_locks = weakref.WeakKeyDictionary()
+
+
+def _run_bound(device, bindings, fn, args, kwargs):
+    """Reset a device and run a function executing a circuit on it, using the given values
+    of the free parameters.
+
+    This function is run by the executor threads of :meth:`Device.execute_async`.
+
+    Args:
+        device (Device): device executing the circuit
+        bindings (tuple[array, dict]): the values of the positional and keyword arguments
+            referenced by :class:`~.Variable` instances
+        fn (callable): function executing the circuit
+        args (tuple): positional arguments passed to ``fn``
+        kwargs (dict): keyword arguments passed to ``fn``
+
+    Returns:
+        Any: result of ``fn``
+    """
+    with _execution_locks[device]:
+        Variable.positional_arg_values, Variable.kwarg_values = bindings
+
+        try:
+            device.reset()
+            return fn(*args, **kwargs)
+        finally:
+            del Variable.positional_arg_values
+            del Variable.kwarg_values
+
+
 class DeviceError(Exception):
     """Exception raised by a :class:`~.pennylane._device.Device` when it encounters an illegal
     operation in the quantum circuit.
@@ -60,6 +100,13 @@ class Device(abc.ABC):
     _circuits = {}  #: dict[str->Circuit]: circuit templates associated with this API class
     _asarray = staticmethod(np.asarray)
 
+    def __new__(cls, *args, **kwargs):
+        device = super().__new__(cls)
+
+        # the arguments the device is created with, which may change its results
+        device._init_args = (args, kwargs)
+        return device
+
     def __init__(self, wires=1, shots=1000):
 
         self.shots = shots
@@ -71,6 +118,7 @@ class Device(abc.ABC):
         self._wires = Wires(wires)
         self.num_wires = len(self._wires)
         self._wire_map = self.define_wire_map(self._wires)
+        self._mapped_wires = {}
         self._op_queue = None
         self._obs_queue = None
         self._parameters = None
@@ -205,6 +253,12 @@ class Device(abc.ABC):
         Returns:
             Wires: wires with new labels
         """
+        # the mapped wires are cached, since the same wires are mapped for every operation
+        mapped_wires = self._mapped_wires.get(wires, None)
+
+        if mapped_wires is not None:
+            return mapped_wires
+
         try:
             mapped_wires = wires.map(self.wire_map)
         except WireError:
@@ -214,6 +268,10 @@ class Device(abc.ABC):
                 )
             )
 
+        if len(self._mapped_wires) >= _MAX_MAPPED_WIRES:
+            self._mapped_wires.clear()
+
+        self._mapped_wires[wires] = mapped_wires
         return mapped_wires
 
     @classmethod
@@ -238,6 +296,45 @@ class Device(abc.ABC):
         """
         return cls._capabilities
 
+    async def execute_async(self, *args, **kwargs):
+        """Reset the device and execute a quantum circuit without blocking the event loop.
+
+        Accepts the same arguments as :meth:`~.execute`, and returns the same result.
+        The values of any free parameters of the circuit are read when the coroutine
+        starts running.
+
+        By default, the execution is run in the default executor of the running event loop,
+        and executions on the same device are run one at a time. Devices that communicate
+        with a remote service may override this method to perform asynchronous I/O instead,
+        so that many executions can be in flight at once.
+
+        Returns:
+            array[float]: measured value(s)
+        """
+        return await self._run_async(self.execute, *args, **kwargs)
+
+    async def _run_async(self, fn, *args, **kwargs):
+        """Reset the device and run a function executing a circuit on it in the default
+        executor of the running event loop.
+
+        Args:
+            fn (callable): function executing the circuit
+            args (tuple): positional arguments passed to ``fn``
+            kwargs (dict): keyword arguments passed to ``fn``
+
+        Returns:
+            Any: result of ``fn``
+        """
+        if self not in _execution_locks:
+            _execution_locks[self] = threading.Lock()
+
+        bindings = (Variable.positional_arg_values, Variable.kwarg_values)
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            None, functools.partial(_run_bound, self, bindings, fn, args, kwargs)
+        )
+
     def execute(self, queue, observables, parameters={}, **kwargs):
         """Execute a queue of quantum operations on the device and then measure the given observables.
 
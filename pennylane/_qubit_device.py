@@ -23,12 +23,15 @@ import itertools
 
 import numpy as np
 
-from pennylane.operation import Sample, Variance, Expectation, Probability
+from pennylane.operation import Sample, Variance, Expectation, Probability, Tensor
 from pennylane.qnodes import QuantumFunctionError
 from pennylane import Device
 from pennylane.wires import Wires
 
 
+_PAULI_OBSERVABLES = frozenset(["Identity", "PauliX", "PauliY", "PauliZ"])
+
+
 class QubitDevice(Device):
     """Abstract base class for PennyLane qubit devices.
 
@@ -482,14 +485,57 @@ class QubitDevice(Device):
         # it corresponds to the orders of the wires passed.
         basis_states = np.array(list(itertools.product([0, 1], repeat=len(device_wires))))
         perm = np.ravel_multi_index(
-            basis_states[:, np.argsort(np.argsort(device_wires))].T, [2] * len(device_wires)
+            basis_states[:, np.argsort(device_wires)].T, [2] * len(device_wires)
         )
         return self._gather(prob, perm)
 
+    def _parity_expval(self, observable):
+        r"""Exact expectation value of a tensor product of Pauli observables, computed
+        without its eigenvalues.
+
+        In the eigenbasis of the observable, into which the circuit has been rotated,
+        its eigenvalues are the parities :math:`(-1)^{b_1 + \dots + b_k}` of the
+        computational basis states on the wires of its non-identity factors. The
+        expectation value is obtained from the marginal probabilities of these wires,
+        by taking the difference between the probabilities of even and odd parity one
+        wire at a time. This avoids building the :math:`2^k` eigenvalues of the
+        observable, and the marginal probabilities are taken in the order of the device
+        wires, which does not affect the parities, so that they need not be permuted.
+
+        Args:
+            observable (~.Observable): the observable
+
+        Returns:
+            float or None: the expectation value, or ``None`` if the observable is not a
+            tensor product of Pauli observables with at least one non-identity factor
+        """
+        if not isinstance(observable, Tensor) or any(
+            ob.name not in _PAULI_OBSERVABLES for ob in observable.obs
+        ):
+            return None
+
+        wires = Wires.all_wires([ob.wires for ob in observable.non_identity_obs])
+
+        if not wires:
+            return None
+
+        wires = Wires([w for w in self.wires.labels if w in wires.labels])
+        prob = self._reshape(self.probability(wires=wires), [2] * len(wires))
+
+        for _ in wires:
+            prob = prob[0] - prob[1]
+
+        return prob
+
     def expval(self, observable):
 
         if self.analytic:
             # exact expectation value
+            parity = self._parity_expval(observable)
+
+            if parity is not None:
+                return parity
+
             eigvals = self._asarray(observable.eigvals, dtype=self.R_DTYPE)
             prob = self.probability(wires=observable.wires)
             return self._dot(eigvals, prob)
@@ -501,6 +547,12 @@ class QubitDevice(Device):
 
         if self.analytic:
             # exact variance value
+            parity = self._parity_expval(observable)
+
+            if parity is not None:
+                # the eigenvalues of the observable square to one
+                return 1 - parity ** 2
+
             eigvals = self._asarray(observable.eigvals, dtype=self.R_DTYPE)
             prob = self.probability(wires=observable.wires)
             return self._dot((eigvals ** 2), prob) - self._dot(eigvals, prob) ** 2
@@ -15,12 +15,36 @@
 This module contains the :class:`QueuingContext` abstract base class.
 """
 import abc
+import threading
 from collections import OrderedDict, deque
 
 import pennylane as qml
 
 
-class QueuingContext(abc.ABC):
+class QueuingContextType(abc.ABCMeta):
+    """Metaclass of :class:`QueuingContext`, storing the stack of active contexts per thread.
+
+    The stacks are held by the ``_stacks`` thread-local attribute of the classes, so that
+    quantum functions can be queued concurrently in different threads.
+    """
+
+    @property
+    def _active_contexts(cls):
+        """deque[QueuingContext]: the stack of contexts that are currently active in
+        this thread"""
+        stacks = cls._stacks
+
+        if not hasattr(stacks, "active"):
+            stacks.active = deque()
+
+        return stacks.active
+
+    @_active_contexts.setter
+    def _active_contexts(cls, contexts):
+        cls._stacks.active = contexts
+
+
+class QueuingContext(metaclass=QueuingContextType):
     """Abstract base class for classes that exposes a queue for objects.
 
     In PennyLane, the construction of quantum gates is separated from the specific
@@ -42,8 +66,8 @@ class QueuingContext(abc.ABC):
 
     # TODO: update docstring
 
-    _active_contexts = deque()
-    """The stack of contexts that are currently active."""
+    _stacks = threading.local()
+    """The stacks of contexts that are currently active, one per thread."""
 
     def __enter__(self):
         """Adds this instance to the global list of active contexts.
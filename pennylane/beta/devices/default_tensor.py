@@ -15,13 +15,19 @@ r"""
 Experimental simulator plugin based on tensor network contractions
 """
 # pylint: disable=too-many-instance-attributes
+import os
+import threading
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
 
 import numpy as np
+import opt_einsum
 
 from pennylane._device import Device
 from pennylane.beta.devices import numpy_ops as ops
+from pennylane.operation import Expectation, Tensor
 from pennylane.wires import Wires
 
 try:
@@ -37,6 +43,30 @@ except ImportError as e:
 # tolerance for numerical errors
 TOL = 1e-10
 
+# maximum number of contraction paths stored by a device
+PATH_CACHE_SIZE = 256
+
+# worker pool shared by the devices, contracting the expectation values of several observables
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """Returns the worker pool shared by the devices, creating it on first use.
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor: the worker pool
+    """
+    global _executor  # pylint: disable=global-statement
+
+    with _executor_lock:
+        if _executor is None:
+            # the contractions keep the CPUs busy, so use no more threads than there are CPUs
+            _executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+    return _executor
+
+
 contract_fns = {
     "greedy": tn.contractors.greedy,
     "branch": tn.contractors.branch,
@@ -44,6 +74,14 @@ contract_fns = {
     "auto": tn.contractors.auto,
 }
 
+# opt_einsum path algorithms used by the contraction methods in ``contract_fns``
+path_algorithms = {
+    "greedy": opt_einsum.paths.greedy,
+    "branch": opt_einsum.paths.branch,
+    "optimal": opt_einsum.paths.optimal,
+    "auto": opt_einsum.paths.auto,
+}
+
 
 class DefaultTensor(Device):
     """Experimental Tensor Network simulator device for PennyLane.
@@ -68,8 +106,17 @@ class DefaultTensor(Device):
     the simulator's quantum states and for the matrices of quantum gates and observables.
 
     The ``"mps"`` representation (standing for "matrix product state") approximates the quantum state
-    using a one-dimensional grid of qubits with nearest-neighbour connectivity. As such, it does not support
-    multi-qubit gates/observables that do not act on nearest-neighbour qubits.
+    using a one-dimensional grid of qubits with nearest-neighbour connectivity. The state is kept in
+    mixed-canonical form, and multi-qubit gates are applied by contracting the affected sites and
+    splitting them again with a truncated singular value decomposition, controlled by the ``max_bond_dim``
+    and ``cutoff`` arguments. Gates acting on non-neighbouring qubits are routed through a network of
+    ``SWAP`` gates. Expectation values are computed by sweeping over the measured sites only, without
+    contracting the network into a dense state vector.
+
+    With the ``"exact"`` representation, expectation values are contracted as a network consisting of
+    the bra, the observable and the ket, without contracting the quantum state first. Operations outside
+    of the light cone of the measured wires cancel with their adjoint, and are left out of the network.
+    Expectation values of several observables are contracted concurrently on a thread pool.
 
     The preferred contraction method can also be specified when using the ``"exact"`` representation.
     Available options are "auto", "greedy", "branch", or "optimal".
@@ -80,6 +127,9 @@ class DefaultTensor(Device):
 
       >>> exact_tensornet = qml.device("default.tensor", wires=2, contraction_method="greedy")
       >>> mps_tensornet = qml.device("default.tensor", wires=2, representation="mps")
+      >>> truncated_mps_tensornet = qml.device(
+      ...     "default.tensor", wires=50, representation="mps", max_bond_dim=16, cutoff=1e-10
+      ... )
 
     Args:
         wires (int, Iterable[Number, str]): Number of subsystems represented by the device,
@@ -94,6 +144,13 @@ class DefaultTensor(Device):
             for the "exact" representation. Valid options are "auto", "greedy", "branch", or "optimal".
             See documentation of the `TensorNetwork library <https://tensornetwork.readthedocs.io/en/latest/>`_
             for more information about contraction methods.
+        max_bond_dim (int): Maximum bond dimension kept when splitting sites of the matrix product
+            state after applying a multi-qubit gate. Only applicable for the "mps" representation.
+            If not specified, the bond dimension is not bounded.
+        cutoff (float): Maximum truncation error allowed when splitting sites of the matrix product
+            state, given as the norm of the discarded singular values. Only applicable for the "mps"
+            representation. If not specified, only singular values vanishing to numerical precision
+            are discarded.
     """
 
     # pylint: disable=attribute-defined-outside-init
@@ -153,7 +210,15 @@ class DefaultTensor(Device):
 
     _zero_state = np.array([1.0, 0.0], dtype=C_DTYPE)
 
-    def __init__(self, wires, shots=1000, representation="exact", contraction_method="auto"):
+    def __init__(
+        self,
+        wires,
+        shots=1000,
+        representation="exact",
+        contraction_method="auto",
+        max_bond_dim=None,
+        cutoff=None,
+    ):
         super().__init__(wires, shots)
         if representation not in ["exact", "mps"]:
             raise ValueError("Invalid representation. Must be one of 'exact' or 'mps'.")
@@ -163,6 +228,10 @@ class DefaultTensor(Device):
         }
         self._rep = representation
         self._contraction_method = contraction_method
+        self._max_bond_dim = max_bond_dim
+        self._cutoff = TOL if cutoff is None else cutoff
+        self._contraction_paths = OrderedDict()
+        self._expvals = {}
         self.reset()
         self.analytic = False
 
@@ -193,6 +262,7 @@ class DefaultTensor(Device):
     def _clear_network_data(self):
         """Remove all data representing the current network from internal cache."""
         self._nodes = {}
+        self._state_wires = []
         self._free_wire_edges = []
         self.mps = None
         self._contracted_state_node = None
@@ -257,6 +327,7 @@ class DefaultTensor(Device):
                         "with provided wires {}.".format(tensor.shape, wires.tolist())
                     )
                 node = self._add_node(tensor, wires=wires, name=name)
+                self._state_wires.append(wires.labels)
                 self._free_wire_edges.extend(node.edges)
 
         elif self._rep == "mps":
@@ -287,14 +358,24 @@ class DefaultTensor(Device):
                     for idx, wire in enumerate(wires):
                         if idx < len(wires) - 1:
                             node = tn.Node(DV, name=name, backend=self.backend)
-                            U, DV, _error = tn.split_node(node, node[:2], node[2:])
+                            U, DV, _error = tn.split_node(
+                                node,
+                                node[:2],
+                                node[2:],
+                                max_singular_values=self._max_bond_dim,
+                                max_truncation_err=self._cutoff,
+                            )
                             node = self._add_node(U, wires=wire, name=name)
                         else:
                             # final wire; no need to split further
                             node = self._add_node(DV, wires=wire, name=name)
                         nodes.append(node)
+            # All sites are left-isometric: factorized sites are normalized, and
+            # entangled states are split from the left using singular value decompositions.
+            # The orthogonality center is therefore the last site.
             self.mps = tn.matrixproductstates.finite_mps.FiniteMPS(
                 [node.tensor for node in nodes],
+                center_position=len(nodes) - 1,
                 canonicalize=False,
                 backend=self.backend,
             )
@@ -383,28 +464,144 @@ class DefaultTensor(Device):
         wires = self.map_wires(wires)
 
         if self._rep == "exact":
+            self._state_wires.append(wires.labels)
             for idx, l in enumerate(wires.labels):
                 tn.connect(op_node[num_wires + idx], self._free_wire_edges[l])
                 self._free_wire_edges[l] = op_node[idx]
         elif self._rep == "mps":
             if len(wires) == 1:
-                reg = wires.labels[0]
-                self.mps.apply_one_site_gate(op_node, reg)
-                self._free_wire_edges[reg] = self.mps.nodes[reg][1]
-            elif len(wires) == 2:
-                if abs(wires.labels[1] - wires.labels[0]) == 1:
-                    # TODO: set ``max_singular_values`` or ``max_truncation_error``
-                    self.mps.apply_two_site_gate(op_node, *wires.labels)
-                    for reg in wires.labels:
-                        self._free_wire_edges[reg] = self.mps.nodes[reg][1]
-                else:
-                    raise NotImplementedError(
-                        "Multi-wire gates only supported for nearest-neighbour wire pairs."
-                    )
+                # single-site unitaries preserve the canonical form
+                self.mps.apply_one_site_gate(op_node, wires.labels[0])
             else:
-                raise NotImplementedError(
-                    "Multi-wire gates only supported for nearest-neighbour wire pairs."
-                )
+                self._apply_mps_gate(op_node.tensor, wires.labels)
+
+            self._free_wire_edges = [node[1] for node in self.mps.nodes]
+
+    def _apply_mps_gate(self, A, sites):
+        """Apply a multi-site gate to the matrix product state.
+
+        The sites the gate acts on are moved next to each other by a network of
+        nearest-neighbour ``SWAP`` gates, which is undone after the gate is applied.
+
+        Args:
+            A (array): gate tensor of shape ``[2] * 2 * len(sites)``, with the
+                output indices preceding the input indices
+            sites (Sequence[int]): the sites of the MPS the gate acts on, in the
+                order of the gate indices
+        """
+        num_sites = len(sites)
+        start = min(min(sites), self.num_wires - num_sites)
+
+        # current position of each site, updated as the swap network is applied
+        positions = list(sites)
+        swaps = []
+        swap = self._reshape(self._get_operator_matrix("SWAP", []), [2] * 4)
+
+        for idx in range(num_sites):
+            # move the site to the position start + idx; as all sites that still
+            # need to be moved are to the right of it, sites only move to the left
+            while positions[idx] > start + idx:
+                site = positions[idx] - 1
+                self._apply_consecutive_mps_gate(swap, site, 2)
+                swaps.append(site)
+                positions = [p + 1 if p == site else p for p in positions]
+                positions[idx] = site
+
+        self._apply_consecutive_mps_gate(A, start, num_sites)
+
+        for site in reversed(swaps):
+            self._apply_consecutive_mps_gate(swap, site, 2)
+
+    def _move_mps_center(self, site):
+        """Move the orthogonality center of the matrix product state to the given site.
+
+        Unlike ``FiniteMPS.position``, which uses QR decompositions, the sites are
+        split using singular value decompositions, which support complex
+        gradients in all TensorNetwork backends.
+
+        Args:
+            site (int): the new orthogonality center
+        """
+        mps = self.mps
+
+        while mps.center_position < site:
+            n = mps.center_position
+            node = tn.Node(mps.nodes[n].tensor, backend=self.backend)
+            U, S, V, _ = tn.split_node_full_svd(node, node.edges[:2], node.edges[2:])
+            SV = tn.contract_between(S, V, output_edge_order=[S[0], V[1]])
+            right = tn.Node(mps.nodes[n + 1].tensor, backend=self.backend)
+            tn.connect(SV[1], right[0])
+            right = tn.contract_between(SV, right, output_edge_order=[SV[0]] + right.edges[1:])
+
+            mps.nodes[n] = tn.Node(U.tensor, name=mps.nodes[n].name, backend=self.backend)
+            mps.nodes[n + 1] = tn.Node(
+                right.tensor, name=mps.nodes[n + 1].name, backend=self.backend
+            )
+            mps.center_position = n + 1
+
+        while mps.center_position > site:
+            n = mps.center_position
+            node = tn.Node(mps.nodes[n].tensor, backend=self.backend)
+            U, S, V, _ = tn.split_node_full_svd(node, node.edges[:1], node.edges[1:])
+            US = tn.contract_between(U, S, output_edge_order=[U[0], S[1]])
+            left = tn.Node(mps.nodes[n - 1].tensor, backend=self.backend)
+            tn.connect(left[2], US[0])
+            left = tn.contract_between(left, US, output_edge_order=left.edges[:2] + [US[1]])
+
+            mps.nodes[n] = tn.Node(V.tensor, name=mps.nodes[n].name, backend=self.backend)
+            mps.nodes[n - 1] = tn.Node(
+                left.tensor, name=mps.nodes[n - 1].name, backend=self.backend
+            )
+            mps.center_position = n - 1
+
+    def _apply_consecutive_mps_gate(self, A, start, num_sites):
+        """Apply a gate to consecutive sites of the matrix product state.
+
+        The orthogonality center is moved to ``start``, the sites are contracted with the gate
+        and then split again from left to right using truncated singular value decompositions.
+        This leaves the MPS in mixed-canonical form, with the orthogonality center at the last
+        site the gate acts on.
+
+        Args:
+            A (array): gate tensor of shape ``[2] * 2 * num_sites``, with the
+                output indices preceding the input indices
+            start (int): the first site the gate acts on
+            num_sites (int): the number of consecutive sites the gate acts on
+        """
+        mps = self.mps
+        self._move_mps_center(start)
+
+        block = tn.Node(mps.nodes[start].tensor, backend=self.backend)
+        for site in range(start + 1, start + num_sites):
+            node = tn.Node(mps.nodes[site].tensor, backend=self.backend)
+            tn.connect(block[-1], node[0])
+            block = tn.contract_between(
+                block, node, output_edge_order=block.edges[:-1] + node.edges[1:]
+            )
+
+        gate = tn.Node(A, backend=self.backend)
+        for idx in range(num_sites):
+            tn.connect(gate[num_sites + idx], block[1 + idx])
+        block = tn.contract_between(
+            gate, block, output_edge_order=[block[0]] + gate.edges[:num_sites] + [block[-1]]
+        )
+
+        for site in range(start, start + num_sites - 1):
+            U, S, V, _ = tn.split_node_full_svd(
+                block,
+                left_edges=block.edges[:2],
+                right_edges=block.edges[2:],
+                max_singular_values=self._max_bond_dim,
+                max_truncation_err=self._cutoff,
+            )
+            mps.nodes[site] = tn.Node(U.tensor, name=mps.nodes[site].name, backend=self.backend)
+            SV = tn.contract_between(S, V, output_edge_order=[S[0]] + V.edges[1:])
+            block = tn.Node(SV.tensor, backend=self.backend)
+
+        site = start + num_sites - 1
+        tensor = block.tensor / mps.backend.norm(block.tensor)
+        mps.nodes[site] = tn.Node(tensor, name=mps.nodes[site].name, backend=self.backend)
+        mps.center_position = site
 
     def _create_nodes_from_tensors(self, tensors, tensor_wires, observable_names, key):
         """Helper function for creating TensorNetwork nodes based on tensors.
@@ -423,8 +620,67 @@ class DefaultTensor(Device):
             for A, wires, o in zip(tensors, tensor_wires, observable_names)
         ]
 
+    def pre_measure(self):
+        self._expvals = {}
+
+        # the MPS is modified when measured, and contractions with the TensorFlow
+        # backend have to be recorded on the gradient tape of the calling thread
+        if self._rep != "exact" or self.backend != "numpy":
+            return
+
+        observables = [obs for obs in self.obs_queue if obs.return_type is Expectation]
+
+        if len(observables) < 2:
+            return
+
+        measurements = []
+        for obs in observables:
+            if isinstance(obs, Tensor):
+                measurements.append((obs.name, [ob.wires for ob in obs.obs], obs.parameters))
+            else:
+                measurements.append((obs.name, obs.wires, obs.parameters))
+
+        executor = _get_executor()
+
+        # the observable nodes are added to the network before the contractions run
+        # concurrently, since the contractions only read the network
+        futures = [executor.submit(self.ev, *self._observable_nodes(*m)) for m in measurements]
+
+        for (observable, wires, _), future in zip(measurements, futures):
+            key = self._measurement_key(observable, wires)
+            self._expvals.setdefault(key, []).append(future.result())
+
+    def post_measure(self):
+        self._expvals = {}
+
+    @staticmethod
+    def _measurement_key(observable, wires):
+        """Hashable key identifying a measured observable by its name and wires."""
+        if not isinstance(observable, list):
+            observable, wires = [observable], [wires]
+        return tuple(observable), tuple(w.labels for w in wires)
+
     def expval(self, observable, wires, par):
+        expvals = self._expvals.get(self._measurement_key(observable, wires), None)
+
+        if expvals:
+            # expectation value was contracted in advance by ``pre_measure``
+            return expvals.pop(0)
 
+        return self.ev(*self._observable_nodes(observable, wires, par))
+
+    def _observable_nodes(self, observable, wires, par):
+        """Adds the nodes of an observable to the network.
+
+        Args:
+            observable (str or list[str]): name of the observable(s)
+            wires (Wires or list[Wires]): wires the observable(s) are to be measured on
+            par (tuple or list[tuple]): parameters for the observable(s)
+
+        Returns:
+            tuple[list[tn.Node], list[Wires]]: the nodes of the observable(s), and the wires
+            they act on
+        """
         if not isinstance(observable, list):
             observable, wires, par = [observable], [wires], [par]
 
@@ -436,7 +692,7 @@ class DefaultTensor(Device):
             tensors.append(self._reshape(A, [2] * offset * 2))
 
         nodes = self._create_nodes_from_tensors(tensors, wires, observable, key="observables")
-        return self.ev(nodes, wires)
+        return nodes, wires
 
     def var(self, observable, wires, par):
 
@@ -521,6 +777,11 @@ class DefaultTensor(Device):
     def _ev_exact(self, obs_nodes, obs_wires):
         r"""Expectation value of observables on specified wires using an exact representation.
 
+        The expectation value is contracted as a single network consisting of the bra, the
+        observables and the ket. Only the state preparations and gates in the backward light
+        cone of the measured wires are included, since all other gates cancel with their
+        adjoint.
+
         Args:
            obs_nodes (Sequence[tn.Node]): the observables as TensorNetwork Nodes
            obs_wires (Sequence[Wires]): measured wires for each observable
@@ -528,41 +789,48 @@ class DefaultTensor(Device):
         Returns:
            complex: expectation value :math:`\expect{A} = \bra{\psi}A\ket{\psi}`
         """
-        self._contract_premeasurement_network()
-        ket = self._contracted_state_node
-        bra = tn.conj(ket, name="Bra")
+        # translate to consecutive wire labels used by device
+        device_wires = [self.map_wires(wires).labels for wires in obs_wires]
+        light_cone = {l for labels in device_wires for l in labels}
+
+        # collect the nodes acting on the light cone, from the last gate to the state preparations
+        light_cone_nodes = []
+        for node, wires in zip(reversed(self._nodes["state"]), reversed(self._state_wires)):
+            if light_cone.intersection(wires):
+                light_cone_nodes.append((node, wires))
+                light_cone.update(wires)
+
+        nodes = list(obs_nodes)
+        ket_edges = {}
+        bra_edges = {}
+
+        for node, wires in reversed(light_cone_nodes):
+            ket = tn.Node(node.tensor, name=node.name, backend=self.backend)
+            bra = tn.conj(ket, name="Bra" + node.name)
+            nodes.extend([ket, bra])
+
+            # Use convention that the indices of a tensor are ordered like
+            # [output_idx1, output_idx2, ..., input_idx1, input_idx2, ...]
+            is_gate = len(ket.edges) == 2 * len(wires)
+            for idx, l in enumerate(wires):
+                if is_gate:
+                    tn.connect(ket[len(wires) + idx], ket_edges[l])
+                    tn.connect(bra[len(wires) + idx], bra_edges[l])
+                ket_edges[l] = ket[idx]
+                bra_edges[l] = bra[idx]
 
-        all_device_wires = Wires(range(self.num_wires))
-        meas_device_wires = []
         # For wires which are measured, add edges between
-        # the ket node, the observable nodes, and the bra node
-        for obs_node, wires in zip(obs_nodes, obs_wires):
-
-            # translate to consecutive wire labels used by device
-            device_wires = self.map_wires(wires)
-
-            meas_device_wires.append(device_wires)
-            for idx, l in enumerate(device_wires.labels):
-                # Use convention that the indices of a tensor are ordered like
-                # [output_idx1, output_idx2, ..., input_idx1, input_idx2, ...]
-                output_idx = idx
-                input_idx = len(device_wires) + idx
-                tn.connect(obs_node[input_idx], ket[l])  # A|psi>
-                tn.connect(bra[l], obs_node[output_idx])  # <psi|A
-
-        meas_device_wires = Wires(meas_device_wires)
-
-        # unmeasured wires are contracted directly between bra and ket
-        unmeasured_device_wires = Wires.unique_wires([all_device_wires, meas_device_wires])
-        for w in unmeasured_device_wires.labels:
-            tn.connect(bra[w], ket[w])
-
-        # At this stage, all nodes are connected, and the contraction yields a
-        # scalar value.
-        ket_and_observable_node = ket
-        for obs_node in obs_nodes:
-            ket_and_observable_node = tn.contract_between(obs_node, ket_and_observable_node)
-        return tn.contract_between(bra, ket_and_observable_node).tensor
+        # the ket, the observable nodes, and the bra
+        for obs_node, labels in zip(obs_nodes, device_wires):
+            for idx, l in enumerate(labels):
+                tn.connect(obs_node[len(labels) + idx], ket_edges.pop(l))  # A|psi>
+                tn.connect(bra_edges.pop(l), obs_node[idx])  # <psi|A
+
+        # unmeasured wires of the light cone are contracted directly between bra and ket
+        for l, edge in ket_edges.items():
+            tn.connect(bra_edges[l], edge)
+
+        return self._contract_exact_network(nodes, output_edge_order=[]).tensor
 
     def _ev_mps(self, obs_nodes, obs_wires):
         r"""Expectation value of observables on specified wires using a MPS representation.
@@ -573,60 +841,50 @@ class DefaultTensor(Device):
         Returns:
            complex: expectation value :math:`\expect{A} = \bra{\psi}A\ket{\psi}`
         """
-        if any(len(wires) > 2 for wires in obs_wires):
-            raise NotImplementedError(
-                "Multi-wire measurement only supported for nearest-neighbour wire pairs."
-            )
-        if len(obs_nodes) == 1 and len(obs_wires[0]) == 1:
-            # TODO: can measure multiple local expectation values at once,
-            # but this would require change of `expval` behaviour and
-            # refactor of `execute` logic from parent class
-
-            # translate to consecutive wire labels used by device
-            device_wires = self.map_wires(obs_wires[0])
-            expval = self.mps.measure_local_operator(obs_nodes, device_wires.labels)[0]
-        else:
-            conj_nodes = [tn.conj(node) for node in self.mps.nodes]
-            meas_wires = []
-            # connect measured bra and ket nodes with observables
-            for obs_node, wires in zip(obs_nodes, obs_wires):
-
-                # translate to consecutive wire labels used by device
-                device_wires = self.map_wires(wires)
-                wire_labels = device_wires.labels
-
-                if len(device_wires) == 2 and abs(wire_labels[0] - wire_labels[1]) > 1:
-                    raise NotImplementedError(
-                        "Multi-wire measurement only supported for nearest-neighbour wire pairs."
-                    )
-                offset = len(wire_labels)
-                for idx, l in enumerate(wire_labels):
-                    tn.connect(conj_nodes[l][1], obs_node[idx])
-                    tn.connect(obs_node[offset + idx], self.mps.nodes[l][1])
-                meas_wires.extend(wire_labels)
-            for l in range(self.num_wires):
-                # connect unmeasured ket nodes with bra nodes
-                if l not in meas_wires:
-                    tn.connect(conj_nodes[l][1], self.mps.nodes[l][1])
-                # connect local nodes of MPS (not connected by default in tn)
-                if l != self.num_wires - 1:
-                    tn.connect(self.mps.nodes[l][2], self.mps.nodes[l + 1][0])
-                    tn.connect(conj_nodes[l][2], conj_nodes[l + 1][0])
-
-            # contract MPS bonds first
-            bra_node = conj_nodes[0]
-            ket_node = self.mps.nodes[0]
-            for wire in range(self.num_wires - 1):
-                bra_node = tn.contract_between(bra_node, conj_nodes[wire + 1])
-                ket_node = tn.contract_between(ket_node, self.mps.nodes[wire + 1])
-            # contract observables into ket
-            for obs_node in obs_nodes:
-                ket_node = tn.contract_between(obs_node, ket_node)
-            # contract bra into observables/ket
-            expval_node = tn.contract_between(bra_node, ket_node)
-            # remove dangling singleton edges
-            expval = self._squeeze(expval_node.tensor)
-        return expval
+        device_wires = [self.map_wires(wires).labels for wires in obs_wires]
+        meas_sites = [l for labels in device_wires for l in labels]
+        first, last = min(meas_sites), max(meas_sites)
+
+        # with the orthogonality center inside the measured range, the sites outside of
+        # it are isometries and contract to the identity between bra and ket
+        self._move_mps_center(first)
+
+        kets = [
+            tn.Node(self.mps.nodes[site].tensor, backend=self.backend)
+            for site in range(first, last + 1)
+        ]
+        bras = [tn.conj(node) for node in kets]
+
+        tn.connect(kets[0][0], bras[0][0])
+        tn.connect(kets[-1][2], bras[-1][2])
+        for idx in range(len(kets) - 1):
+            tn.connect(kets[idx][2], kets[idx + 1][0])
+            tn.connect(bras[idx][2], bras[idx + 1][0])
+
+        # Use convention that the indices of a tensor are ordered like
+        # [output_idx1, output_idx2, ..., input_idx1, input_idx2, ...]
+        obs_at_site = {}
+        for obs_node, labels in zip(obs_nodes, device_wires):
+            offset = len(labels)
+            for idx, l in enumerate(labels):
+                tn.connect(bras[l - first][1], obs_node[idx])
+                tn.connect(obs_node[offset + idx], kets[l - first][1])
+            obs_at_site.setdefault(min(labels), []).append(obs_node)
+
+        # unmeasured sites are contracted directly between bra and ket
+        for site in set(range(first, last + 1)) - set(meas_sites):
+            tn.connect(bras[site - first][1], kets[site - first][1])
+
+        # sweep from left to right, absorbing observables at their first site
+        env = kets[0]
+        for idx, site in enumerate(range(first, last + 1)):
+            if idx > 0:
+                env = tn.contract_between(env, kets[idx])
+            for obs_node in obs_at_site.get(site, []):
+                env = tn.contract_between(env, obs_node)
+            env = tn.contract_between(env, bras[idx])
+
+        return env.tensor
 
     def _contract_premeasurement_network(self):
         """Contract the nodes which represent the state preparation and gate applications to get the pre-measurement state.
@@ -635,11 +893,11 @@ class DefaultTensor(Device):
         """
         if self._contracted_state_node is None:
             if self._rep == "exact":
-                contract_fn = contract_fns[self._contraction_method]
-                ket = contract_fn(self._nodes["state"], output_edge_order=self._free_wire_edges)
+                ket = self._contract_exact_network(self._nodes["state"], self._free_wire_edges)
             elif self._rep == "mps":
                 # contract all mutual edges
                 for idx, node in enumerate(self.mps.nodes):
+                    node = tn.Node(node.tensor, backend=self.backend)
                     if idx == 0:
                         prev_node = node
                     else:
@@ -651,6 +909,48 @@ class DefaultTensor(Device):
             ket.set_name("Ket")
             self._contracted_state_node = ket
 
+    def _contract_exact_network(self, nodes, output_edge_order):
+        """Contract a network of nodes using the contraction method of the device.
+
+        The contraction path only depends on the structure of the network, which is
+        identified by the names of its nodes; these encode the operations and the wires
+        they act on. The path is therefore searched for once per circuit structure, and
+        reused for all later contractions of networks with the same structure. The paths
+        of the ``PATH_CACHE_SIZE`` most recently contracted structures are kept.
+
+        Args:
+            nodes (Sequence[tn.Node]): the nodes to contract
+            output_edge_order (Sequence[tn.Edge]): dangling edges of the contracted node
+
+        Returns:
+            tn.Node: the contracted node
+        """
+        if len(nodes) == 1:
+            contract_fn = contract_fns[self._contraction_method]
+            return contract_fn(nodes, output_edge_order=output_edge_order)
+
+        key = (self._contraction_method, tuple(node.name for node in nodes))
+        path = self._contraction_paths.get(key, None)
+
+        if path is None:
+            algorithm = path_algorithms[self._contraction_method]
+
+            def optimizer(inputs, output, size_dict, memory_limit=None):
+                self._contraction_paths[key] = algorithm(inputs, output, size_dict, memory_limit)
+
+                if len(self._contraction_paths) > PATH_CACHE_SIZE:
+                    self._contraction_paths.popitem(last=False)
+
+                return self._contraction_paths[key]
+
+        else:
+            self._contraction_paths.move_to_end(key)
+
+            def optimizer(*_, **__):
+                return path
+
+        return tn.contractors.custom(nodes, optimizer, output_edge_order=output_edge_order)
+
     def _state(self):
         """The numerical quantum state tensor.
 
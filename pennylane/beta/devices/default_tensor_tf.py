@@ -110,6 +110,13 @@ class DefaultTensorTF(DefaultTensor):
             for the "exact" representation. Valid options are "auto", "greedy", "branch", or "optimal".
             See documentation of the `TensorNetwork library <https://tensornetwork.readthedocs.io/en/latest/>`_
             for more information about contraction methods.
+        max_bond_dim (int): Maximum bond dimension kept when splitting sites of the matrix product
+            state after applying a multi-qubit gate. Only applicable for the "mps" representation.
+            If not specified, the bond dimension is not bounded.
+        cutoff (float): Maximum truncation error allowed when splitting sites of the matrix product
+            state, given as the norm of the discarded singular values. Only applicable for the "mps"
+            representation. If not specified, only singular values vanishing to numerical precision
+            are discarded.
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -144,7 +151,15 @@ class DefaultTensorTF(DefaultTensor):
     C_DTYPE = ops.C_DTYPE
     R_DTYPE = ops.R_DTYPE
 
-    def __init__(self, wires, shots=1000, representation="exact", contraction_method="auto"):
+    def __init__(
+        self,
+        wires,
+        shots=1000,
+        representation="exact",
+        contraction_method="auto",
+        max_bond_dim=None,
+        cutoff=None,
+    ):
         self.variables = []
         """List[tf.Variable]: Free parameters, cast to TensorFlow variables,
         for this circuit."""
@@ -166,6 +181,8 @@ class DefaultTensorTF(DefaultTensor):
             shots=shots,
             representation=representation,
             contraction_method=contraction_method,
+            max_bond_dim=max_bond_dim,
+            cutoff=cutoff,
         )
 
     @classmethod
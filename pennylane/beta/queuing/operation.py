@@ -19,6 +19,7 @@ the PennyLane operations to work with the new AnnotatedQueue.
 from unittest import mock
 
 import pennylane as qml
+from pennylane.operation import _trusted_construction
 
 from .queuing import QueuingContext
 
@@ -65,7 +66,7 @@ def operation_expand(self):
     """
     tape = qml.beta.tapes.QuantumTape()
 
-    with tape:
+    with tape, _trusted_construction():
         self.decomposition(*self.data, wires=self.wires)
 
     if not self.data:
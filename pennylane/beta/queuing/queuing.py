@@ -15,10 +15,13 @@
 This module contains the :class:`QueuingContext` abstract base class.
 """
 import abc
-from collections import OrderedDict, deque
+import threading
+from collections import OrderedDict
 
+from pennylane._queuing import QueuingContextType
 
-class QueuingContext(abc.ABC):
+
+class QueuingContext(metaclass=QueuingContextType):
     """Abstract base class for classes that exposes a queue for objects.
 
     This class provides a context manager that tracks queuable objects and queuing functions.
@@ -104,8 +107,8 @@ class QueuingContext(abc.ABC):
     ['first object']
     """
 
-    _active_contexts = deque()
-    """The stack of contexts that are currently active."""
+    _stacks = threading.local()
+    """The stacks of contexts that are currently active, one per thread."""
 
     def __enter__(self):
         """Adds this instance to the global list of active contexts.
@@ -15,7 +15,6 @@
 This module contains the CircuitGraph class which is used to generate a DAG (directed acyclic graph)
 representation of a quantum circuit from an operator and observable queue.
 """
-import networkx as nx
 
 from pennylane import CircuitGraph
 
@@ -51,4 +50,7 @@ class NewCircuitGraph(CircuitGraph):
         Returns:
             bool: returns ``True`` if a path exists
         """
-        return nx.has_path(self._graph, a, b)
+        if a is b:
+            return True
+
+        return bool(self._descendants()[self._index[a]] >> self._index[b] & 1)
@@ -97,6 +97,9 @@ class QNode:
             * ``"finite-diff"``: Uses numerical finite-differences for all quantum operation
               arguments.
 
+        cache (~.ResultCache): cache in which the results of device executions are stored,
+            so that identical executions are not repeated
+
     Keyword Args:
         h=1e-7 (float): step size for the finite difference method
         order=1 (int): The order of the finite difference method to use. ``1`` corresponds
@@ -115,7 +118,9 @@ class QNode:
 
     # pylint:disable=too-many-instance-attributes
 
-    def __init__(self, func, device, interface="autograd", diff_method="best", **diff_options):
+    def __init__(
+        self, func, device, interface="autograd", diff_method="best", cache=None, **diff_options
+    ):
 
         if interface is not None and interface not in self.INTERFACE_MAP:
             raise qml.QuantumFunctionError(
@@ -136,6 +141,8 @@ class QNode:
         self.diff_options = diff_options or {}
         self.diff_options["method"] = self.diff_method
 
+        self.cache = cache
+
         self.dtype = np.float64
         self.max_expansion = 2
 
@@ -382,6 +389,8 @@ class QNode:
                 depth=self.max_expansion, stop_at=lambda obj: obj.name in stop_at
             )
 
+        self.qtape.cache = self.cache
+
     def __call__(self, *args, **kwargs):
         # construct the tape
         self.construct(args, kwargs)
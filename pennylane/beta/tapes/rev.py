@@ -158,7 +158,15 @@ class ReversibleTape(QuantumTape):
             )
 
         if self._state is None:
-            self.execute_device(params, device)
+            # the pre-measurement state is read from the device, so the forward
+            # pass must run on the device rather than be served from a result cache
+            cache, self.cache = self.cache, None
+
+            try:
+                self.execute_device(params, device)
+            finally:
+                self.cache = cache
+
             self._state = device._pre_rotated_state
 
         self.set_parameters(params)
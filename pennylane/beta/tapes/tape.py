@@ -242,6 +242,10 @@ class QuantumTape(AnnotatedQueue):
 
         self.jacobian_options = {}
 
+        self.cache = None
+        """.ResultCache or None: cache in which the results of device executions are stored,
+        so that identical executions are not repeated."""
+
         self.hash = 0
         self.is_sampled = False
 
@@ -925,10 +929,12 @@ class QuantumTape(AnnotatedQueue):
         # temporarily mutate the in-place parameters
         self.set_parameters(params)
 
-        if isinstance(device, qml.QubitDevice):
-            res = device.execute(self)
+        if self.cache is None:
+            res = self._execute_on(device)
         else:
-            res = device.execute(self.operations, self.observables, {})
+            res = self.cache.execute(
+                device, self.operations, self.observables, lambda: self._execute_on(device)
+            )
 
         # Update output dim if incorrect.
         # Note that we cannot assume the type of `res`, so
@@ -951,6 +957,21 @@ class QuantumTape(AnnotatedQueue):
         self.set_parameters(saved_parameters)
         return res
 
+    def _execute_on(self, device):
+        """Execute the tape operations and measurements on a device, using the
+        current tape parameters.
+
+        Args:
+            device (~.Device): a PennyLane device
+
+        Returns:
+            Any: the result of the device execution
+        """
+        if isinstance(device, qml.QubitDevice):
+            return device.execute(self)
+
+        return device.execute(self.operations, self.observables, {})
+
     # interfaces can optionally override the _execute method
     # if they need to perform any logic in between the user's
     # call to tape.execute and the internal call to tape.execute_device.
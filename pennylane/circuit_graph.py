@@ -16,8 +16,10 @@ This module contains the CircuitGraph class which is used to generate a DAG (dir
 representation of a quantum circuit from an Operator queue.
 """
 from collections import Counter, OrderedDict, namedtuple
+import hashlib
 
 import networkx as nx
+import numpy as np
 
 import pennylane as qml
 from pennylane.operation import Sample
@@ -91,6 +93,59 @@ def _is_observable(x):
     return getattr(x, "return_type", None) is not None
 
 
+def _param_signature(param, exact=False):
+    """Hashable representation of an operator parameter, used by :attr:`CircuitGraph.hash`.
+
+    Free parameters are represented by their index only, so that the signature does not
+    depend on the value bound to them.
+
+    Args:
+        param (Any): operator parameter
+        exact (bool): if ``True``, free parameters are represented by all the attributes
+            that :class:`~.Variable` instances are compared by, rather than by their index only
+    Returns:
+        Hashable: representation of the parameter
+    """
+    if isinstance(param, Variable):
+        if exact:
+            return ("V", param.name, param.idx, param.is_kwarg, param.mult)
+
+        return ("V", param.idx)
+
+    if isinstance(param, np.ndarray):
+        if param.dtype == object:
+            return (param.shape,) + tuple(_param_signature(p, exact) for p in param.flat)
+
+        return (param.dtype.str, param.shape, param.tobytes())
+
+    if isinstance(param, (list, tuple)):
+        return tuple(_param_signature(p, exact) for p in param)
+
+    try:
+        hash(param)
+    except TypeError:
+        return str(param)
+
+    return param
+
+
+def _op_signature(op):
+    """Hashable representation of an operator, used by :attr:`CircuitGraph.hash`.
+
+    Args:
+        op (Operator): node in the circuit graph
+    Returns:
+        tuple: name, parameters and wires of the operator
+    """
+    name = op.name
+
+    if isinstance(name, list):
+        # tensor products of observables
+        name = tuple(name)
+
+    return name, tuple(_param_signature(p) for p in op.data), op.wires.labels
+
+
 def _list_at_index_or_none(list, idx):
     """Return the element of a list at the given index if it exists, return None otherwise.
 
@@ -157,32 +212,109 @@ class CircuitGraph:
         Required to translate between wires and indices of the wires on the device."""
         self.num_wires = len(wires)
         """int: number of wires the circuit contains"""
+        self._hash = None
+        """int: cached structural hash of the circuit, reset by :meth:`update_node`"""
+        self._nodes = []
+        """list[Operator]: nodes of the graph, in temporal order"""
+        self._index = {}
+        """dict[Operator, int]: position of each node in ``self._nodes``"""
+        self._pred = []
+        """list[list[int]]: positions of the immediate predecessors of each node"""
+        self._succ = []
+        """list[list[int]]: positions of the immediate successors of each node"""
+        self._ancestor_bits = None
+        """list[int]: bitsets of the positions of the ancestors of each node, computed on demand"""
+        self._descendant_bits = None
+        """list[int]: bitsets of the positions of the descendants of each node, computed on demand"""
+        self._graph = None
+        """nx.DiGraph: networkx representation of the DAG, created on demand"""
+
+        # position of the last node on each wire
+        last = {}
+        wire_indices = {w: i for i, w in enumerate(wires.labels)}
+
         for k, op in enumerate(ops):
             op.queue_idx = k  # store the queue index in the Operator
-            for w in op.wires:
+
+            if not op.wires:
+                continue
+
+            node = len(self._nodes)
+            self._nodes.append(op)
+            self._index[op] = node
+            self._pred.append([])
+            self._succ.append([])
+
+            for w in op.wires.labels:
                 # get the index of the wire on the device
-                wire = wires.index(w)
+                wire = wire_indices[w] if w in wire_indices else wires.index(w)
                 # add op to the grid, to the end of wire w
                 self._grid.setdefault(wire, []).append(op)
 
+                # create an edge from the previous operator on the wire, unless
+                # it already exists due to a previous shared wire
+                prev = last.get(wire, None)
+                if prev is not None and prev not in self._pred[node]:
+                    self._pred[node].append(prev)
+                    self._succ[prev].append(node)
+
+                last[wire] = node
+
         # TODO: State preparations demolish the incoming state entirely, and therefore should have no incoming edges.
 
-        self._graph = nx.DiGraph()  #: nx.DiGraph: DAG representation of the quantum circuit
-        # Iterate over each (populated) wire in the grid
-        for wire in self._grid.values():
-            # Add the first operator on the wire to the graph
-            # This operator does not depend on any others
-            self._graph.add_node(wire[0])
+    def _ancestors(self):
+        """Bitsets of the ancestors of each node.
+
+        Since edges always point forward in temporal order, the bitsets are built
+        in a single pass over the nodes.
+
+        Returns:
+            list[int]: the ``j``-th bit of the ``i``-th bitset is set iff node ``j``
+            is an ancestor of node ``i``
+        """
+        if self._ancestor_bits is None:
+            bits = []
+
+            for pred in self._pred:
+                b = 0
+                for p in pred:
+                    b |= bits[p] | (1 << p)
+                bits.append(b)
+
+            self._ancestor_bits = bits
 
-            for i in range(1, len(wire)):
-                # For subsequent operators on the wire:
-                if wire[i] not in self._graph:
-                    # Add them to the graph if they are not already
-                    # in the graph (multi-qubit operators might already have been placed)
-                    self._graph.add_node(wire[i])
+        return self._ancestor_bits
 
-                # Create an edge between this and the previous operator
-                self._graph.add_edge(wire[i - 1], wire[i])
+    def _descendants(self):
+        """Bitsets of the descendants of each node.
+
+        Returns:
+            list[int]: the ``j``-th bit of the ``i``-th bitset is set iff node ``j``
+            is a descendant of node ``i``
+        """
+        if self._descendant_bits is None:
+            bits = [0] * len(self._nodes)
+
+            for node in reversed(range(len(self._nodes))):
+                b = 0
+                for s in self._succ[node]:
+                    b |= bits[s] | (1 << s)
+                bits[node] = b
+
+            self._descendant_bits = bits
+
+        return self._descendant_bits
+
+    def _mask(self, ops):
+        """Bitset of the positions of the given nodes."""
+        mask = 0
+        for op in ops:
+            mask |= 1 << self._index[op]
+        return mask
+
+    def _from_mask(self, mask):
+        """Nodes whose positions are set in a bitset, in temporal order."""
+        return [self._nodes[i] for i, bit in enumerate(reversed(bin(mask)[2:])) if bit == "1"]
 
     def print_contents(self):
         """Prints the contents of the quantum circuit."""
@@ -207,50 +339,79 @@ class CircuitGraph:
         Returns:
             string: serialized quantum circuit graph
         """
-        serialization_string = ""
         delimiter = "!"
         variable_delimiter = "V"
+        parts = []
 
         for op in self.operations_in_order:
-            serialization_string += op.name
+            parts.append(op.name)
 
             for param in op.data:
                 if isinstance(param, Variable):
-                    serialization_string += delimiter
-                    serialization_string += variable_delimiter
-                    serialization_string += str(param.idx)
-                    serialization_string += delimiter
-
+                    parts.append(delimiter + variable_delimiter + str(param.idx) + delimiter)
                 else:
-                    serialization_string += delimiter
-                    serialization_string += str(param)
-                    serialization_string += delimiter
+                    parts.append(delimiter + str(param) + delimiter)
 
-            serialization_string += str(op.wires.tolist())
+            parts.append(str(op.wires.tolist()))
 
         # Adding a distinct separating string that could not occur by any combination of the
         # name of the operation and wires
-        serialization_string += "|||"
+        parts.append("|||")
 
         for obs in self.observables_in_order:
-            serialization_string += str(obs.name)
+            parts.append(str(obs.name))
+
             for param in obs.data:
-                serialization_string += delimiter
-                serialization_string += str(param)
-                serialization_string += delimiter
+                parts.append(delimiter + str(param) + delimiter)
 
-            serialization_string += str(obs.wires.tolist())
+            parts.append(str(obs.wires.tolist()))
 
-        return serialization_string
+        return "".join(parts)
 
     @property
     def hash(self):
-        """Creating a hash for the circuit graph based on the string generated by serialize.
+        """Structural hash of the circuit graph.
+
+        The hash depends on the names, wires and order of the operations and observables,
+        and on the values of all parameters that are not free parameters. Free parameters only contribute their index, so that the
+        hash does not change when new values are bound to them.
+
+        The hash is computed once, and is only recomputed after :meth:`update_node`.
+        See :meth:`parameter_fingerprint` for a digest of the parameter values.
+
+        Returns:
+            int: the hash of the quantum circuit graph
+        """
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    tuple(_op_signature(op) for op in self.operations_in_order),
+                    tuple(_op_signature(obs) for obs in self.observables_in_order),
+                )
+            )
+
+        return self._hash
+
+    def parameter_fingerprint(self):
+        """Digest of the current values of all parameters in the circuit.
+
+        Free parameters are evaluated with the values currently bound to them.
+        Together with :attr:`hash`, the fingerprint identifies a circuit execution,
+        and can thus be used as a key by caching layers.
 
         Returns:
-            int: the hash of the serialized quantum circuit graph
+            bytes: the digest of the parameter values
         """
-        return hash(self.serialize())
+        h = hashlib.blake2b(digest_size=16)
+
+        for op in self.operations_in_order + self.observables_in_order:
+            for param in getattr(op, "parameters", []):
+                param = np.asarray(param)
+                h.update(param.dtype.str.encode())
+                h.update(repr(param.shape).encode())
+                h.update(param.tobytes() if param.dtype != object else repr(param).encode())
+
+        return h.digest()
 
     def to_openqasm(self, rotations=True):
         """Serialize the circuit as an OpenQASM 2.0 program.
@@ -340,8 +501,7 @@ class CircuitGraph:
         Returns:
             list[Observable]: observables
         """
-        nodes = [node for node in self._graph.nodes if _is_observable(node)]
-        return sorted(nodes, key=_by_idx)
+        return [node for node in self._nodes if _is_observable(node)]
 
     observables = observables_in_order
 
@@ -357,8 +517,7 @@ class CircuitGraph:
         Returns:
             list[Operation]: operations
         """
-        nodes = [node for node in self._graph.nodes if not _is_observable(node)]
-        return sorted(nodes, key=_by_idx)
+        return [node for node in self._nodes if not _is_observable(node)]
 
     operations = operations_in_order
 
@@ -369,9 +528,18 @@ class CircuitGraph:
         The graph has nodes representing :class:`.Operator` instances,
         and directed edges pointing from nodes to their immediate dependents/successors.
 
+        The networkx graph is only created when this property is first accessed.
+
         Returns:
             networkx.DiGraph: the directed acyclic graph representing the quantum circuit
         """
+        if self._graph is None:
+            self._graph = nx.DiGraph()
+            self._graph.add_nodes_from(self._nodes)
+            self._graph.add_edges_from(
+                (self._nodes[p], op) for op, pred in zip(self._nodes, self._pred) for p in pred
+            )
+
         return self._graph
 
     def wire_indices(self, wire):
@@ -394,7 +562,14 @@ class CircuitGraph:
         Returns:
             set[Operator]: ancestors of the given operators
         """
-        return set().union(*(nx.dag.ancestors(self._graph, o) for o in ops)) - set(ops)
+        bits = self._ancestors()
+        mask = self._mask(ops)
+        anc = 0
+
+        for op in ops:
+            anc |= bits[self._index[op]]
+
+        return set(self._from_mask(anc & ~mask))
 
     def descendants(self, ops):
         """Descendants of a given set of operators.
@@ -405,7 +580,14 @@ class CircuitGraph:
         Returns:
             set[Operator]: descendants of the given operators
         """
-        return set().union(*(nx.dag.descendants(self._graph, o) for o in ops)) - set(ops)
+        bits = self._descendants()
+        mask = self._mask(ops)
+        desc = 0
+
+        for op in ops:
+            desc |= bits[self._index[op]]
+
+        return set(self._from_mask(desc & ~mask))
 
     def _in_topological_order(self, ops):
         """Sorts a set of operators in the circuit in a topological order.
@@ -416,8 +598,7 @@ class CircuitGraph:
         Returns:
             Iterable[Operator]: same set of operators, topologically ordered
         """
-        G = nx.DiGraph(self._graph.subgraph(ops))
-        return nx.dag.topological_sort(G)
+        return sorted(ops, key=self._index.__getitem__)
 
     def ancestors_in_order(self, ops):
         """Operator ancestors in a topological order.
@@ -460,11 +641,11 @@ class CircuitGraph:
         Returns:
             set[Operator]: nodes on all the directed paths between a and b
         """
-        A = self.descendants([a])
-        A.add(a)
-        B = self.ancestors([b])
-        B.add(b)
-        return A & B
+        i = self._index[a]
+        j = self._index[b]
+        A = self._descendants()[i] | (1 << i)
+        B = self._ancestors()[j] | (1 << j)
+        return set(self._from_mask(A & B))
 
     def invisible_operations(self):
         """Operations that cannot affect the circuit output.
@@ -490,7 +671,9 @@ class CircuitGraph:
         # FIXME maybe layering should be greedier, for example [a0 b0 c1 d1] should layer as [a0 c1], [b0, d1] and not [a0], [b0 c1], [d1]
         # keep track of the current layer
         current = Layer([], [])
+        current_mask = 0
         layers = [current]
+        ancestors = self._ancestors()
 
         # sort vars by first occurrence of the var in the ops queue
         variable_ops_sorted = sorted(self.variable_deps.items(), key=lambda x: x[1][0].op.queue_idx)
@@ -499,19 +682,20 @@ class CircuitGraph:
         for param_idx, gate_param_tuple in variable_ops_sorted:
             # iterate over ops depending on that param
             for op, _ in gate_param_tuple:
-                # get all predecessor ops of the op
-                sub = self.ancestors((op,))
+                node = self._index[op]
 
-                # check if any of the dependents are in the
+                # check if any of the predecessor ops are in the
                 # currently assembled layer
-                if set(current.ops) & sub:
+                if ancestors[node] & current_mask:
                     # operator depends on current layer, start a new layer
                     current = Layer([], [])
+                    current_mask = 0
                     layers.append(current)
 
                 # store the parameters and ops indices for the layer
                 current.ops.append(op)
                 current.param_inds.append(param_idx)
+                current_mask |= 1 << node
 
         return layers
 
@@ -604,7 +788,15 @@ class CircuitGraph:
         if new.wires != old.wires:
             raise ValueError("The new Operator must act on the same wires as the old one.")
         new.queue_idx = old.queue_idx
-        nx.relabel_nodes(self._graph, {old: new}, copy=False)  # change the graph in place
+
+        node = self._index.pop(old)
+        self._nodes[node] = new
+        self._index[new] = node
+
+        if self._graph is not None:
+            nx.relabel_nodes(self._graph, {old: new}, copy=False)  # change the graph in place
+
+        self._hash = None
 
     def draw(self, charset="unicode", show_variable_names=False):
         """Draw the CircuitGraph as a circuit diagram.
@@ -15,8 +15,133 @@
 Contains the QNodeCollection class.
 """
 # pylint: disable=too-many-arguments,import-outside-toplevel
+import asyncio
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import copy
+import numbers
+import os
+import threading
 import warnings
+import weakref
+
+from autograd.tracer import Box
+
+
+# persistent worker pools, keyed by scheduler
+_executors = {}
+
+# per-thread clones of the devices used by the worker threads
+_clones = threading.local()
+
+# locks serializing the use of devices that cannot be cloned
+_device_locks = weakref.WeakKeyDictionary()
+_device_locks_lock = threading.Lock()
+
+
+def _get_executor(scheduler):
+    """Returns the persistent worker pool for the given scheduler, creating it on first use.
+
+    Args:
+        scheduler (str): either ``"threads"`` or ``"processes"``
+
+    Returns:
+        concurrent.futures.Executor: the worker pool
+    """
+    if scheduler not in _executors:
+        if scheduler == "threads":
+            # threads mostly wait on devices, so use more of them than there are CPUs
+            _executors[scheduler] = ThreadPoolExecutor()
+        else:
+            _executors[scheduler] = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    return _executors[scheduler]
+
+
+def _device(qnode):
+    """Returns the device of a QNode, which may be wrapped by an interface."""
+    return getattr(qnode, "_qnode", qnode).device
+
+
+def _device_config(device):
+    """Returns the settings of a device that may be changed after it is created,
+    such as the number of shots."""
+    settings = (
+        (name, value)
+        for name, value in vars(device).items()
+        if not name.startswith("_") and isinstance(value, (numbers.Number, str, type(None)))
+    )
+    return (device.shots,) + tuple(sorted(settings))
+
+
+def _clone_device(device):
+    """Returns the clone of a device owned by the current worker thread, or ``None``
+    if the device cannot be copied.
+
+    The device is cloned again if its settings changed since it was last cloned."""
+    if not hasattr(_clones, "devices"):
+        _clones.devices = weakref.WeakKeyDictionary()
+
+    config = _device_config(device)
+    clone = _clones.devices.get(device, None)
+
+    if clone is None or clone[0] != config:
+        try:
+            clone = (config, copy.deepcopy(device))
+        except Exception:  # pylint: disable=broad-except
+            clone = (config, None)
+
+        _clones.devices[device] = clone
+
+    return clone[1]
+
+
+def _evaluate_shared(qnode, args, kwargs):
+    """Evaluates a QNode whose device is shared with other QNodes of the collection.
+
+    The QNode is evaluated on a clone of the device owned by the current worker thread,
+    so that QNodes sharing a device can be evaluated concurrently. QNodes wrapped by the
+    Torch or TensorFlow interfaces, or using a device that cannot be copied, are evaluated
+    one at a time instead.
+    """
+    wrapped = getattr(qnode, "_qnode", qnode) is not qnode
+    device = None if wrapped else _clone_device(qnode.device)
+
+    if device is None:
+        with _device_locks_lock:
+            lock = _device_locks.setdefault(_device(qnode), threading.Lock())
+
+        with lock:
+            return qnode(*args, **kwargs)
+
+    # each QNode of the collection is evaluated by a single worker,
+    # so that its device can be swapped for the duration of the evaluation
+    shared_device = qnode.device
+    qnode.device = device
+
+    try:
+        return qnode(*args, **kwargs)
+    finally:
+        qnode.device = shared_device
+
+
+def _evaluate_chunk(qnodes, shared, args, kwargs):
+    """Evaluates a chunk of QNodes in a worker.
+
+    Args:
+        qnodes (list[QNode]): QNodes to evaluate
+        shared (list[bool]): whether the device of each QNode is shared with another
+            QNode of the collection, and must therefore be cloned by worker threads
+        args (list): positional arguments passed to the QNodes
+        kwargs (dict): keyword arguments passed to the QNodes
+
+    Returns:
+        list: the results from each QNode
+    """
+    return [
+        _evaluate_shared(q, args, kwargs) if s else q(*args, **kwargs)
+        for q, s in zip(qnodes, shared)
+    ]
 
 
 class QNodeCollection(Sequence):
@@ -122,10 +247,16 @@ class QNodeCollection(Sequence):
 
     By default, the QNodes within the QNodeCollection are executed sequentially.
 
-    However, experimental asynchronous support is now available using the
-    `Dask <https://dask.org/>`_ parallelism library. This can be activated
+    However, experimental asynchronous support is now available. This can be activated
     by passing the ``parallel=True`` keyword argument when evaluating the
-    QNodeCollection.
+    QNodeCollection. The QNodes are then split into one chunk per worker, and each
+    chunk is evaluated by a persistent pool of worker threads. QNodes sharing a device are
+    evaluated on copies of the device owned by each worker thread.
+
+    Passing ``scheduler="processes"`` uses a pool of worker processes instead. In this
+    case, the QNodes must be picklable, and gradients cannot be computed. Any other
+    value of ``scheduler`` is passed on to the
+    `Dask <https://dask.org/>`_ parallelism library, which must then be installed.
 
     For example, let's create the following two QVM simulation devices:
 
@@ -155,6 +286,13 @@ class QNodeCollection(Sequence):
     5.16 s ± 162 ms per loop (mean ± std. dev. of 7 runs, 1 loop each)
     >>> %timeit qnodes(params, parallel=True)
     2.99 s ± 40.7 ms per loop (mean ± std. dev. of 7 runs, 1 loop each)
+
+    From within an :mod:`asyncio` event loop, the collection can instead be evaluated
+    using the coroutine :meth:`~.QNodeCollection.gather`, which keeps the executions of
+    all QNodes in flight at once without blocking the event loop:
+
+    >>> await qnodes.gather(params)
+    array([0.0234375 , 0.92578125])
     """
 
     def __init__(self, qnodes=None):
@@ -204,6 +342,18 @@ class QNodeCollection(Sequence):
         parallel = kwargs.pop("parallel", False)
         _scheduler = kwargs.pop("scheduler", "threads")
 
+        if parallel and self.interface == "tf":
+            warnings.warn(
+                "Parallel execution of QNodeCollections is "
+                "an experimental feature, and currently doesn't "
+                "work with TensorFlow backpropagation. Please use "
+                "the PyTorch or Autograd interfaces instead.",
+                UserWarning,
+            )
+
+        if parallel and _scheduler in ("threads", "processes"):
+            return self._evaluate_pool(args, kwargs, _scheduler)
+
         if parallel:
             try:
                 import dask
@@ -214,15 +364,6 @@ class QNodeCollection(Sequence):
                     "\n\npip install dask[delayed]"
                 )
 
-            if self.interface == "tf":
-                warnings.warn(
-                    "Parallel execution of QNodeCollections is "
-                    "an experimental feature, and currently doesn't "
-                    "work with TensorFlow backpropagation. Please use "
-                    "the PyTorch or Autograd interfaces instead.",
-                    UserWarning,
-                )
-
             for q in self.qnodes:
                 results.append(dask.delayed(q)(*args, **kwargs))
 
@@ -233,6 +374,61 @@ class QNodeCollection(Sequence):
 
         return results
 
+    def _evaluate_pool(self, args, kwargs, scheduler):
+        """Evaluate all QNodes in the collection using a persistent pool of workers.
+
+        The QNodes are split into one chunk per worker, which are submitted as single tasks.
+
+        Args:
+            args (list): list containing the arguments
+                to pass to all internal QNodes
+            kwargs (dict): dictionary containing the keyword
+                arguments to pass to all internal QNodes
+            scheduler (str): either ``"threads"`` or ``"processes"``
+
+        Returns:
+            list: the results from each QNode
+        """
+        if scheduler == "processes" and (
+            self.interface in ("tf", "torch") or any(isinstance(a, Box) for a in args)
+        ):
+            raise ValueError(
+                "QNodeCollections cannot be evaluated in parallel processes while "
+                "computing gradients, or when using the {} interface.".format(self.interface)
+            )
+
+        executor = _get_executor(scheduler)
+        # pylint: disable=protected-access
+        num_chunks = min(len(self.qnodes), executor._max_workers)
+
+        if num_chunks <= 1:
+            return [q(*args, **kwargs) for q in self.qnodes]
+
+        # QNodes sharing a device are evaluated on per-thread clones of the device;
+        # worker processes evaluate copies of the QNodes and devices anyway
+        devices = [id(_device(q)) for q in self.qnodes]
+        shared = [scheduler == "threads" and devices.count(d) > 1 for d in devices]
+
+        chunks = [range(k, len(self.qnodes), num_chunks) for k in range(num_chunks)]
+        futures = [
+            executor.submit(
+                _evaluate_chunk,
+                [self.qnodes[i] for i in chunk],
+                [shared[i] for i in chunk],
+                args,
+                kwargs,
+            )
+            for chunk in chunks
+        ]
+
+        results = [None] * len(self.qnodes)
+
+        for chunk, future in zip(chunks, futures):
+            for i, res in zip(chunk, future.result()):
+                results[i] = res
+
+        return results
+
     @staticmethod
     def convert_results(results, interface):
         """Convert a list of results coming from multiple QNodes
@@ -258,7 +454,7 @@ class QNodeCollection(Sequence):
         if interface == "torch":
             import torch
 
-            return torch.stack(results, dim=0)
+            return torch.stack([torch.as_tensor(r) for r in results], dim=0)
 
         if interface in ("autograd", "numpy"):
             from autograd import numpy as np
@@ -271,6 +467,27 @@ class QNodeCollection(Sequence):
         results = self.evaluate(args, kwargs)
         return self.convert_results(results, self.interface)
 
+    async def gather(self, *args, **kwargs):
+        """Evaluate all QNodes in the collection concurrently, without blocking the event loop.
+
+        Each QNode is evaluated using :meth:`.BaseQNode.evaluate_async`. The arguments are
+        passed to all internal QNodes, and must not be Torch or TensorFlow tensors.
+        The results are not differentiable.
+
+        **Example**
+
+        >>> qnodes = qml.map(qml.templates.StronglyEntanglingLayers, obs_list, [qpu1, qpu2])
+        >>> asyncio.run(qnodes.gather(params))
+        array([0.0234375 , 0.92578125])
+
+        Returns:
+            list or array or torch.Tensor or tf.Tensor: the stacked results
+        """
+        results = await asyncio.gather(
+            *(getattr(q, "_qnode", q).evaluate_async(args, dict(kwargs)) for q in self.qnodes)
+        )
+        return self.convert_results(list(results), self.interface)
+
     def __len__(self):
         return len(self.qnodes)
 
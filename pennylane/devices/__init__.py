@@ -25,15 +25,18 @@ to verify and test quantum gradient computations.
     default_qubit
     default_qubit_tf
     default_qubit_autograd
+    default_qubit_parallel
     default_gaussian
     default_mixed
+    default_clifford
     tf_ops
     autograd_ops
     tests
 """
 # DefaultQubitTF and DefaultQubitAutograd not imported here since this
 # would lead to an automatic import of tensorflow and autograd, which are
-# not PennyLane core dependencies
+# not PennyLane core dependencies. DefaultQubitParallel requires Python>=3.8.
 from .default_qubit import DefaultQubit
 from .default_gaussian import DefaultGaussian
 from .default_mixed import DefaultMixed
+from .default_clifford import DefaultClifford
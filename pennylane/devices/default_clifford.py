@@ -0,0 +1,390 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+The default.clifford device is PennyLane's stabilizer simulator for Clifford circuits.
+
+It implements the necessary :class:`~pennylane._device.Device` methods for the Clifford
+subset of the :mod:`qubit operations <pennylane.ops.qubit>`. Rather than storing the
+:math:`2^n` amplitudes of the state vector, the state is represented by the stabilizer
+tableau of `Aaronson and Gottesman <https://arxiv.org/abs/quant-ph/0406196>`_, so that
+gates, Pauli expectation values and computational basis samples of circuits on thousands
+of qubits can be computed in polynomial time and memory.
+"""
+import numpy as np
+
+from pennylane import QubitDevice, DeviceError, BasisState
+from pennylane.operation import Tensor
+from pennylane.wires import Wires
+
+
+def _rowsum_phases(x, z, r, x_pivot, z_pivot, r_pivot):
+    r"""Phases of the Pauli products :math:`P_h P_{\text{pivot}}` for a batch of rows :math:`h`.
+
+    The rows and the pivot are Hermitian Pauli words :math:`(-1)^r X^x Z^z` that are
+    assumed to commute, so that each product again has a phase of :math:`\pm 1`.
+
+    Args:
+        x (array[bool]): X components of the rows, of shape ``(rows, n)``
+        z (array[bool]): Z components of the rows, of shape ``(rows, n)``
+        r (array[bool]): phases of the rows, of shape ``(rows,)``
+        x_pivot (array[bool]): X component of the pivot, of shape ``(n,)``
+        z_pivot (array[bool]): Z component of the pivot, of shape ``(n,)``
+        r_pivot (bool): phase of the pivot
+
+    Returns:
+        array[bool]: the phases of the products, of shape ``(rows,)``
+    """
+    x = x.astype(np.int64)
+    z = z.astype(np.int64)
+
+    # the function g of Aaronson and Gottesman, evaluated for every qubit at once
+    g = np.where(x_pivot & z_pivot, z - x, 0)
+    g += np.where(x_pivot & ~z_pivot, z * (2 * x - 1), 0)
+    g += np.where(~x_pivot & z_pivot, x * (1 - 2 * z), 0)
+
+    total = 2 * r.astype(np.int64) + 2 * int(r_pivot) + np.sum(g, axis=1)
+    return np.mod(total, 4) == 2
+
+
+def _gf2_row_reduce(matrix, rhs=None):
+    """Bring a binary matrix into reduced row echelon form over GF(2).
+
+    Args:
+        matrix (array[bool]): matrix of shape ``(m, n)``
+        rhs (array[bool]): optional right-hand side of shape ``(m,)``, which
+            undergoes the same row operations as ``matrix``
+
+    Returns:
+        tuple[array[bool], array[bool], list[int]]: the reduced matrix, the reduced
+        right-hand side (or ``None``) and the pivot columns; the first ``len(pivots)``
+        rows of the reduced matrix form a basis of its row space
+    """
+    matrix = np.array(matrix, dtype=bool)
+    rhs = None if rhs is None else np.array(rhs, dtype=bool)
+    num_rows, num_cols = matrix.shape
+    pivots = []
+
+    for col in range(num_cols):
+        row = len(pivots)
+        if row == num_rows:
+            break
+
+        candidates = np.flatnonzero(matrix[row:, col])
+        if candidates.size == 0:
+            continue
+
+        p = row + candidates[0]
+        matrix[[row, p]] = matrix[[p, row]]
+        if rhs is not None:
+            rhs[[row, p]] = rhs[[p, row]]
+
+        others = np.flatnonzero(matrix[:, col])
+        others = others[others != row]
+        matrix[others] ^= matrix[row]
+        if rhs is not None:
+            rhs[others] ^= rhs[row]
+
+        pivots.append(col)
+
+    return matrix, rhs, pivots
+
+
+class DefaultClifford(QubitDevice):
+    r"""Default stabilizer device for simulating Clifford circuits in PennyLane.
+
+    The state of :math:`n` qubits is stored as the :math:`n` stabilizer generators
+    :math:`(-1)^{r_i} X^{x_i} Z^{z_i}` of the tableau of Aaronson and Gottesman. Each
+    supported gate updates the tableau in :math:`\mathcal{O}(n)` time, while
+    measurement statistics require a single :math:`\mathcal{O}(n^3)` Gaussian elimination.
+
+    Measuring all qubits of a stabilizer state in the computational basis yields a
+    uniformly random element of an affine subspace :math:`c + \text{span}(L)` of
+    :math:`\{0, 1\}^n`; this description is used for exact expectation values,
+    variances and probabilities, as well as for sampling.
+
+    Args:
+        wires (int, Iterable[Number, str]): Number of subsystems represented by the device,
+            or iterable that contains unique labels for the subsystems as numbers
+            (i.e., ``[-1, 0, 2]``) or strings (``['ancilla', 'q1', 'q2']``).
+        shots (int): Number of times the circuit should be evaluated (or sampled) to estimate
+            the expectation values. Defaults to 1000 if not specified.
+            If ``analytic == True``, the number of shots is ignored
+            in the calculation of expectation values and variances, and only controls the number
+            of samples returned by ``sample``.
+        analytic (bool): indicates if the device should calculate expectations
+            and variances analytically.
+    """
+
+    name = "Default Clifford PennyLane plugin"
+    short_name = "default.clifford"
+    pennylane_requires = "0.12"
+    version = "0.12.0"
+    author = "Xanadu Inc."
+
+    operations = {
+        "BasisState",
+        "PauliX",
+        "PauliY",
+        "PauliZ",
+        "Hadamard",
+        "S",
+        "CNOT",
+        "CZ",
+        "SWAP",
+    }
+
+    observables = {"PauliX", "PauliY", "PauliZ", "Identity"}
+
+    def __init__(self, wires, *, shots=1000, analytic=True):
+        super().__init__(wires, shots, analytic)
+
+        self._apply_ops = {
+            "PauliX": self._apply_x,
+            "PauliY": self._apply_y,
+            "PauliZ": self._apply_z,
+            "Hadamard": self._apply_hadamard,
+            "S": self._apply_s,
+            "CNOT": self._apply_cnot,
+            "CZ": self._apply_cz,
+            "SWAP": self._apply_swap,
+        }
+
+        self._outcomes = None
+        self._create_tableau()
+
+    @classmethod
+    def capabilities(cls):
+        capabilities = super().capabilities().copy()
+        capabilities.update(
+            model="qubit",
+            supports_inverse_operations=True,
+            supports_analytic_computation=True,
+            returns_state=False,
+        )
+        return capabilities
+
+    def _create_tableau(self):
+        """Initialize the stabilizer tableau of the state :math:`|00\\dots 0\\rangle`,
+        which is stabilized by the :math:`Z` operator of each qubit."""
+        self._x = np.zeros((self.num_wires, self.num_wires), dtype=bool)
+        self._z = np.eye(self.num_wires, dtype=bool)
+        self._r = np.zeros(self.num_wires, dtype=bool)
+        self._outcomes = None
+
+    def reset(self):
+        """Reset the device"""
+        super().reset()
+        self._create_tableau()
+
+    def apply(self, operations, rotations=None, **kwargs):
+        rotations = rotations or []
+
+        # apply the circuit operations
+        for i, operation in enumerate(operations):
+
+            if i > 0 and isinstance(operation, BasisState):
+                raise DeviceError(
+                    "Operation {} cannot be used after other Operations have already been applied "
+                    "on a {} device.".format(operation.name, self.short_name)
+                )
+
+            self._apply_operation(operation)
+
+        # apply the circuit rotations
+        for operation in rotations:
+            self._apply_operation(operation)
+
+        self._outcomes = None
+
+    def _apply_operation(self, operation):
+        """Applies a Clifford operation to the stabilizer tableau.
+
+        Args:
+            operation (~.Operation): operation to apply on the device
+        """
+        wires = self.map_wires(operation.wires).labels
+
+        if isinstance(operation, BasisState):
+            self._apply_basis_state(operation.parameters[0], wires)
+            return
+
+        self._apply_ops[operation.base_name](*wires)
+
+        if operation.inverse and operation.base_name == "S":
+            # S^{-1} = S Z; all other supported gates are self-inverse
+            self._apply_z(wires[0])
+
+    def _apply_basis_state(self, state, wires):
+        """Initialize the tableau in a specified computational basis state.
+
+        Args:
+            state (array[int]): computational basis state of shape ``(wires,)``
+                consisting of 0s and 1s.
+            wires (list[int]): device wires that the provided computational state should be
+                initialized on
+        """
+        if not set(state).issubset({0, 1}):
+            raise ValueError("BasisState parameter must consist of 0 or 1 integers.")
+
+        if len(state) != len(wires):
+            raise ValueError("BasisState parameter and wires must be of equal length.")
+
+        for bit, wire in zip(state, wires):
+            if bit:
+                self._apply_x(wire)
+
+    # The gate updates below conjugate every stabilizer generator by the gate,
+    # following the rules of Aaronson and Gottesman.
+
+    def _apply_x(self, a):
+        self._r ^= self._z[:, a]
+
+    def _apply_y(self, a):
+        self._r ^= self._x[:, a] ^ self._z[:, a]
+
+    def _apply_z(self, a):
+        self._r ^= self._x[:, a]
+
+    def _apply_hadamard(self, a):
+        self._r ^= self._x[:, a] & self._z[:, a]
+        self._x[:, a], self._z[:, a] = self._z[:, a].copy(), self._x[:, a].copy()
+
+    def _apply_s(self, a):
+        self._r ^= self._x[:, a] & self._z[:, a]
+        self._z[:, a] ^= self._x[:, a]
+
+    def _apply_cnot(self, a, b):
+        x, z = self._x, self._z
+        self._r ^= x[:, a] & z[:, b] & ~(x[:, b] ^ z[:, a])
+        x[:, b] ^= x[:, a]
+        z[:, a] ^= z[:, b]
+
+    def _apply_cz(self, a, b):
+        self._apply_hadamard(b)
+        self._apply_cnot(a, b)
+        self._apply_hadamard(b)
+
+    def _apply_swap(self, a, b):
+        self._x[:, [a, b]] = self._x[:, [b, a]]
+        self._z[:, [a, b]] = self._z[:, [b, a]]
+
+    def measurement_outcomes(self):
+        r"""The affine subspace of computational basis outcomes of the current state.
+
+        Measuring all qubits in the computational basis returns :math:`c + \sum_i b_i L_i`
+        (modulo 2), where the :math:`b_i` are independent, uniformly random bits and the
+        rows :math:`L_i` are linearly independent. The result is cached until further
+        operations are applied.
+
+        Returns:
+            tuple[array[bool], array[bool]]: the offset :math:`c` of shape ``(num_wires,)``
+            and the generators :math:`L` of shape ``(k, num_wires)``, where :math:`k` is the
+            number of random bits
+        """
+        if self._outcomes is not None:
+            return self._outcomes
+
+        x, z, r = self._x.copy(), self._z.copy(), self._r.copy()
+        num_random = 0
+
+        # Gaussian elimination on the X components of the stabilizer generators,
+        # keeping track of the phases of the multiplied Pauli words
+        for col in range(self.num_wires):
+            candidates = np.flatnonzero(x[num_random:, col])
+            if candidates.size == 0:
+                continue
+
+            row = num_random
+            p = row + candidates[0]
+            for table in (x, z, r):
+                table[[row, p]] = table[[p, row]]
+
+            others = np.flatnonzero(x[:, col])
+            others = others[others != row]
+            r[others] = _rowsum_phases(x[others], z[others], r[others], x[row], z[row], r[row])
+            x[others] ^= x[row]
+            z[others] ^= z[row]
+
+            num_random += 1
+
+        # The remaining generators are Z-type stabilizers (-1)^r Z^z, each enforcing the
+        # parity constraint z.c = r on the outcomes, while the X components of the pivot
+        # rows span the solutions of the homogeneous system.
+        _, rhs, pivots = _gf2_row_reduce(z[num_random:], r[num_random:])
+        offset = np.zeros(self.num_wires, dtype=bool)
+        offset[pivots] = rhs[: len(pivots)]
+
+        self._outcomes = (offset, x[:num_random])
+        return self._outcomes
+
+    def generate_samples(self):
+        offset, generators = self.measurement_outcomes()
+        bits = np.random.randint(0, 2, size=(self.shots, len(generators)))
+
+        # the entries of the product are bounded by the number of qubits, so that
+        # the floating point matrix multiplication is exact
+        samples = np.mod(bits.astype(np.float64) @ generators.astype(np.float64), 2)
+        return samples.astype(np.int64) ^ offset
+
+    def analytic_probability(self, wires=None):
+        wires = wires or self.wires
+        # convert to a wires object
+        wires = Wires(wires)
+        device_wires = self.map_wires(wires).tolist()
+        num_wires = len(device_wires)
+
+        offset, generators = self.measurement_outcomes()
+        basis, _, pivots = _gf2_row_reduce(generators[:, device_wires])
+        rank = len(pivots)
+
+        # all combinations of the random bits, of shape (2 ** rank, rank)
+        combinations = (np.arange(2 ** rank)[:, None] >> np.arange(rank - 1, -1, -1)) & 1
+        points = np.mod(combinations @ basis[:rank].astype(np.int64), 2) ^ offset[device_wires]
+        indices = points @ (2 ** np.arange(num_wires - 1, -1, -1))
+
+        prob = np.zeros([2 ** num_wires], dtype=np.float64)
+        prob[indices] = 2.0 ** -rank
+        return self._asarray(prob, dtype=self.R_DTYPE)
+
+    def _pauli_wires(self, observable):
+        """Device wires acted on non-trivially by a Pauli word observable.
+
+        As the diagonalizing gates have already been applied, the observable
+        corresponds to the parity of the outcomes on these wires.
+        """
+        obs = observable.obs if isinstance(observable, Tensor) else [observable]
+        return [w for o in obs if o.name != "Identity" for w in self.map_wires(o.wires).labels]
+
+    def expval(self, observable):
+        if not self.analytic:
+            return super().expval(observable)
+
+        wires = self._pauli_wires(observable)
+        offset, generators = self.measurement_outcomes()
+
+        if np.any(np.sum(generators[:, wires], axis=1) % 2):
+            # the parity depends on a uniformly random bit
+            return 0.0
+
+        return float((-1) ** (np.sum(offset[wires]) % 2))
+
+    def var(self, observable):
+        if not self.analytic:
+            return super().var(observable)
+
+        return 1.0 - self.expval(observable) ** 2
+
+    def sample(self, observable):
+        wires = self._pauli_wires(observable)
+        return 1 - 2 * (np.sum(self._samples[:, wires], axis=1) % 2)
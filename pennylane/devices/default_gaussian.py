@@ -30,6 +30,8 @@ from scipy.special import factorial as fac
 
 import pennylane as qml
 from pennylane import Device
+from pennylane.operation import Sample
+from pennylane.wires import Wires
 
 # tolerance for numerical errors
 tolerance = 1e-10
@@ -628,6 +630,69 @@ def identity(*_, **__):
     return 1, 0
 
 
+# ========================================================
+#  sampling
+# ========================================================
+
+
+def covariance_factor(cov):
+    r"""Returns a factor :math:`L` of a covariance matrix such that :math:`LL^T=\sigma`.
+
+    The Cholesky decomposition is used where possible. Covariance matrices that are
+    only positive semidefinite up to numerical precision, such as those of strongly
+    squeezed states, fall back to a factorization via the eigendecomposition.
+
+    Args:
+        cov (array): :math:`2M\times 2M` covariance matrix
+
+    Returns:
+        array: :math:`2M\times 2M` matrix factor of the covariance matrix
+    """
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        w, v = np.linalg.eigh(cov)
+        return v * np.sqrt(np.clip(w, 0, None))
+
+
+def gaussian_samples(mu, L, shots):
+    r"""Draws samples from a multivariate normal distribution.
+
+    Args:
+        mu (array): length-:math:`2M` vector of means
+        L (array): :math:`2M\times 2M` factor of the covariance matrix,
+            as returned by :func:`covariance_factor`
+        shots (int): number of samples to draw
+
+    Returns:
+        array[float]: samples of shape ``(shots, 2M)``
+    """
+    return mu + np.random.standard_normal((shots, len(mu))) @ L.T
+
+
+def homodyne_samples(mu, L, phis, shots):
+    r"""Draws joint homodyne samples of a multimode Gaussian state.
+
+    Each sample of the means vector and covariance matrix is rotated by the
+    homodyne angle of the corresponding mode, such that the shot-wise correlations
+    between the modes are preserved.
+
+    Args:
+        mu (array): length-:math:`2M` vector of means
+        L (array): :math:`2M\times 2M` factor of the covariance matrix,
+            as returned by :func:`covariance_factor`
+        phis (Sequence[float]): length-:math:`M` homodyne angles
+        shots (int): number of samples to draw
+
+    Returns:
+        array[float]: samples of shape ``(shots, M)``
+    """
+    M = len(mu) // 2
+    phis = np.asarray(phis, dtype=np.float64)
+    xp = gaussian_samples(mu, L, shots)
+    return np.cos(phis) * xp[:, :M] + np.sin(phis) * xp[:, M:]
+
+
 # ========================================================
 #  device
 # ========================================================
@@ -685,12 +750,19 @@ class DefaultGaussian(Device):
 
     _circuits = {}
 
+    _homodyne_angles = {"X": 0.0, "P": np.pi / 2}
+
     def __init__(self, wires, *, shots=1000, hbar=2, analytic=True):
         super().__init__(wires, shots)
         self.eng = None
         self.hbar = hbar
         self.analytic = analytic
 
+        # covariance matrix factors of reduced states, valid until the state changes
+        self._factor_cache = {}
+        # joint homodyne samples drawn for the observables of the current execution
+        self._joint_samples = {}
+
         self.reset()
 
     @classmethod
@@ -710,6 +782,7 @@ class DefaultGaussian(Device):
         self.reset()
 
     def apply(self, operation, wires, par):
+        self._factor_cache = {}
 
         # translate to wire labels used by device
         device_wires = self.map_wires(wires)
@@ -819,6 +892,9 @@ class DefaultGaussian(Device):
             from :class:`~.X`, :class:`~.P`, and :class:`~.QuadOperator`
             observables.
 
+        If several modes are sampled within the same execution, their samples
+        are drawn jointly by :meth:`sample_homodyne`.
+
         Args:
             observable (str): name of the observable
             wires (Wires): wires the observable is to be measured on
@@ -831,17 +907,18 @@ class DefaultGaussian(Device):
         if len(wires) != 1:
             raise ValueError("Only one mode can be measured in homodyne.")
 
-        if observable == "X":
-            phi = 0.0
-        elif observable == "P":
-            phi = np.pi / 2
-        elif observable == "QuadOperator":
-            phi = par[0]
-        else:
+        phi = self._homodyne_angle(observable, par)
+
+        if phi is None:
             raise NotImplementedError(
                 "default.gaussian does not support sampling {}".format(observable)
             )
 
+        joint = self._joint_samples.pop(self.map_wires(wires).labels[0], None)
+
+        if joint is not None and joint[0] == phi:
+            return joint[1]
+
         mu, cov = self.reduced_state(wires)
         rot = rotation(phi)
 
@@ -852,10 +929,141 @@ class DefaultGaussian(Device):
         meanphi = muphi[0]
         return np.random.normal(meanphi, stdphi, self.shots)
 
+    def pre_measure(self):
+        # Draw the samples of all homodyne observables jointly, so that the
+        # correlations between the measured modes are preserved shot by shot.
+        self._joint_samples = {}
+
+        wires = []
+        phis = []
+
+        for obs in self.obs_queue:
+            if obs.return_type is not Sample or len(obs.wires) != 1:
+                continue
+
+            phi = self._homodyne_angle(obs.name, obs.parameters)
+
+            if phi is None or obs.wires[0] in wires:
+                continue
+
+            wires.append(obs.wires[0])
+            phis.append(phi)
+
+        if len(wires) < 2:
+            # the marginal distribution of a single mode is sampled directly
+            return
+
+        samples = self.sample_homodyne(Wires(wires), phis)
+        device_wires = self.map_wires(Wires(wires))
+
+        for i, (label, phi) in enumerate(zip(device_wires.labels, phis)):
+            self._joint_samples[label] = (phi, samples[:, i])
+
+    def post_measure(self):
+        self._joint_samples = {}
+
+    def _homodyne_angle(self, observable, par):
+        """Returns the homodyne angle of a quadrature observable, or ``None``
+        if the observable is not a quadrature."""
+        if observable == "QuadOperator":
+            return par[0]
+
+        if isinstance(observable, str):
+            return self._homodyne_angles.get(observable, None)
+
+        return None
+
+    def covariance_factor(self, wires, heterodyne=False):
+        r"""Returns the vector of means and a factor of the covariance matrix of the
+        specified wires.
+
+        The factorization is cached, and reused by all sampling methods until the
+        state of the device changes.
+
+        Args:
+            wires (Wires): requested wires
+            heterodyne (bool): if ``True``, the covariance matrix of the
+                Husimi Q function is factorized instead, by adding the vacuum
+                noise :math:`\hbar/2` to the covariance matrix
+
+        Returns:
+            tuple (means, L): means is an array containing the vector of means,
+            and L is a square array such that ``L @ L.T`` is the covariance matrix
+        """
+        device_wires = self.map_wires(wires)
+        key = (tuple(device_wires.labels), heterodyne)
+
+        if key not in self._factor_cache:
+            ind = np.concatenate([device_wires.toarray(), device_wires.toarray() + self.num_wires])
+            mu = self._state[0][ind]
+            cov = self._state[1][ind.reshape(-1, 1), ind.reshape(1, -1)]
+
+            if heterodyne:
+                cov = cov + np.identity(len(ind)) * self.hbar / 2
+
+            self._factor_cache[key] = (mu, covariance_factor(cov))
+
+        return self._factor_cache[key]
+
+    def sample_homodyne(self, wires, phis, shots=None):
+        r"""Returns joint homodyne samples of the specified modes.
+
+        All modes are sampled from the reduced Gaussian state at once, using a
+        single factorization of its covariance matrix.
+
+        **Example**
+
+        >>> dev = qml.device("default.gaussian", wires=2, shots=5)
+        >>> dev.apply("TwoModeSqueezing", Wires([0, 1]), [1.0, 0.0])
+        >>> dev.sample_homodyne(Wires([0, 1]), [0.0, 0.0])
+        array([[ 0.96344566,  0.85750463],
+               [-0.45417279, -0.55854677],
+               [-0.91061037, -0.5981312 ],
+               [ 0.46931922, -0.5339743 ],
+               [-1.96452576, -1.73184362]])
+
+        Args:
+            wires (Wires): wires of the modes to be measured
+            phis (Sequence[float]): homodyne angle of each mode
+            shots (int): number of samples to return; if not provided,
+                the number of shots of the device is used
+
+        Returns:
+            array[float]: samples in an array of dimension ``(shots, len(wires))``
+        """
+        if len(phis) != len(wires):
+            raise ValueError("A homodyne angle must be provided for each mode.")
+
+        shots = self.shots if shots is None else shots
+        mu, L = self.covariance_factor(wires)
+        return homodyne_samples(mu, L, phis, shots)
+
+    def sample_heterodyne(self, wires, shots=None):
+        r"""Returns joint heterodyne samples of the specified modes.
+
+        Heterodyne outcomes are the complex amplitudes :math:`\alpha=(x+ip)/\sqrt{2\hbar}`,
+        sampled from the Husimi Q function of the reduced Gaussian state.
+
+        Args:
+            wires (Wires): wires of the modes to be measured
+            shots (int): number of samples to return; if not provided,
+                the number of shots of the device is used
+
+        Returns:
+            array[complex]: samples in an array of dimension ``(shots, len(wires))``
+        """
+        shots = self.shots if shots is None else shots
+        mu, L = self.covariance_factor(wires, heterodyne=True)
+
+        M = len(wires)
+        xp = gaussian_samples(mu, L, shots)
+        return (xp[:, :M] + 1j * xp[:, M:]) / math.sqrt(2 * self.hbar)
+
     def reset(self):
         """Reset the device"""
         # init the state vector to |00..0>
         self._state = vacuum_state(self.num_wires, self.hbar)
+        self._factor_cache = {}
 
     def reduced_state(self, wires):
         r"""Returns the vector of means and the covariance matrix of the specified wires.
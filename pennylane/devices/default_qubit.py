@@ -18,14 +18,19 @@ It implements the necessary :class:`~pennylane._device.Device` methods as well a
 :mod:`qubit operations <pennylane.ops.qubit>`, and provides a very simple pure state
 simulation of a qubit-based quantum circuit architecture.
 """
+import hashlib
 import itertools
 import functools
+import tempfile
+from collections import OrderedDict
 from string import ascii_letters as ABC
 
 import numpy as np
 
 from pennylane import QubitDevice, DeviceError, QubitStateVector, BasisState
 from pennylane.operation import DiagonalOperation
+from pennylane.variable import Variable
+from pennylane.wires import Wires
 
 ABC_ARRAY = np.array(list(ABC))
 
@@ -34,6 +39,9 @@ tolerance = 1e-10
 SQRT2INV = 1 / np.sqrt(2)
 TPHASE = np.exp(1j * np.pi / 4)
 
+# maximum number of execution plans cached by a device
+PLAN_CACHE_SIZE = 256
+
 
 def _get_slice(index, axis, num_axes):
     """Allows slicing along an arbitrary axis of an array or tensor.
@@ -64,6 +72,244 @@ def _get_slice(index, axis, num_axes):
     return tuple(idx)
 
 
+def _get_block(axes, values, num_axes):
+    """Index selecting the amplitudes of a state with the given axes fixed to the given values.
+
+    Unlike :func:`_get_slice`, the fixed axes are kept with length one, so that indexing
+    a NumPy array returns a view that can be updated in place.
+
+    Args:
+        axes (list[int]): the axes to fix
+        values (list[int]): the value of each fixed axis
+        num_axes (int): total number of axes
+
+    Returns:
+        tuple[slice]: a tuple that can be used to slice into an array
+
+    **Example:**
+
+    >>> _get_block([0, 2], [1, 0], 3)
+    (slice(1, 2, None), slice(None, None, None), slice(0, 1, None))
+    """
+    idx = [slice(None)] * num_axes
+    for axis, value in zip(axes, values):
+        idx[axis] = slice(value, value + 1)
+    return tuple(idx)
+
+
+def _broadcast_phases(phases, axes, num_axes):
+    """Reshape the diagonal of a gate so that it broadcasts against a state.
+
+    Args:
+        phases (array[complex]): diagonal of the gate
+        axes (list[int]): the axes of the state the gate acts on
+        num_axes (int): total number of axes of the state
+
+    Returns:
+        array[complex]: the phases, with the gate axes in increasing order and
+        length one along the remaining axes
+    """
+    phases = np.transpose(np.reshape(phases, [2] * len(axes)), np.argsort(axes))
+    shape = [1] * num_axes
+    for a in axes:
+        shape[a] = 2
+    return np.reshape(phases, shape)
+
+
+# In-place gate kernels
+# ---------------------
+#
+# These kernels update a NumPy state vector of shape ``[2] * num_wires`` in place.
+# The amplitudes a gate acts on are selected through views with the indices returned
+# by :func:`_get_block`, so that controlled gates only touch the subspace in which all
+# controls are in the state :math:`|1\rangle`.
+
+
+def _swap_blocks(state, index_0, index_1):
+    """Exchange two disjoint blocks of amplitudes of a state in place.
+
+    This applies the permutation gates: ``PauliX``, ``SWAP``, and their controlled versions.
+
+    Args:
+        state (array[complex]): the state
+        index_0 (tuple[slice]): index of the first block
+        index_1 (tuple[slice]): index of the second block
+    """
+    block = state[index_0].copy()
+    state[index_0] = state[index_1]
+    state[index_1] = block
+
+
+def _apply_matrix_blocks(state, index_0, index_1, matrix):
+    """Apply a single-qubit matrix in place to two blocks of amplitudes of a state,
+    holding the amplitudes in which the target qubit is in the state :math:`|0\rangle`
+    and :math:`|1\rangle` respectively.
+
+    Args:
+        state (array[complex]): the state
+        index_0 (tuple[slice]): index of the block with the target qubit in :math:`|0\rangle`
+        index_1 (tuple[slice]): index of the block with the target qubit in :math:`|1\rangle`
+        matrix (array[complex]): the :math:`2\times 2` matrix
+    """
+    block_0 = state[index_0]
+    block_1 = state[index_1]
+    old_0 = block_0.copy()
+
+    block_0 *= matrix[0, 0]
+    block_0 += matrix[0, 1] * block_1
+    block_1 *= matrix[1, 1]
+    old_0 *= matrix[1, 0]
+    block_1 += old_0
+
+
+def _apply_phase_blocks(state, index_0, index_1, phases):
+    """Apply a single-qubit diagonal gate in place to two blocks of amplitudes of a state,
+    holding the amplitudes in which the target qubit is in the state :math:`|0\rangle`
+    and :math:`|1\rangle` respectively.
+
+    Args:
+        state (array[complex]): the state
+        index_0 (tuple[slice]): index of the block with the target qubit in :math:`|0\rangle`
+        index_1 (tuple[slice]): index of the block with the target qubit in :math:`|1\rangle`
+        phases (array[complex]): the diagonal of the gate
+    """
+    if phases[0] != 1:
+        state[index_0] *= phases[0]
+
+    state[index_1] *= phases[1]
+
+
+def _apply_phases(state, axes, phases):
+    """Apply a diagonal gate on any number of qubits to a state in place.
+
+    Args:
+        state (array[complex]): the state
+        axes (list[int]): the axes of the state the gate acts on
+        phases (array[complex]): the diagonal of the gate
+    """
+    state *= _broadcast_phases(phases, axes, state.ndim)
+
+
+# Gates applied by the in-place kernels of ``default.qubit``, with the number of
+# leading wires of each gate that are controls. ``QubitUnitary`` is only applied
+# in place if it acts on a single wire.
+INPLACE_OPS = {
+    "PauliX": (_swap_blocks, 0),
+    "CNOT": (_swap_blocks, 1),
+    "Toffoli": (_swap_blocks, 2),
+    "SWAP": (_swap_blocks, 0),
+    "CSWAP": (_swap_blocks, 1),
+    "PauliY": (_apply_matrix_blocks, 0),
+    "Hadamard": (_apply_matrix_blocks, 0),
+    "RX": (_apply_matrix_blocks, 0),
+    "RY": (_apply_matrix_blocks, 0),
+    "Rot": (_apply_matrix_blocks, 0),
+    "QubitUnitary": (_apply_matrix_blocks, 0),
+    "CY": (_apply_matrix_blocks, 1),
+    "CRX": (_apply_matrix_blocks, 1),
+    "CRY": (_apply_matrix_blocks, 1),
+    "CRot": (_apply_matrix_blocks, 1),
+    "PauliZ": (_apply_phase_blocks, 0),
+    "S": (_apply_phase_blocks, 0),
+    "T": (_apply_phase_blocks, 0),
+    "PhaseShift": (_apply_phase_blocks, 0),
+    "RZ": (_apply_phase_blocks, 0),
+    "CZ": (_apply_phase_blocks, 1),
+    "CRZ": (_apply_phase_blocks, 1),
+    "MultiRZ": (_apply_phases, 0),
+    "DiagonalQubitUnitary": (_apply_phases, 0),
+}
+
+
+def _chunk_groups(device_wires, num_global):
+    """Groups of chunks of a state vector that are coupled by a gate.
+
+    The state vector is split into ``2**num_global`` chunks of contiguous amplitudes,
+    indexed by the leading ``num_global`` wires. A gate acting on ``k`` of the leading
+    wires couples ``2**k`` chunks, whose indices differ only in the bits of these wires.
+
+    Args:
+        device_wires (list[int]): the wires the gate acts on
+        num_global (int): number of leading wires indexing the chunks
+
+    Returns:
+        tuple[array[int], array[int]]: the index of the first chunk of each group, and the
+        offsets of the coupled chunks relative to it, ordered such that the leading
+        wires acted on by the gate are the most significant
+    """
+    global_wires = sorted(w for w in device_wires if w < num_global)
+    global_bits = 2 ** (num_global - 1 - np.array(global_wires, dtype=int))
+    combinations = np.array(list(itertools.product([0, 1], repeat=len(global_wires))))
+    offsets = np.dot(combinations, global_bits).astype(int).reshape(-1)
+
+    indices = np.arange(2 ** num_global)
+    starts = indices[(indices & int(np.sum(global_bits))) == 0]
+    return starts, offsets
+
+
+def _apply_to_chunks(state, matrix, device_wires, chunk_wires, diagonal=False, starts=None):
+    """Apply a gate in place to a flat state vector that is processed in chunks.
+
+    Each chunk consists of ``2**chunk_wires`` contiguous amplitudes, spanning the trailing
+    ``chunk_wires`` wires. Gates acting only on these wires are applied to every chunk
+    separately, while the ``2**k`` chunks coupled by ``k`` leading wires of the gate are
+    loaded and updated together.
+
+    Args:
+        state (array[complex]): flat state vector, e.g., a ``numpy.memmap``
+        matrix (array[complex]): matrix of the gate, or its diagonal if ``diagonal=True``
+        device_wires (list[int]): the wires the gate acts on
+        chunk_wires (int): number of trailing wires spanned by a chunk
+        diagonal (bool): whether ``matrix`` is the diagonal of a diagonal gate
+        starts (array[int]): the first chunk of each group of coupled chunks to update,
+            as returned by :func:`_chunk_groups`; by default all chunks are updated
+    """
+    num_wires = int(np.log2(len(state)))
+    num_global = num_wires - chunk_wires
+    size = 2 ** chunk_wires
+
+    all_starts, offsets = _chunk_groups(device_wires, num_global)
+    starts = all_starts if starts is None else starts
+
+    global_wires = sorted(w for w in device_wires if w < num_global)
+    num_block_wires = len(global_wires) + chunk_wires
+
+    # axes of the operation's wires in a block of coupled chunks
+    axes = [
+        global_wires.index(w) if w < num_global else len(global_wires) + w - num_global
+        for w in device_wires
+    ]
+
+    if diagonal:
+        phases = _broadcast_phases(matrix, axes, num_block_wires)
+    else:
+        matrix = np.reshape(matrix, [2] * len(axes) * 2)
+
+    for j in starts:
+        chunks = [slice(i * size, (i + 1) * size) for i in j + offsets]
+
+        if len(chunks) == 1:
+            # a single chunk can be reshaped without copying
+            block = np.reshape(state[chunks[0]], [2] * num_block_wires)
+        else:
+            block = np.reshape(np.stack([state[sl] for sl in chunks]), [2] * num_block_wires)
+
+        if diagonal:
+            block *= phases
+
+            if len(chunks) == 1:
+                # the chunk was updated in place
+                continue
+        else:
+            block = np.tensordot(matrix, block, axes=(list(range(len(axes), 2 * len(axes))), axes))
+            block = np.moveaxis(block, list(range(len(axes))), axes)
+
+        block = np.reshape(block, (len(chunks), size))
+
+        for sl, new in zip(chunks, block):
+            state[sl] = new
+
+
 # pylint: disable=unused-argument
 class DefaultQubit(QubitDevice):
     """Default qubit device for PennyLane.
@@ -79,6 +325,29 @@ class DefaultQubit(QubitDevice):
             of samples returned by ``sample``.
         analytic (bool): indicates if the device should calculate expectations
             and variances analytically
+        dtype (type): complex data type of the state vector and gate matrices, either
+            ``np.complex128`` (default) or ``np.complex64``. Single precision halves the
+            memory and memory bandwidth required by the simulation; probabilities,
+            expectation values and samples are then computed in ``np.float32``.
+        storage (str): Where the state vector is stored. If ``"memory"`` (default), the state
+            is held in RAM. If ``"memmap"``, the state is kept in a ``numpy.memmap`` backed by
+            a temporary file, and gates, probabilities and samples are computed by streaming
+            over it in chunks. This allows simulating states that do not fit into memory, at
+            the cost of disk bandwidth.
+        memmap_dir (str): directory in which the state vector files are created when
+            ``storage="memmap"``. Defaults to the system's temporary directory.
+        chunk_wires (int): With ``storage="memmap"``, the state vector is processed in chunks
+            of ``2**chunk_wires`` contiguous amplitudes, which span the last ``chunk_wires``
+            wires of the device. Gates acting only on these wires are applied to each chunk
+            independently; gates acting on any of the leading wires load the ``2**k``
+            chunks coupled by their ``k`` leading wires at once.
+        prefix_cache_size (int): Memory budget, in bytes, for caching intermediate states
+            across executions. If positive, the state before each operation with variable
+            parameters is stored, keyed by the preceding operations and their parameters.
+            Later executions, for instance with shifted parameters when computing gradients,
+            resume from the deepest stored state whose prefix of operations is unchanged.
+            The least recently used states are evicted once the budget is exceeded. Only
+            used with ``storage="memory"``. Defaults to 0, which disables the cache.
     """
 
     name = "Default qubit PennyLane plugin"
@@ -118,15 +387,63 @@ class DefaultQubit(QubitDevice):
 
     observables = {"PauliX", "PauliY", "PauliZ", "Hadamard", "Hermitian", "Identity"}
 
-    def __init__(self, wires, *, shots=1000, analytic=True):
+    def __init__(
+        self,
+        wires,
+        *,
+        shots=1000,
+        analytic=True,
+        dtype=np.complex128,
+        storage="memory",
+        memmap_dir=None,
+        chunk_wires=20,
+        prefix_cache_size=0
+    ):
         # call QubitDevice init
         super().__init__(wires, shots, analytic)
 
+        dtype = np.dtype(dtype)
+
+        if dtype not in (np.complex64, np.complex128):
+            raise DeviceError(
+                "Data type {} is not supported; must be complex64 or complex128.".format(dtype)
+            )
+
+        # the real data type of matching precision is used for probabilities
+        self.C_DTYPE = dtype.type
+        self.R_DTYPE = np.finfo(dtype).dtype.type
+
+        if storage not in ("memory", "memmap"):
+            raise DeviceError(
+                "Storage {} is not supported; must be 'memory' or 'memmap'.".format(storage)
+            )
+
+        self._storage = storage
+        self._memmap_dir = memmap_dir
+        self._chunk_wires = min(chunk_wires, self.num_wires)
+
+        # execution plans, keyed by circuit hash, in order of last use
+        self._plans = OrderedDict()
+
+        # intermediate states, keyed by the operations preceding them, in order of last use
+        self._prefix_cache_size = prefix_cache_size
+        self._prefix_cache = OrderedDict()
+        self._prefix_cache_bytes = 0
+
         # Create the initial state. Internally, we store the
         # state as an array of dimension [2]*wires.
         self._state = self._create_basis_state(0)
         self._pre_rotated_state = self._state
 
+        # the state that is only referenced by the device, and can be updated in place
+        self._owned_state = self._state
+
+        # the state set by the last reset, if it has not been replaced or applied to since
+        self._initial_state = self._state
+
+        # gates applied in place when the state is a NumPy array
+        self._inplace_ops = INPLACE_OPS
+
         self._apply_ops = {
             "PauliX": self._apply_x,
             "PauliY": self._apply_y,
@@ -142,6 +459,30 @@ class DefaultQubit(QubitDevice):
     def apply(self, operations, rotations=None, **kwargs):
         rotations = rotations or []
 
+        if self._storage == "memory":
+            plan = self._get_plan(operations, rotations)
+            num_operations = len(operations)
+
+            # apply the circuit operations; intermediate states are only cached for
+            # circuits applied to the initial state, and not for instance by the
+            # reversible differentiation method, which sets the state itself
+            if self._prefix_cache_size and self._state is self._initial_state:
+                self._apply_cached(plan[:num_operations], operations)
+            else:
+                for (_, kernel, args), operation in zip(plan[:num_operations], operations):
+                    kernel(operation, *args)
+
+            # store the pre-rotated state, which must no longer be updated in place
+            self._pre_rotated_state = self._state
+            self._owned_state = None
+            self._initial_state = None
+
+            # apply the circuit rotations
+            for (_, kernel, args), operation in zip(plan[num_operations:], rotations):
+                kernel(operation, *args)
+
+            return
+
         # apply the circuit operations
         for i, operation in enumerate(operations):
 
@@ -156,10 +497,300 @@ class DefaultQubit(QubitDevice):
         # store the pre-rotated state
         self._pre_rotated_state = self._state
 
+        # gates on memory-mapped states act in place, so rotate a copy
+        if rotations:
+            self._state = self._copy_memmap(self._state)
+
         # apply the circuit rotations
         for operation in rotations:
             self._apply_operation(operation)
 
+    # Execution plans
+    # ---------------
+    #
+    # A plan is a list of ``(signature, kernel, args)`` steps, one per operation and rotation
+    # of a circuit, where the signature holds the name and wires of the operation. It contains
+    # everything that depends only on the structure of the circuit: the dispatch to a kernel,
+    # the axes or blocks of the state the operation acts on, and the einsum subscripts or
+    # tensordot permutations. Each step is then executed as ``kernel(operation, *args)``,
+    # where only the matrix of the operation is computed.
+
+    def _get_plan(self, operations, rotations):
+        """Return the execution plan of a circuit.
+
+        Plans are cached by the signatures of their steps, i.e., the names and wires of the
+        operations and rotations, so that a circuit structure is compiled only once, for
+        instance over the iterations of an optimization. Unlike
+        :attr:`~.QubitDevice.circuit_hash`, the signatures also identify the operations
+        applied by calling :meth:`apply` directly, as the reversible differentiation method
+        does, and circuits that do not provide a hash, such as quantum tapes. At most
+        ``PLAN_CACHE_SIZE`` plans are kept, evicting the least recently used ones.
+
+        Args:
+            operations (list[~.Operation]): operations to apply on the device
+            rotations (list[~.Operation]): operations that rotate into the basis of the
+                observables
+
+        Returns:
+            list[tuple[tuple, callable, tuple]]: the execution plan
+        """
+        key = tuple((op.name, op.wires.labels) for op in itertools.chain(operations, rotations))
+        plan = self._plans.get(key, None)
+
+        if plan is None:
+            plan = self._compile_plan(operations, rotations)
+            self._plans[key] = plan
+
+            if len(self._plans) > PLAN_CACHE_SIZE:
+                self._plans.popitem(last=False)
+
+        else:
+            self._plans.move_to_end(key)
+
+        return plan
+
+    def _compile_plan(self, operations, rotations):
+        """Compile a circuit into an execution plan.
+
+        Args:
+            operations (list[~.Operation]): operations to apply on the device
+            rotations (list[~.Operation]): operations that rotate into the basis of the
+                observables
+
+        Returns:
+            list[tuple[tuple, callable, tuple]]: the execution plan
+        """
+        for i, operation in enumerate(operations):
+
+            if i > 0 and isinstance(operation, (QubitStateVector, BasisState)):
+                raise DeviceError(
+                    "Operation {} cannot be used after other Operations have already been applied "
+                    "on a {} device.".format(operation.name, self.short_name)
+                )
+
+        plan = []
+
+        for operation in itertools.chain(operations, rotations):
+
+            if isinstance(operation, (QubitStateVector, BasisState)):
+                signature = (operation.name, operation.wires.labels)
+                plan.append((signature, self._apply_operation, ()))
+                continue
+
+            device_wires = self.map_wires(operation.wires)
+            num_wires = len(device_wires)
+            kernel, num_controls = self._inplace_ops.get(operation.base_name, (None, 0))
+
+            if operation.base_name == "QubitUnitary" and num_wires > 1:
+                kernel = None
+
+            if kernel is _apply_phases:
+                step = (self._run_inplace, (kernel, Ellipsis, device_wires.tolist()))
+            elif kernel is not None:
+                step = self._compile_inplace(kernel, device_wires.tolist(), num_controls)
+            elif operation.name in self._apply_ops:
+                step = (self._run_special, (self._apply_ops[operation.name], device_wires.tolist()))
+            elif isinstance(operation, DiagonalOperation):
+                indices = self._diagonal_einsum_indices(device_wires)
+                step = (self._run_diagonal_unitary, ([2] * num_wires, indices))
+            elif num_wires <= 2:
+                # Einsum is faster for small gates
+                indices = self._einsum_indices(device_wires)
+                step = (self._run_unitary_einsum, ([2] * num_wires * 2, indices))
+            else:
+                axes, inv_perm = self._tensordot_axes(device_wires)
+                step = (self._run_unitary, ([2] * num_wires * 2, axes, inv_perm))
+
+            plan.append(((operation.name, operation.wires.labels),) + step)
+
+        return plan
+
+    # Prefix-state cache
+    # ------------------
+    #
+    # The state before the operation ``k`` of a circuit only depends on the first ``k``
+    # operations. With ``prefix_cache_size > 0``, the states before the operations with
+    # variable parameters, and after the last operation, are stored under a digest of
+    # the names, wires and parameter values of all the preceding operations. Unlike the circuit
+    # hash, these keys do not depend on the observables, nor on the indices of the
+    # variables, which the parameter-shift rule replaces to shift a parameter.
+    # Checkpoints are only recorded when the circuit is applied from the start: executions
+    # that resume from a checkpoint typically differ in a single parameter, as when
+    # computing gradients, and their later states are unlikely to be reused.
+
+    @staticmethod
+    def _prefix_keys(operations, positions):
+        """Return the keys of intermediate states of a circuit.
+
+        The digest is updated with each operation in turn, so that the keys of all the
+        positions are computed in a single pass over the operations.
+
+        Args:
+            operations (list[~.Operation]): operations to apply on the device
+            positions (Iterable[int]): the number of operations preceding each state
+
+        Returns:
+            dict[int, bytes]: the key of the state at each position
+        """
+        positions = set(positions)
+        digest = hashlib.blake2b(digest_size=16)
+        keys = {}
+
+        for k, operation in enumerate(operations):
+            if k in positions:
+                keys[k] = digest.digest()
+
+            # the data types and shapes delimit the bytes of the parameters
+            params = [np.asarray(p) for p in operation.parameters]
+            shapes = [(p.dtype.str, p.shape) for p in params]
+            digest.update(repr((operation.name, operation.wires.labels, shapes)).encode())
+
+            for p in params:
+                digest.update(p.tobytes())
+
+        if len(operations) in positions:
+            keys[len(operations)] = digest.digest()
+
+        return keys
+
+    def _apply_cached(self, steps, operations):
+        """Apply the operations of a circuit, resuming from the deepest cached intermediate
+        state, or caching the intermediate states if the circuit is applied from the start.
+
+        Args:
+            steps (list[tuple[tuple, callable, tuple]]): the execution plan of the operations
+            operations (list[~.Operation]): operations to apply on the device
+        """
+        num_operations = len(operations)
+
+        # the states before the operations with variable parameters, and after the last one
+        checkpoints = [num_operations] + [
+            k
+            for k in range(num_operations - 1, 0, -1)
+            if any(isinstance(p, Variable) for p in operations[k].data)
+        ]
+        keys = self._prefix_keys(operations, checkpoints)
+        start = 0
+
+        for k in checkpoints:
+            state = self._prefix_cache.get(keys[k], None)
+
+            if state is not None:
+                self._prefix_cache.move_to_end(keys[k])
+                self._state = state
+                start = k
+                break
+
+        if start > 0:
+            for (_, kernel, args), operation in zip(steps[start:], operations[start:]):
+                kernel(operation, *args)
+
+            return
+
+        checkpoints = set(checkpoints)
+
+        for k, ((_, kernel, args), operation) in enumerate(zip(steps, operations)):
+
+            if k in checkpoints:
+                self._cache_prefix(keys[k])
+
+            kernel(operation, *args)
+
+        self._cache_prefix(keys[num_operations])
+
+    def _cache_prefix(self, key):
+        """Store a copy of the current state in the prefix cache, evicting the least recently
+        used states if the memory budget is exceeded.
+
+        The state is copied since it may be referenced elsewhere, for instance as the input
+        of :class:`~.QubitStateVector`.
+
+        Args:
+            key (bytes): key of the state
+        """
+        if self._state.nbytes > self._prefix_cache_size:
+            return
+
+        self._prefix_cache[key] = np.array(self._state)
+        self._prefix_cache_bytes += self._state.nbytes
+
+        while self._prefix_cache_bytes > self._prefix_cache_size:
+            _, state = self._prefix_cache.popitem(last=False)
+            self._prefix_cache_bytes -= state.nbytes
+
+    def _compile_inplace(self, kernel, axes, num_controls):
+        """Compile a step applying a gate with one of the in-place block kernels.
+
+        Args:
+            kernel (callable): one of ``_swap_blocks``, ``_apply_matrix_blocks``
+                and ``_apply_phase_blocks``
+            axes (list[int]): the axes of the state the gate acts on
+            num_controls (int): the number of leading axes that are controls
+
+        Returns:
+            tuple[callable, tuple]: the plan kernel and its arguments
+        """
+        controls = [1] * num_controls
+
+        if len(axes) - num_controls == 2:
+            # (controlled) SWAP exchanges the |01> and |10> blocks of the targets
+            values = [controls + [0, 1], controls + [1, 0]]
+        else:
+            values = [controls + [0], controls + [1]]
+
+        index_0, index_1 = [_get_block(axes, v, self.num_wires) for v in values]
+
+        if kernel is _swap_blocks:
+            return self._run_permutation, (index_0, index_1)
+
+        # the block of the matrix, or of its diagonal, acting on the target when all
+        # controls are in the |1> state
+        block = np.s_[-2:, -2:] if kernel is _apply_matrix_blocks else np.s_[-2:]
+        return self._run_inplace, (kernel, block, index_0, index_1)
+
+    def _writable_state(self):
+        """Return the state, copying it first if it is not owned by the device.
+
+        The state may be referenced elsewhere, for instance as the pre-rotated state
+        or as the input of :class:`~.QubitStateVector`; it is then copied once, and cast
+        to the data type of the device, before being updated in place.
+
+        Returns:
+            array[complex]: the state, which can be updated in place
+        """
+        if self._state is not self._owned_state:
+            self._state = self._owned_state = np.array(self._state, dtype=self.C_DTYPE)
+
+        return self._state
+
+    def _run_permutation(self, operation, index_0, index_1):
+        """Plan kernel for the permutation gates in ``INPLACE_OPS``."""
+        _swap_blocks(self._writable_state(), index_0, index_1)
+
+    def _run_inplace(self, operation, kernel, block, *args):
+        """Plan kernel for the other gates in ``INPLACE_OPS``."""
+        kernel(self._writable_state(), *args, self._get_unitary_matrix(operation)[block])
+
+    def _run_special(self, operation, method, axes):
+        """Plan kernel for the operations in ``_apply_ops``."""
+        self._state = method(self._state, axes, inverse=operation.inverse)
+
+    def _run_diagonal_unitary(self, operation, shape, indices):
+        """Plan kernel for diagonal operations; see :meth:`_apply_diagonal_unitary`."""
+        phases = self._reshape(self._get_unitary_matrix(operation), shape)
+        self._state = self._einsum(indices, self._cast(phases, dtype=self.C_DTYPE), self._state)
+
+    def _run_unitary_einsum(self, operation, shape, indices):
+        """Plan kernel for small operations; see :meth:`_apply_unitary_einsum`."""
+        mat = self._reshape(self._get_unitary_matrix(operation), shape)
+        self._state = self._einsum(indices, self._cast(mat, dtype=self.C_DTYPE), self._state)
+
+    def _run_unitary(self, operation, shape, axes, inv_perm):
+        """Plan kernel for large operations; see :meth:`_apply_unitary`."""
+        mat = self._reshape(self._get_unitary_matrix(operation), shape)
+        tdot = self._tensordot(self._cast(mat, dtype=self.C_DTYPE), self._state, axes=axes)
+        self._state = self._transpose(tdot, inv_perm)
+
     def _apply_operation(self, operation):
         """Applies operations to the internal device state.
 
@@ -176,6 +807,10 @@ class DefaultQubit(QubitDevice):
             self._apply_basis_state(operation.parameters[0], wires)
             return
 
+        if self._storage == "memmap":
+            self._apply_operation_memmap(operation)
+            return
+
         if operation.name in self._apply_ops:
             axes = self.wires.indices(wires)
             self._state = self._apply_ops[operation.name](
@@ -342,6 +977,7 @@ class DefaultQubit(QubitDevice):
         sl_1 = _get_slice(1, axes[0], num_wires)
 
         phase = self._conj(parameters) if inverse else parameters
+        phase = self._cast(phase, dtype=self.C_DTYPE)
         return self._stack([state[sl_0], phase * state[sl_1]], axis=axes[0])
 
     def _get_unitary_matrix(self, unitary):  # pylint: disable=no-self-use
@@ -380,8 +1016,15 @@ class DefaultQubit(QubitDevice):
 
         Returns:
             array[complex]: complex array of shape ``[2]*self.num_wires``
-            representing the statevector of the basis state
+            representing the statevector of the basis state, or a flat memory-mapped
+            array of length ``2**self.num_wires`` if ``storage="memmap"``
         """
+        if self._storage == "memmap":
+            # a newly created memory-mapped file is zero-initialized
+            state = self._create_memmap()
+            state[index] = 1
+            return state
+
         state = np.zeros(2 ** self.num_wires, dtype=np.complex128)
         state[index] = 1
         state = self._asarray(state, dtype=self.C_DTYPE)
@@ -389,6 +1032,9 @@ class DefaultQubit(QubitDevice):
 
     @property
     def state(self):
+        if self._storage == "memmap":
+            return self._pre_rotated_state
+
         return self._flatten(self._pre_rotated_state)
 
     def _apply_state_vector(self, state, device_wires):
@@ -403,15 +1049,22 @@ class DefaultQubit(QubitDevice):
         # translate to wire labels used by device
         device_wires = self.map_wires(device_wires)
 
+        # the norm is checked before casting, which may reduce the precision
+        norm = np.linalg.norm(state, ord=2)
+
         state = self._asarray(state, dtype=self.C_DTYPE)
         n_state_vector = state.shape[0]
 
         if state.ndim != 1 or n_state_vector != 2 ** len(device_wires):
             raise ValueError("State vector must be of length 2**wires.")
 
-        if not np.allclose(np.linalg.norm(state, ord=2), 1.0, atol=tolerance):
+        if not np.allclose(norm, 1.0, atol=tolerance):
             raise ValueError("Sum of amplitudes-squared does not equal one.")
 
+        if self._storage == "memmap":
+            self._apply_state_vector_memmap(state, device_wires)
+            return
+
         if (
             len(device_wires) == self.num_wires
             and sorted(device_wires.labels) == device_wires.labels
@@ -471,8 +1124,22 @@ class DefaultQubit(QubitDevice):
         device_wires = self.map_wires(wires)
 
         mat = self._cast(self._reshape(mat, [2] * len(device_wires) * 2), dtype=self.C_DTYPE)
-        axes = (np.arange(len(device_wires), 2 * len(device_wires)), device_wires.labels)
+        axes, inv_perm = self._tensordot_axes(device_wires)
         tdot = self._tensordot(mat, self._state, axes=axes)
+        self._state = self._transpose(tdot, inv_perm)
+
+    def _tensordot_axes(self, device_wires):
+        """Return the contraction axes and the output permutation for applying
+        a matrix to the state with ``tensordot``.
+
+        Args:
+            device_wires (Wires): target device wires
+
+        Returns:
+            tuple[tuple[array[int], tuple[int]], array[int]]: the axes of the matrix and of
+            the state to contract, and the permutation to apply to the result
+        """
+        axes = (np.arange(len(device_wires), 2 * len(device_wires)), device_wires.labels)
 
         # tensordot causes the axes given in `wires` to end up in the first positions
         # of the resulting tensor. This corresponds to a (partial) transpose of
@@ -481,7 +1148,7 @@ class DefaultQubit(QubitDevice):
         unused_idxs = [idx for idx in range(self.num_wires) if idx not in device_wires.labels]
         perm = list(device_wires.labels) + unused_idxs
         inv_perm = np.argsort(perm)  # argsort gives inverse permutation
-        self._state = self._transpose(tdot, inv_perm)
+        return axes, inv_perm
 
     def _apply_unitary_einsum(self, mat, wires):
         r"""Apply multiplication of a matrix to subsystems of the quantum state.
@@ -498,6 +1165,18 @@ class DefaultQubit(QubitDevice):
 
         mat = self._cast(self._reshape(mat, [2] * len(device_wires) * 2), dtype=self.C_DTYPE)
 
+        einsum_indices = self._einsum_indices(device_wires)
+        self._state = self._einsum(einsum_indices, mat, self._state)
+
+    def _einsum_indices(self, device_wires):
+        """Return the einsum subscripts for applying a matrix to the state.
+
+        Args:
+            device_wires (Wires): target device wires
+
+        Returns:
+            str: the einsum subscripts
+        """
         # Tensor indices of the quantum state
         state_indices = ABC[: self.num_wires]
 
@@ -516,17 +1195,13 @@ class DefaultQubit(QubitDevice):
         )
 
         # We now put together the indices in the notation numpy's einsum requires
-        einsum_indices = (
-            "{new_indices}{affected_indices},{state_indices}->{new_state_indices}".format(
-                affected_indices=affected_indices,
-                state_indices=state_indices,
-                new_indices=new_indices,
-                new_state_indices=new_state_indices,
-            )
+        return "{new_indices}{affected_indices},{state_indices}->{new_state_indices}".format(
+            affected_indices=affected_indices,
+            state_indices=state_indices,
+            new_indices=new_indices,
+            new_state_indices=new_state_indices,
         )
 
-        self._state = self._einsum(einsum_indices, mat, self._state)
-
     def _apply_diagonal_unitary(self, phases, wires):
         r"""Apply multiplication of a phase vector to subsystems of the quantum state.
 
@@ -542,15 +1217,25 @@ class DefaultQubit(QubitDevice):
         # reshape vectors
         phases = self._cast(self._reshape(phases, [2] * len(device_wires)), dtype=self.C_DTYPE)
 
+        einsum_indices = self._diagonal_einsum_indices(device_wires)
+        self._state = self._einsum(einsum_indices, phases, self._state)
+
+    def _diagonal_einsum_indices(self, device_wires):
+        """Return the einsum subscripts for applying a phase vector to the state.
+
+        Args:
+            device_wires (Wires): target device wires
+
+        Returns:
+            str: the einsum subscripts
+        """
         state_indices = ABC[: self.num_wires]
         affected_indices = "".join(ABC_ARRAY[device_wires.tolist()].tolist())
 
-        einsum_indices = "{affected_indices},{state_indices}->{state_indices}".format(
+        return "{affected_indices},{state_indices}->{state_indices}".format(
             affected_indices=affected_indices, state_indices=state_indices
         )
 
-        self._state = self._einsum(einsum_indices, phases, self._state)
-
     def reset(self):
         """Reset the device"""
         super().reset()
@@ -558,11 +1243,188 @@ class DefaultQubit(QubitDevice):
         # init the state vector to |00..0>
         self._state = self._create_basis_state(0)
         self._pre_rotated_state = self._state
+        self._owned_state = self._state
+        self._initial_state = self._state
 
     def analytic_probability(self, wires=None):
 
         if self._state is None:
             return None
 
+        if self._storage == "memmap":
+            return self._analytic_probability_memmap(wires)
+
         prob = self.marginal_prob(self._abs(self._flatten(self._state)) ** 2, wires)
         return prob
+
+    def generate_samples(self):
+        if self._storage == "memmap":
+            return self._generate_samples_memmap()
+
+        return super().generate_samples()
+
+    # Out-of-core state vector
+    # ------------------------
+    #
+    # With ``storage="memmap"``, the state is a flat memory-mapped array of length
+    # ``2**num_wires``. It is split into ``2**num_global`` chunks of ``2**chunk_wires``
+    # contiguous amplitudes: the leading ``num_global`` wires index the chunk, while the
+    # trailing ``chunk_wires`` wires index the amplitudes within a chunk.
+
+    def _create_memmap(self, shape=None, dtype=None):
+        """Create a zero-initialized memory-mapped array, by default for the state vector.
+
+        The array is backed by an anonymous temporary file, which is removed by the
+        operating system once the array is no longer referenced.
+
+        Args:
+            shape (tuple[int]): shape of the array, by default ``(2**self.num_wires,)``
+            dtype (type): data type of the array, by default ``self.C_DTYPE``
+
+        Returns:
+            numpy.memmap: the array
+        """
+        shape = shape or (2 ** self.num_wires,)
+        dtype = dtype or self.C_DTYPE
+
+        with tempfile.TemporaryFile(dir=self._memmap_dir) as f:
+            return np.memmap(f, dtype=dtype, mode="w+", shape=shape)
+
+    def _chunks(self):
+        """Iterate over the chunks of the memory-mapped state vector.
+
+        Yields:
+            tuple[int, slice]: the chunk index and the slice of the state it covers
+        """
+        size = 2 ** self._chunk_wires
+
+        for j in range(2 ** (self.num_wires - self._chunk_wires)):
+            yield j, slice(j * size, (j + 1) * size)
+
+    def _copy_memmap(self, state):
+        """Copy a memory-mapped state vector chunk by chunk.
+
+        Args:
+            state (numpy.memmap): the state to copy
+
+        Returns:
+            numpy.memmap: the copy
+        """
+        new_state = self._create_memmap()
+
+        for _, sl in self._chunks():
+            new_state[sl] = state[sl]
+
+        return new_state
+
+    def _apply_state_vector_memmap(self, state, device_wires):
+        """Initialize the memory-mapped state vector in a specified state.
+
+        Args:
+            state (array[complex]): normalized input state of length
+                ``2**len(device_wires)``
+            device_wires (Wires): device wires that get initialized in the state
+        """
+        self._state = self._create_memmap()
+
+        # the input state populates the amplitudes whose bits vanish on all other wires
+        positions = self.num_wires - 1 - device_wires.toarray()
+        other_bits = (2 ** self.num_wires - 1) ^ int(np.sum(2 ** positions))
+        offset = np.arange(2 ** self._chunk_wires)
+
+        for j, sl in self._chunks():
+            indices = offset + sl.start
+            mask = (indices & other_bits) == 0
+
+            if not np.any(mask):
+                continue
+
+            # position of each amplitude within the input state
+            bits = (indices[mask, None] >> positions) & 1
+            sub_indices = bits @ (2 ** np.arange(len(device_wires) - 1, -1, -1))
+
+            chunk = np.zeros(len(indices), dtype=self.C_DTYPE)
+            chunk[mask] = state[sub_indices]
+            self._state[sl] = chunk
+
+    def _apply_operation_memmap(self, operation):
+        """Apply an operation to the memory-mapped state vector in place.
+
+        Args:
+            operation (~.Operation): operation to apply on the device
+        """
+        _apply_to_chunks(
+            self._state,
+            self._get_unitary_matrix(operation),
+            self.map_wires(operation.wires).tolist(),
+            self._chunk_wires,
+            diagonal=isinstance(operation, DiagonalOperation),
+        )
+
+    def _analytic_probability_memmap(self, wires=None):
+        """Marginal probabilities of the memory-mapped state vector, accumulated chunk by chunk.
+
+        The probabilities of more wires than span a chunk are memory-mapped as well.
+
+        Args:
+            wires (Iterable[Number, str], Number, str, Wires): wires to return
+                marginal probabilities for. Wires not provided are traced out of the system.
+
+        Returns:
+            array[float]: list of the probabilities
+        """
+        wires = wires or self.wires
+        wires = Wires(wires)
+        device_wires = self.map_wires(wires).tolist()
+        num_global = self.num_wires - self._chunk_wires
+
+        # axes of the requested trailing wires within a chunk, in the requested order
+        local_axes = [w - num_global for w in device_wires if w >= num_global]
+        traced_axes = tuple(a for a in range(self._chunk_wires) if a not in local_axes)
+        perm = np.argsort(np.argsort(local_axes))
+
+        if len(device_wires) > self._chunk_wires:
+            prob = self._create_memmap(shape=(2,) * len(device_wires), dtype=self.R_DTYPE)
+        else:
+            prob = np.zeros([2] * len(device_wires), dtype=np.float64)
+
+        for j, sl in self._chunks():
+            chunk_prob = np.reshape(np.abs(self._state[sl]) ** 2, [2] * self._chunk_wires)
+            chunk_prob = np.transpose(np.sum(chunk_prob, axis=traced_axes), perm)
+
+            # the leading wires are fixed by the chunk index
+            index = tuple(
+                (j >> (num_global - 1 - w)) & 1 if w < num_global else slice(None)
+                for w in device_wires
+            )
+            prob[index] += chunk_prob
+
+        if isinstance(prob, np.memmap):
+            return prob.reshape(-1)
+
+        return self._asarray(prob.ravel(), dtype=self.R_DTYPE)
+
+    def _generate_samples_memmap(self):
+        """Sample computational basis states from the memory-mapped state vector.
+
+        The number of samples falling into each chunk is drawn first, after which each
+        chunk containing samples is loaded once to sample the states within it.
+
+        Returns:
+             array[int]: array of samples in the shape ``(dev.shots, dev.num_wires)``
+        """
+        chunk_probs = np.array([np.sum(np.abs(self._state[sl]) ** 2) for _, sl in self._chunks()])
+        counts = np.random.multinomial(self.shots, chunk_probs / np.sum(chunk_probs))
+
+        samples = []
+
+        for j, sl in self._chunks():
+            if counts[j] == 0:
+                continue
+
+            prob = np.abs(self._state[sl]) ** 2
+            samples.append(sl.start + np.random.choice(len(prob), counts[j], p=prob / np.sum(prob)))
+
+        samples = np.concatenate(samples)
+        np.random.shuffle(samples)
+        return QubitDevice.states_to_binary(samples, self.num_wires)
@@ -69,6 +69,8 @@ class DefaultQubitAutograd(DefaultQubit):
 
     Args:
         wires (int): the number of wires to initialize the device with
+        dtype (type): complex data type of the state vector, either ``np.complex128``
+            (default) or ``np.complex64``
     """
 
     name = "Default qubit (Autograd) PennyLane plugin"
@@ -103,8 +105,8 @@ class DefaultQubitAutograd(DefaultQubit):
     _roll = staticmethod(np.roll)
     _stack = staticmethod(np.stack)
 
-    def __init__(self, wires, *, shots=1000, analytic=True):
-        super().__init__(wires, shots=shots, analytic=analytic)
+    def __init__(self, wires, *, shots=1000, analytic=True, dtype=np.complex128):
+        super().__init__(wires, shots=shots, analytic=analytic, dtype=dtype)
 
         # prevent using special apply methods for these gates due to slowdown in Autograd
         # implementation
@@ -112,6 +114,9 @@ class DefaultQubitAutograd(DefaultQubit):
         del self._apply_ops["Hadamard"]
         del self._apply_ops["CZ"]
 
+        # the in-place kernels cannot be differentiated through
+        self._inplace_ops = {}
+
     @classmethod
     def capabilities(cls):
         capabilities = super().capabilities().copy()
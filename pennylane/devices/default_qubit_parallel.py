@@ -0,0 +1,274 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module contains a multi-process implementation of the :class:`~.DefaultQubit`
+reference plugin, in which the state vector is held in shared memory.
+"""
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pennylane import DeviceError, QubitStateVector, BasisState
+from pennylane.operation import DiagonalOperation
+
+try:
+    from multiprocessing import shared_memory
+
+except ImportError as e:
+    raise ImportError("default.qubit.parallel device requires Python>=3.8") from e
+
+from . import DefaultQubit
+from .default_qubit import _apply_to_chunks, _chunk_groups
+
+
+# shared memory blocks attached by a worker process, keyed by name
+_attached = {}
+
+
+def _attach(name, size):
+    """Attach to a shared memory block holding a flat complex state vector.
+
+    Args:
+        name (str): name of the shared memory block
+        size (int): number of amplitudes of the state vector
+
+    Returns:
+        array[complex]: the state vector, backed by the shared memory block
+    """
+    if name not in _attached:
+        shm = shared_memory.SharedMemory(name=name)
+        _attached[name] = (shm, np.ndarray((size,), dtype=np.complex128, buffer=shm.buf))
+
+    return _attached[name][1]
+
+
+def _apply_in_worker(name, size, ops, chunk_wires, starts):
+    """Apply a sequence of gates to groups of chunks of a shared state vector.
+
+    This function is run by the worker processes.
+
+    Args:
+        name (str): name of the shared memory block holding the state
+        size (int): number of amplitudes of the state vector
+        ops (list[tuple[array, list[int], bool]]): the matrix, wires and diagonality
+            of each gate
+        chunk_wires (int): number of trailing wires spanned by a chunk
+        starts (array[int]): the first chunk of each group of coupled chunks to update
+    """
+    state = _attach(name, size)
+
+    for matrix, wires, diagonal in ops:
+        _apply_to_chunks(state, matrix, wires, chunk_wires, diagonal=diagonal, starts=starts)
+
+
+def _release(blocks, executors):
+    """Shut down the worker processes and free the shared memory of a device."""
+    for executor in executors:
+        executor.shutdown()
+
+    for shm in blocks:
+        shm.unlink()
+        shm.close()
+
+
+class DefaultQubitParallel(DefaultQubit):
+    """Multi-process simulator plugin based on ``"default.qubit"``.
+
+    **Short name:** ``default.qubit.parallel``
+
+    This device splits the state vector into ``2**k`` partitions of contiguous amplitudes,
+    indexed by the leading ``k`` wires, where ``2**k`` is the number of workers rounded up
+    to a power of two. The state is held in :mod:`multiprocessing.shared_memory`, and the
+    partitions are updated in parallel by a pool of worker processes:
+
+    * Consecutive gates acting only on the trailing wires are *local*: each worker applies
+      the whole sequence to its partitions without any communication.
+
+    * A gate acting on ``g`` of the leading wires couples ``2**g`` partitions. Such gates
+      are applied one at a time, with each worker exchanging amplitudes between the
+      groups of partitions assigned to it through the shared memory.
+
+    Measurement statistics are computed from a copy of the shared state in the main process,
+    as in ``"default.qubit"``.
+
+    This device requires Python 3.8 or newer.
+
+    Args:
+        wires (int, Iterable[Number, str]): Number of subsystems represented by the device,
+            or iterable that contains unique labels for the subsystems as numbers (i.e., ``[-1, 0, 2]``)
+            or strings (``['ancilla', 'q1', 'q2']``). Default 1 if not specified.
+        shots (int): How many times the circuit should be evaluated (or sampled) to estimate
+            the expectation values. Defaults to 1000 if not specified.
+            If ``analytic == True``, then the number of shots is ignored
+            in the calculation of expectation values and variances, and only controls the number
+            of samples returned by ``sample``.
+        analytic (bool): indicates if the device should calculate expectations
+            and variances analytically
+        num_workers (int): number of worker processes. Defaults to the number of CPUs.
+    """
+
+    name = "Default qubit (parallel) PennyLane plugin"
+    short_name = "default.qubit.parallel"
+
+    def __init__(self, wires, *, shots=1000, analytic=True, num_workers=None):
+        self._num_workers = num_workers or os.cpu_count()
+        self._blocks = []
+        self._executors = []
+
+        super().__init__(wires, shots=shots, analytic=analytic)
+
+        # partition the state on the leading wires, with at least one partition per worker
+        num_global = min(int(np.ceil(np.log2(self._num_workers))), self.num_wires)
+        self._chunk_wires = self.num_wires - num_global
+
+        weakref.finalize(self, _release, self._blocks, self._executors)
+
+    def _shared_state(self):
+        """Flat view of the shared memory block holding the state the gates are applied to.
+
+        Returns:
+            array[complex]: array of length ``2**self.num_wires`` backed by shared memory
+        """
+        size = 2 ** self.num_wires
+
+        if not self._blocks:
+            nbytes = size * np.dtype(np.complex128).itemsize
+            self._blocks.append(shared_memory.SharedMemory(create=True, size=nbytes))
+
+        return np.ndarray((size,), dtype=np.complex128, buffer=self._blocks[0].buf)
+
+    def _load_state(self, state):
+        """Copy a state vector into shared memory, and make it the state of the device.
+
+        Args:
+            state (array[complex]): the state vector
+        """
+        shared = self._shared_state()
+        shared[:] = np.ravel(state)
+        self._state = np.reshape(shared, [2] * self.num_wires)
+
+    def _create_basis_state(self, index):
+        state = self._shared_state()
+        state[:] = 0
+        state[index] = 1
+
+        return np.reshape(state, [2] * self.num_wires)
+
+    def _apply_state_vector(self, state, device_wires):
+        super()._apply_state_vector(state, device_wires)
+        self._load_state(self._state)
+
+    def apply(self, operations, rotations=None, **kwargs):
+        rotations = rotations or []
+        gates = []
+
+        for i, operation in enumerate(operations):
+
+            if i > 0 and isinstance(operation, (QubitStateVector, BasisState)):
+                raise DeviceError(
+                    "Operation {} cannot be used after other Operations have already been applied "
+                    "on a {} device.".format(operation.name, self.short_name)
+                )
+
+            if isinstance(operation, (QubitStateVector, BasisState)):
+                self._apply_operation(operation)
+            else:
+                gates.append(operation)
+
+        # a state set from outside, e.g., by the reversible gradient method, is copied
+        # into shared memory before the workers apply the gates to it
+        if not np.may_share_memory(self._state, self._shared_state()):
+            self._load_state(self._state)
+
+        self._apply_parallel(gates)
+
+        # the shared memory is updated in place by the next execution, so the
+        # pre-rotated and rotated states are stored as copies
+        self._pre_rotated_state = np.array(self._state)
+
+        if rotations:
+            self._apply_parallel(rotations)
+            self._state = np.array(self._state)
+        else:
+            self._state = self._pre_rotated_state
+
+    def _apply_parallel(self, operations):
+        """Apply gates to the shared state vector using the worker processes.
+
+        Args:
+            operations (list[~.Operation]): gates to apply
+        """
+        num_global = self.num_wires - self._chunk_wires
+        local = []
+
+        for operation in operations:
+            wires = self.map_wires(operation.wires).tolist()
+            op = (
+                self._get_unitary_matrix(operation),
+                wires,
+                isinstance(operation, DiagonalOperation),
+            )
+
+            if min(wires) >= num_global:
+                local.append(op)
+                continue
+
+            # apply the pending local gates, followed by the gate on the leading wires
+            self._run(local, np.arange(2 ** num_global))
+            local = []
+
+            starts, _ = _chunk_groups(wires, num_global)
+            self._run([op], starts)
+
+        self._run(local, np.arange(2 ** num_global))
+
+    def _run(self, ops, starts):
+        """Distribute the groups of chunks among the workers, which apply the given gates.
+
+        Args:
+            ops (list[tuple[array, list[int], bool]]): the matrix, wires and diagonality
+                of each gate
+            starts (array[int]): the first chunk of each group of coupled chunks
+        """
+        if not ops:
+            return
+
+        tasks = np.array_split(starts, min(self._num_workers, len(starts)))
+
+        if len(tasks) == 1:
+            for matrix, wires, diagonal in ops:
+                _apply_to_chunks(
+                    np.ravel(self._state),
+                    matrix,
+                    wires,
+                    self._chunk_wires,
+                    diagonal=diagonal,
+                    starts=starts,
+                )
+            return
+
+        if not self._executors:
+            self._executors.append(ProcessPoolExecutor(max_workers=self._num_workers))
+
+        name = self._blocks[0].name
+        size = 2 ** self.num_wires
+
+        futures = [
+            self._executors[0].submit(_apply_in_worker, name, size, ops, self._chunk_wires, t)
+            for t in tasks
+        ]
+
+        for future in futures:
+            future.result()
@@ -119,6 +119,8 @@ class DefaultQubitTF(DefaultQubit):
             of samples returned by ``sample``.
         analytic (bool): indicates if the device should calculate expectations
             and variances analytically
+        dtype (tf.DType): complex data type of the state vector, either ``tf.complex128``
+            (default) or ``tf.complex64``
     """
 
     name = "Default qubit (TensorFlow) PennyLane plugin"
@@ -153,12 +155,21 @@ class DefaultQubitTF(DefaultQubit):
     _roll = staticmethod(tf.roll)
     _stack = staticmethod(tf.stack)
 
-    def __init__(self, wires, *, shots=1000, analytic=True):
-        super().__init__(wires, shots=shots, analytic=analytic)
+    def __init__(self, wires, *, shots=1000, analytic=True, dtype=tf.complex128):
+        if isinstance(dtype, tf.DType):
+            dtype = dtype.as_numpy_dtype
+
+        super().__init__(wires, shots=shots, analytic=analytic, dtype=dtype)
+
+        self.C_DTYPE = tf.as_dtype(self.C_DTYPE)
+        self.R_DTYPE = tf.as_dtype(self.R_DTYPE)
 
         # prevent using special apply method for this gate due to slowdown in TF implementation
         del self._apply_ops["CZ"]
 
+        # the in-place kernels cannot be differentiated through
+        self._inplace_ops = {}
+
     @classmethod
     def capabilities(cls):
         capabilities = super().capabilities().copy()
@@ -77,7 +77,9 @@ def to_autograd(qnode):
             Returns:
                 function[array[float], array[float]]: vector-Jacobian product operator
             """
-            # pylint: disable=unused-argument
+            # the backward pass reuses the results of the forward pass, which has just completed
+            options = self.forward_pass_options(ans)
+
             def gradient_product(g):
                 """Vector-Jacobian product operator.
 
@@ -89,14 +91,8 @@ def to_autograd(qnode):
                     nested Sequence[float]: vector-Jacobian product, arranged
                     into the nested structure of the input arguments in ``args``
                 """
-                # Jacobian matrix of the circuit
                 self.set_trainable(args)
-                jac = self.jacobian(args, kwargs)
-
-                if not g.shape:
-                    vjp = g * jac  # numpy treats 0d arrays as scalars, hence @ cannot be used
-                else:
-                    vjp = g @ jac
+                vjp = self.vjp(args, g, kwargs, options)
 
                 # Restore the nested structure of the input args.
                 vjp = unflatten(vjp.flat, args)
@@ -114,6 +114,7 @@ def to_tf(qnode, dtype=None):
         # Bind QNode methods
         print_applied = qnode.print_applied
         jacobian = qnode.jacobian
+        vjp = qnode.vjp
         metric_tensor = qnode.metric_tensor
         draw = qnode.draw
         func = qnode.func
@@ -167,20 +168,30 @@ def to_tf(qnode, dtype=None):
             # scalar result, cast to NumPy scalar
             res = np.array(res)
 
+        # the backward pass reuses the results of the forward pass
+        options = qnode.forward_pass_options(res)
+
         def grad(grad_output, **tfkwargs):
             """Returns the vector-Jacobian product"""
-            # evaluate the Jacobian matrix of the QNode
             variables = tfkwargs.get("variables", None)
             qnode.set_trainable_args(trainable_args)
-            jacobian = qnode.jacobian(args, kwargs)
-            jacobian = tf.constant(jacobian, dtype=dtype)
-
-            # Reshape gradient output array as a 2D row-vector.
-            grad_output_row = tf.transpose(tf.reshape(grad_output, [-1, 1]))
 
-            # Calculate the vector-Jacobian matrix product, and flatten the output.
-            grad_input = tf.matmul(grad_output_row, jacobian)
-            grad_input = tf.reshape(grad_input, [-1])
+            if tf.executing_eagerly():
+                # evaluate the vector-Jacobian product of the QNode
+                grad_input = qnode.vjp(args, grad_output.numpy(), kwargs, options)
+                grad_input = tf.constant(grad_input, dtype=dtype)
+            else:
+                # the output gradient is symbolic, for instance when the Jacobian of
+                # the QNode is computed by vectorizing over the output gradients
+                jacobian = qnode.jacobian(args, kwargs, options=options)
+                jacobian = tf.constant(jacobian, dtype=dtype)
+
+                # Reshape gradient output array as a 2D row-vector.
+                grad_output_row = tf.transpose(tf.reshape(grad_output, [-1, 1]))
+
+                # Calculate the vector-Jacobian matrix product, and flatten the output.
+                grad_input = tf.matmul(grad_output_row, jacobian)
+                grad_input = tf.reshape(grad_input, [-1])
 
             grad_input_unflattened = unflatten_tf(grad_input, input_)[0]
 
@@ -192,6 +192,9 @@ def to_torch(qnode):
                 # scalar result, cast to NumPy scalar
                 res = np.array(res)
 
+            # the backward pass reuses the results of the forward pass
+            ctx.options = qnode.forward_pass_options(res)
+
             # if any input tensor uses the GPU, the output should as well
             for i in input_:
                 if isinstance(i, torch.Tensor):
@@ -210,12 +213,9 @@ def to_torch(qnode):
             # subtleties in the torch.autograd.FunctionMeta metaclass, specifically
             # the way in which the backward class is created on the fly
 
-            # evaluate the Jacobian matrix of the QNode
-            jacobian = qnode.jacobian(ctx.args, ctx.kwargs)
-            jacobian = torch.as_tensor(jacobian, dtype=grad_output.dtype)
-
-            vjp = torch.transpose(grad_output.view(-1, 1), 0, 1) @ jacobian
-            vjp = vjp.flatten()
+            # evaluate the vector-Jacobian product of the QNode
+            vjp = qnode.vjp(ctx.args, grad_output.detach().cpu().numpy(), ctx.kwargs, ctx.options)
+            vjp = torch.as_tensor(vjp, dtype=grad_output.dtype)
 
             # restore the nested structure of the input args
             grad_input_list = unflatten_torch(vjp, ctx.saved_tensors)[0]
@@ -261,6 +261,7 @@ def to_torch(qnode):
         # Bind QNode methods
         print_applied = qnode.print_applied
         jacobian = qnode.jacobian
+        vjp = qnode.vjp
         metric_tensor = qnode.metric_tensor
         draw = qnode.draw
         func = qnode.func
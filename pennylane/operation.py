@@ -100,9 +100,11 @@ and :math:`\mathbf{r} = (\I, \x_0, \p_0, \x_1, \p_1, \ldots)` for multi-mode ope
     the finite-difference method of gradient computation.
 """
 import abc
+import contextlib
 import itertools
 import functools
 import numbers
+import threading
 from collections.abc import Sequence
 from enum import Enum, IntEnum
 from pennylane.wires import Wires
@@ -212,6 +214,110 @@ def classproperty(func):
     return ClassPropertyDescriptor(func)
 
 
+# =============================================================================
+# Trusted construction
+# =============================================================================
+
+_construction = threading.local()
+
+
+@contextlib.contextmanager
+def _trusted_construction(trusted=True):
+    """Context manager in which operators are constructed without validating the number of
+    their wires and parameters, and the domain of their parameters.
+
+    This is used by the decompositions of operations and by the templates shipped with
+    PennyLane, which construct their operators from already validated arguments.
+    Operators whose wires are given as a :class:`~.Wires` object also reuse it.
+
+    Args:
+        trusted (bool): whether the validation is skipped. Passing ``False`` restores
+            the validation, for instance within a user-defined template.
+    """
+    previous = getattr(_construction, "trusted", False)
+    _construction.trusted = trusted
+
+    try:
+        yield
+    finally:
+        _construction.trusted = previous
+
+
+# =============================================================================
+# Memoized matrices
+# =============================================================================
+
+_MATRIX_CACHE_SIZE = 1024
+"""int: maximum number of matrices and eigenvalues of parametrized operators held in memory"""
+
+_CACHEABLE_PARAMETER_TYPES = (int, float, complex, np.int64, np.float64, np.complex128)
+
+# matrices and eigenvalues of operators without parameters, keyed by class
+_constant_matrices = {}
+
+
+def _compute_matrix(cls, method, inverse, *params):
+    """Compute the matrix or the eigenvalues of an operator.
+
+    Args:
+        cls (type): class of the operator
+        method (str): either ``"_matrix"`` or ``"_eigvals"``
+        inverse (bool): whether to return the matrix or the eigenvalues of the inverse
+        params (tuple): parameters of the operator
+
+    Returns:
+        array: matrix or eigenvalues
+    """
+    res = getattr(cls, method)(*params)
+
+    if inverse:
+        res = res.conj().T if method == "_matrix" else res.conj()
+
+    return res
+
+
+@functools.lru_cache(maxsize=_MATRIX_CACHE_SIZE, typed=True)
+def _compute_matrix_cached(cls, method, inverse, *params):
+    """Memoized version of :func:`_compute_matrix`, returning read-only arrays."""
+    res = np.array(_compute_matrix(cls, method, inverse, *params))
+    res.flags.writeable = False
+    return res
+
+
+def _memoized_matrix(cls, method, inverse, params):
+    """Matrix or eigenvalues of an operator, reused across operators of the same class
+    with the same parameters.
+
+    The results for operators without parameters are held for the lifetime of the
+    process, and those for operators whose parameters are all plain numbers in a
+    bounded least-recently-used cache. Parameters of any other type, such as arrays or
+    tensors of a machine learning framework, are not hashable or must be differentiated
+    through, and the result is computed anew. Memoized results are read-only.
+
+    Args:
+        cls (type): class of the operator
+        method (str): either ``"_matrix"`` or ``"_eigvals"``
+        inverse (bool): whether to return the matrix or the eigenvalues of the inverse
+        params (Sequence): parameters of the operator
+
+    Returns:
+        array: matrix or eigenvalues
+    """
+    if not params:
+        key = (cls, method, inverse)
+        res = _constant_matrices.get(key)
+
+        if res is None:
+            res = _constant_matrices[key] = _compute_matrix_cached(cls, method, inverse)
+
+        return res
+
+    if all(type(p) in _CACHEABLE_PARAMETER_TYPES for p in params):
+        return _compute_matrix_cached(cls, method, inverse, *params)
+
+    return _compute_matrix(cls, method, inverse, *params)
+
+
 # =============================================================================
 # Base Operator class
 # =============================================================================
@@ -278,7 +384,7 @@ class Operator(abc.ABC):
         Returns:
             array: matrix representation
         """
-        return self._matrix(*self.parameters)
+        return _memoized_matrix(type(self), "_matrix", False, self.parameters)
 
     @classmethod
     def _eigvals(cls, *params):
@@ -324,7 +430,7 @@ class Operator(abc.ABC):
         Returns:
             array: eigvals representation
         """
-        return self._eigvals(*self.parameters)
+        return _memoized_matrix(type(self), "_eigvals", False, self.parameters)
 
     @property
     @abc.abstractmethod
@@ -365,6 +471,16 @@ class Operator(abc.ABC):
         if wires is None:
             raise ValueError("Must specify the wires that {} acts on".format(self.name))
 
+        if getattr(_construction, "trusted", False):
+            # Wires objects are immutable, and can be shared between operators
+            self._wires = wires if isinstance(wires, Wires) else Wires(wires)
+            self.data = list(params)
+
+            if do_queue:
+                self.queue()
+
+            return
+
         self._wires = Wires(wires)  #: Wires: wires on which the operator acts
 
         # check that the number of wires given corresponds to required number
@@ -673,21 +789,11 @@ class Operation(Operator):
 
     @property
     def matrix(self):
-        op_matrix = self._matrix(*self.parameters)
-
-        if self.inverse:
-            return op_matrix.conj().T
-
-        return op_matrix
+        return _memoized_matrix(type(self), "_matrix", self.inverse, self.parameters)
 
     @property
     def eigvals(self):
-        op_eigvals = self._eigvals(*self.parameters)
-
-        if self.inverse:
-            return op_eigvals.conj()
-
-        return op_eigvals
+        return _memoized_matrix(type(self), "_eigvals", self.inverse, self.parameters)
 
     @property
     def base_name(self):
@@ -703,6 +809,24 @@ class Operation(Operator):
 
         self._inverse = False
 
+        # the gradient method and recipe are checked once per class
+        default_recipe = type(self).__dict__.get("_default_grad_recipe", None)
+
+        if default_recipe is None:
+            default_recipe = self._check_grad_recipe()
+            type(self)._default_grad_recipe = default_recipe
+
+        if default_recipe:
+            self.grad_recipe = [None] * self.num_params
+
+        super().__init__(*params, wires=wires, do_queue=do_queue)
+
+    def _check_grad_recipe(self):
+        """Check the validity of the gradient method and recipe of the operation.
+
+        Returns:
+            bool: whether the default recipe is used for every parameter
+        """
         # check the grad_method validity
         if self.par_domain == "N":
             assert (
@@ -718,15 +842,15 @@ class Operation(Operator):
         if self.grad_method == "A":
             if self.grad_recipe is None:
                 # default recipe for every parameter
-                self.grad_recipe = [None] * self.num_params
-            else:
-                assert (
-                    len(self.grad_recipe) == self.num_params
-                ), "Gradient recipe must have one entry for each parameter!"
+                return True
+
+            assert (
+                len(self.grad_recipe) == self.num_params
+            ), "Gradient recipe must have one entry for each parameter!"
         else:
             assert self.grad_recipe is None, "Gradient recipe is only used by the A method!"
 
-        super().__init__(*params, wires=wires, do_queue=do_queue)
+        return False
 
 
 class DiagonalOperation(Operation):
@@ -19,10 +19,14 @@ quantum operations supported by PennyLane, as well as their conventions.
 import math
 import cmath
 import functools
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
 
 from pennylane.templates import template
-from pennylane.operation import AnyWires, Observable, Operation, DiagonalOperation
+from pennylane.operation import AnyWires, Observable, Operation, DiagonalOperation, _memoized_matrix
 from pennylane.templates.state_preparations import BasisStatePreparation, MottonenStatePreparation
 from pennylane.utils import pauli_eigs, expand
 from pennylane._queuing import OperationRecorder
@@ -786,11 +790,9 @@ class MultiRZ(DiagonalOperation):
     @property
     def matrix(self):
         # Redefine the property here to pass additionally the number of wires to the ``_matrix`` method
-        if self.inverse:
-            # The matrix is diagonal, so there is no need to transpose
-            return self._matrix(*self.parameters, len(self.wires)).conj()
-
-        return self._matrix(*self.parameters, len(self.wires))
+        return _memoized_matrix(
+            type(self), "_matrix", self.inverse, self.parameters + [len(self.wires)]
+        )
 
     @classmethod
     def _eigvals(cls, theta, n):
@@ -799,10 +801,9 @@ class MultiRZ(DiagonalOperation):
     @property
     def eigvals(self):
         # Redefine the property here to pass additionally the number of wires to the ``_eigvals`` method
-        if self.inverse:
-            return self._eigvals(*self.parameters, len(self.wires)).conj()
-
-        return self._eigvals(*self.parameters, len(self.wires))
+        return _memoized_matrix(
+            type(self), "_eigvals", self.inverse, self.parameters + [len(self.wires)]
+        )
 
     @staticmethod
     @template
@@ -1514,6 +1515,83 @@ class QubitStateVector(Operation):
 # =============================================================================
 
 
+def _fingerprint(A):
+    """Fingerprint of a matrix, used to key the eigendecompositions of Hermitian observables.
+
+    Args:
+        A (array): the matrix
+
+    Returns:
+        tuple: the shape and data type of the matrix, and a digest of its entries
+    """
+    A = np.ascontiguousarray(A)
+
+    if A.dtype == object:
+        return A.shape, tuple(A.flatten().tolist())
+
+    return A.shape, A.dtype.str, hashlib.blake2b(A.data, digest_size=16).digest()
+
+
+class _EigendecompositionCache(OrderedDict):
+    """Least-recently-used cache of the eigendecompositions of Hermitian observables.
+
+    The eigendecompositions are keyed by the :func:`_fingerprint` of the matrix.
+    The least recently used entries are discarded once the cache holds more than
+    ``max_size`` of them, or once their eigenvalues and eigenvectors occupy more
+    than ``max_bytes``.
+
+    Args:
+        max_size (int): maximum number of eigendecompositions held
+        max_bytes (int): maximum memory occupied by the eigenvalues and eigenvectors
+    """
+
+    def __init__(self, max_size=1000, max_bytes=2 ** 28):
+        super().__init__()
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.nbytes = 0  #: int: memory occupied by the eigenvalues and eigenvectors
+        self._lock = threading.Lock()
+
+    def __delitem__(self, key):
+        self.nbytes -= sum(a.nbytes for a in self[key].values())
+        super().__delitem__(key)
+
+    def clear(self):
+        super().clear()
+        self.nbytes = 0
+
+    def eigh(self, A):
+        """Eigendecomposition of a Hermitian matrix, computed on a cache miss.
+
+        Args:
+            A (array): the matrix
+
+        Returns:
+            dict[str, array]: the eigenvalues and the eigenvectors of the matrix
+        """
+        key = _fingerprint(A)
+
+        with self._lock:
+            if key in self:
+                self.move_to_end(key)
+                return self[key]
+
+        w, U = np.linalg.eigh(A)
+        res = {"eigvec": U, "eigval": w}
+
+        with self._lock:
+            if key in self:
+                del self[key]
+
+            self[key] = res
+            self.nbytes += w.nbytes + U.nbytes
+
+            while len(self) > 1 and (len(self) > self.max_size or self.nbytes > self.max_bytes):
+                del self[next(iter(self))]
+
+        return res
+
+
 class Hermitian(Observable):
     r"""Hermitian(A, wires)
     An arbitrary Hermitian observable.
@@ -1542,7 +1620,7 @@ class Hermitian(Observable):
     num_params = 1
     par_domain = "A"
     grad_method = "F"
-    _eigs = {}
+    _eigs = _EigendecompositionCache()
 
     @classmethod
     def _matrix(cls, *params):
@@ -1560,21 +1638,15 @@ class Hermitian(Observable):
     def eigendecomposition(self):
         """Return the eigendecomposition of the matrix specified by the Hermitian observable.
 
-        This method uses pre-stored eigenvalues for standard observables where
-        possible and stores the corresponding eigenvectors from the eigendecomposition.
-
-        It transforms the input operator according to the wires specified.
+        The eigendecompositions are shared by all Hermitian observables with the same
+        matrix, and held in a bounded least-recently-used cache, so that an observable
+        used repeatedly, for instance across the steps of an optimization, is only
+        diagonalized once.
 
         Returns:
             dict[str, array]: dictionary containing the eigenvalues and the eigenvectors of the Hermitian observable
         """
-        Hmat = self.matrix
-        Hkey = tuple(Hmat.flatten().tolist())
-        if Hkey not in Hermitian._eigs:
-            w, U = np.linalg.eigh(Hmat)
-            Hermitian._eigs[Hkey] = {"eigvec": U, "eigval": w}
-
-        return Hermitian._eigs[Hkey]
+        return Hermitian._eigs.eigh(self.matrix)
 
     @property
     def eigvals(self):
@@ -16,15 +16,22 @@ Base QNode class and utilities
 """
 from collections.abc import Sequence
 from collections import namedtuple, OrderedDict
+import functools
 import inspect
 import itertools
 
 import numpy as np
 
 import pennylane as qml
-from pennylane.operation import Observable, CV, WiresEnum, ObservableReturnTypes
+from pennylane.operation import (
+    Observable,
+    CV,
+    WiresEnum,
+    ObservableReturnTypes,
+    _trusted_construction,
+)
 from pennylane.utils import _flatten, unflatten
-from pennylane.circuit_graph import CircuitGraph, _is_observable
+from pennylane.circuit_graph import CircuitGraph, _is_observable, _param_signature
 from pennylane.variable import Variable
 
 
@@ -97,7 +104,8 @@ def _decompose_queue(ops, device):
         if device.supports_operation(op.name):
             new_ops.append(op)
         else:
-            decomposed_ops = op.decomposition(*op.data, wires=op.wires)
+            with _trusted_construction():
+                decomposed_ops = op.decomposition(*op.data, wires=op.wires)
             if op.inverse:
                 decomposed_ops = qml.inv(decomposed_ops)
 
@@ -165,6 +173,8 @@ class BaseQNode(qml.QueuingContext):
     Keyword Args:
         vis_check (bool): whether to check for operations that cannot affect the output
         par_check (bool): whether to check for unused positional params
+        cache (~.ResultCache): cache in which the results of device executions are stored,
+            so that identical evaluations are not repeated
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -197,6 +207,9 @@ class BaseQNode(qml.QueuingContext):
         self._metric_tensor_subcircuits = None
         """dict[tuple[int], dict[str, Any]]: circuit descriptions for computing the metric tensor"""
 
+        self._structure = None
+        """tuple: structure of the constructed circuit, see :meth:`_circuit_structure`"""
+
         # introspect the quantum function signature
         _get_signature(self.func)
 
@@ -534,6 +547,10 @@ class BaseQNode(qml.QueuingContext):
         stores the resulting sequence of :class:`.Operator` instances,
         converts it into a circuit graph, and creates the Variable mapping.
 
+        If a mutable node has already been constructed, and the quantum function queues
+        a circuit with the same structure (see :meth:`_circuit_structure`), the existing
+        circuit graph is kept instead.
+
         .. note::
            The Variables are only required for analytic differentiation,
            for evaluation we could simply reconstruct the circuit each time.
@@ -572,6 +589,15 @@ class BaseQNode(qml.QueuingContext):
                 self.kwarg_vars = None
                 raise
 
+        structure = self._circuit_structure(res)
+
+        if self.mutable and self.circuit is not None and structure == self._structure:
+            # The circuit has the same structure as the existing one, which
+            # can be reused since its Variables are bound to the new values.
+            del self.queue
+            del self.obs_queue
+            return
+
         # check the validity of the circuit
         self._check_circuit(res)
         del self.queue
@@ -590,6 +616,7 @@ class BaseQNode(qml.QueuingContext):
 
         # generate the DAG
         self.circuit = CircuitGraph(self.ops, self.variable_deps, self.device.wires)
+        self._structure = structure
 
         # check for unused positional params
         if self.kwargs.get("par_check", False):
@@ -607,6 +634,41 @@ class BaseQNode(qml.QueuingContext):
                     "The operations {} cannot affect the circuit output.".format(invisible)
                 )
 
+    def _circuit_structure(self, res):
+        """Structure of the circuit queued by the quantum function.
+
+        Two circuits with the same structure consist of the same operators, acting on
+        the same wires, with the same constant parameters and depending on the same free
+        parameters, and return the same measured observables. They only differ in the
+        values bound to their free parameters.
+
+        Args:
+            res (Any): output returned by the quantum function
+
+        Returns:
+            tuple: hashable description of the circuit
+        """
+        position = {id(obs): i for i, obs in enumerate(self.obs_queue)}
+
+        if isinstance(res, Sequence):
+            returned = tuple(position.get(id(obs), None) for obs in res)
+        else:
+            returned = position.get(id(res), None)
+
+        ops = []
+
+        for op in self.queue + self.obs_queue:
+            name = op.name
+
+            if isinstance(name, list):
+                # tensor products of observables
+                name = tuple(name)
+
+            params = tuple(_param_signature(p, exact=True) for p in op.data)
+            ops.append((name, params, op.wires.labels, getattr(op, "return_type", None)))
+
+        return self.num_variables, tuple(ops), returned
+
     @staticmethod
     def _prune_tensors(res):
         """Prune the tensors that have been passed by the quantum function.
@@ -633,6 +695,25 @@ class BaseQNode(qml.QueuingContext):
 
         return res
 
+    def _output_size(self, obs):
+        """Number of outputs of a measured observable in the output vector of the node.
+
+        Args:
+            obs (Observable): observable returned by the quantum function
+
+        Returns:
+            int: the number of basis states of the measured wires for probabilities, else 1
+        """
+        if obs.return_type is not ObservableReturnTypes.Probability:
+            return 1
+
+        if self.model == "qubit":
+            num_basis_states = 2
+        elif self.model == "cv":
+            num_basis_states = getattr(self.device, "cutoff", 10)
+
+        return num_basis_states ** len(obs.wires)
+
     def _check_circuit(self, res):
         """Check that the generated Operator queue corresponds to a valid quantum circuit.
 
@@ -648,7 +729,7 @@ class BaseQNode(qml.QueuingContext):
 
         # check the return value
         if isinstance(res, Observable):
-            self.output_dim = 1
+            self.output_dim = self._output_size(res)
 
             if res.return_type is ObservableReturnTypes.Sample:
                 # Squeezing ensures that there is only one array of values returned
@@ -656,14 +737,6 @@ class BaseQNode(qml.QueuingContext):
                 self.output_conversion = np.squeeze
             elif res.return_type is ObservableReturnTypes.Probability:
                 self.output_conversion = np.squeeze
-
-                if self.model == "qubit":
-                    num_basis_states = 2
-                elif self.model == "cv":
-                    num_basis_states = getattr(self.device, "cutoff", 10)
-
-                self.output_dim = num_basis_states ** len(res.wires)
-
             else:
                 self.output_conversion = float
 
@@ -675,7 +748,7 @@ class BaseQNode(qml.QueuingContext):
 
             # Device already returns the correct numpy array, so no further conversion is required
             self.output_conversion = np.asarray
-            self.output_dim = len(res)
+            self.output_dim = sum(self._output_size(ob) for ob in res)
             res = tuple(res)
         else:
             raise QuantumFunctionError(
@@ -820,19 +893,89 @@ class BaseQNode(qml.QueuingContext):
 
         self.device.reset()
 
-        temp = self.kwargs.get("use_native_type", False)
-        if isinstance(self.device, qml.QubitDevice):
-            # TODO: remove this if statement once all devices are ported to the QubitDevice API
-            ret = self.device.execute(self.circuit, return_native_type=temp)
+        cache = self.kwargs.get("cache", None)
+
+        if cache is None:
+            ret = self._execute()
         else:
-            ret = self.device.execute(
-                self.circuit.operations,
-                self.circuit.observables,
-                self.variable_deps,
-                return_native_type=temp,
+            ret = cache.execute(
+                self.device, self.circuit.operations, self.circuit.observables, self._execute
             )
+
         return self.output_conversion(ret)
 
+    async def evaluate_async(self, args, kwargs):
+        """Evaluate the quantum function on the specified device without blocking the event loop.
+
+        The circuit is constructed immediately, and executed using
+        :meth:`.Device.execute_async`, so that many evaluations can be in flight at once.
+        The result is not differentiable.
+
+        **Example**
+
+        >>> dev = qml.device("default.qubit", wires=1)
+        >>> @qml.qnode(dev)
+        ... def circuit(x):
+        ...     qml.RX(x, wires=0)
+        ...     return qml.expval(qml.PauliZ(0))
+        >>> asyncio.run(circuit.evaluate_async([0.5], {}))
+        0.8775825618903726
+
+        Args:
+            args (tuple[Any]): positional arguments to the quantum function
+            kwargs (dict[str, Any]): auxiliary arguments
+
+        Returns:
+            float or array[float]: output measured value(s)
+        """
+        kwargs = self._default_args(kwargs)
+        self._set_variables(args, kwargs)
+
+        if self.circuit is None or self.mutable:
+            self._construct(args, kwargs)
+
+        # the QNode may be constructed again by another evaluation while this one is in flight
+        circuit = self.circuit
+        output_conversion = self.output_conversion
+        exec_args, exec_kwargs = self._execution_args()
+
+        cache = self.kwargs.get("cache", None)
+
+        if cache is None:
+            ret = await self.device.execute_async(*exec_args, **exec_kwargs)
+        else:
+            execute = functools.partial(self.device.execute, *exec_args, **exec_kwargs)
+            ret = await self.device._run_async(  # pylint: disable=protected-access
+                cache.execute, self.device, circuit.operations, circuit.observables, execute
+            )
+
+        return output_conversion(ret)
+
+    def _execute(self):
+        """Execute the constructed circuit on the device.
+
+        Returns:
+            Any: the result of the device execution
+        """
+        exec_args, exec_kwargs = self._execution_args()
+        return self.device.execute(*exec_args, **exec_kwargs)
+
+    def _execution_args(self):
+        """Arguments passed to the device to execute the constructed circuit.
+
+        Returns:
+            tuple[tuple, dict]: positional and keyword arguments of :meth:`.Device.execute`
+        """
+        temp = self.kwargs.get("use_native_type", False)
+        if isinstance(self.device, qml.QubitDevice):
+            # TODO: remove this if statement once all devices are ported to the QubitDevice API
+            return (self.circuit,), {"return_native_type": temp}
+
+        return (
+            (self.circuit.operations, self.circuit.observables, self.variable_deps),
+            {"return_native_type": temp},
+        )
+
     def evaluate_obs(self, obs, args, kwargs):
         """Evaluate the value of the given observables.
 
@@ -86,8 +86,11 @@ class JacobianQNode(BaseQNode):
         Like :meth:`.QNode._construct`, additionally determines the best gradient computation method
         for each positional parameter.
         """
+        circuit = self.circuit
         super()._construct(args, kwargs)
-        self.par_to_grad_method = {k: self._best_method(k) for k in self.variable_deps}
+
+        if self.circuit is not circuit:
+            self.par_to_grad_method = {k: self._best_method(k) for k in self.variable_deps}
 
     def _best_method(self, idx):
         """Determine the correct partial derivative computation method for a free parameter.
@@ -195,6 +198,7 @@ class JacobianQNode(BaseQNode):
 
                 * h (float): finite difference method step size
                 * order (int): finite difference method order, 1 or 2
+                * y0 (array[float]): value of the circuit at ``args``, if already known
 
         Returns:
             array[float]: Jacobian, shape ``(n, len(wrt))``, where ``n`` is the number of outputs returned by the QNode
@@ -291,7 +295,7 @@ class JacobianQNode(BaseQNode):
             raise ValueError("Unknown gradient method.")
 
         if "F" in method.values():
-            if options.get("order", 1) == 1:
+            if options.get("order", 1) == 1 and options.get("y0", None) is None:
                 # the value of the circuit at args, computed only once here
                 options["y0"] = np.asarray(self.evaluate(args, kwargs))
 
@@ -320,17 +324,111 @@ class JacobianQNode(BaseQNode):
 
             if par_method == "A":
                 if variances_required:
-                    grad[:, i] = self._pd_analytic_var(k, flat_args, kwargs, **options)
+                    pd = self._pd_analytic_var(k, flat_args, kwargs, **options)
                 else:
-                    grad[:, i] = self._pd_analytic(k, flat_args, kwargs, **options)
+                    pd = self._pd_analytic(k, flat_args, kwargs, **options)
             elif par_method == "F":
-                grad[:, i] = self._pd_finite_diff(k, flat_args, kwargs, **options)
+                pd = self._pd_finite_diff(k, flat_args, kwargs, **options)
             else:
                 raise ValueError("Unknown gradient method.")
 
+            # several observables may have several outputs each, e.g., probabilities
+            grad[:, i] = np.ravel(pd)
+
         self.mutable = mutable  # restore original mutability
         return grad
 
+    def vjp(self, args, dy, kwargs=None, options=None):
+        r"""Compute the vector-Jacobian product of the QNode.
+
+        Returns the product :math:`dy^T J` of a vector :math:`dy` with the Jacobian :math:`J` of
+        the QNode, as required by the backward pass of the interfaces. The partial
+        derivatives with respect to the parameters which only affect outputs whose entry
+        in ``dy`` is zero are not computed, since their contribution vanishes.
+
+        Inheriting QNodes may compute the product directly, without the Jacobian.
+
+        Args:
+            args (nested Iterable[float] or float): positional arguments to the quantum function (differentiable)
+            dy (array[float] or float): vector multiplying the Jacobian from the left (output side),
+                of size ``self.output_dim``
+            kwargs (dict[str, Any]): auxiliary arguments to the quantum function (not differentiable)
+            options (dict[str, Any]): additional options for the computation methods, see
+                :meth:`jacobian` and :meth:`forward_pass_options`
+
+        Returns:
+            array[float]: vector-Jacobian product, of size ``self.num_variables``
+        """
+        if not isinstance(args, Iterable):
+            args = (args,)
+        kwargs = self._default_args(kwargs or {})
+
+        # (re-)construct the circuit if necessary
+        if self.circuit is None or self.mutable:
+            self._construct(args, kwargs)
+
+        dy = np.reshape(np.asarray(dy, dtype=float), [-1])
+        wrt = self._vjp_wrt(dy)
+        res = np.zeros(self.num_variables, dtype=float)
+
+        if not wrt:
+            return res
+
+        # the circuit was constructed above
+        mutable = self.mutable
+        self.mutable = False
+
+        try:
+            res[wrt] = dy @ self.jacobian(args, kwargs, wrt=wrt, options=options)
+        finally:
+            self.mutable = mutable
+
+        return res
+
+    def forward_pass_options(self, res):
+        """Options of :meth:`vjp` reusing the results of the forward pass.
+
+        The interfaces evaluate the QNode in the forward pass, and differentiate it at the
+        same arguments in the backward pass. This method is called right after the forward
+        pass, so that the backward pass does not need to evaluate the circuit again.
+
+        Args:
+            res (array[float] or float): output of the QNode in the forward pass
+
+        Returns:
+            dict[str, Any]: options for :meth:`vjp` and :meth:`jacobian`
+        """
+        return {"y0": np.array(res)}
+
+    def _vjp_wrt(self, dy):
+        """Indices of the parameters whose contribution to a vector-Jacobian product may
+        be nonzero.
+
+        These are the parameters of the operations preceding the observables whose
+        entry in ``dy`` is nonzero.
+
+        Args:
+            dy (array[float]): flat vector multiplying the Jacobian from the left
+
+        Returns:
+            list[int]: indices of the flattened positional parameters
+        """
+        observables = self.circuit.observables
+
+        # the outputs of the observables are stacked, one row per observable,
+        # and an observable may have several outputs, e.g., probabilities
+        rows = np.reshape(dy, [len(observables), -1])
+        active = [ob for ob, g in zip(observables, rows) if np.any(g)]
+
+        if len(active) == len(observables):
+            return list(range(self.num_variables))
+
+        ops = self.circuit.ancestors(active)
+
+        return [
+            idx for idx, deps in self.variable_deps.items() if any(dep.op in ops for dep in deps)
+        ]
+
     def _pd_finite_diff(self, idx, args, kwargs, **options):
         """Partial derivative of the node using the finite difference method.
 
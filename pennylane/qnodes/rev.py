@@ -14,12 +14,16 @@
 """
 ReversibleQNode class.
 """
+from collections.abc import Iterable
 from copy import copy
 from functools import reduce
 from string import ascii_letters as ABC
 
 import numpy as np
 
+from pennylane.operation import Observable, ObservableReturnTypes
+from pennylane.variable import Variable
+
 from .qubit import QubitQNode
 
 ABC_ARRAY = np.array(list(ABC))
@@ -94,8 +98,7 @@ class ReversibleQNode(QubitQNode):
         # pylint: disable=protected-access
 
         # TODO: cache these so they aren't created on each call from the same `jacobian`
-        self.evaluate(args, kwargs)
-        state = self.device._pre_rotated_state  # only works if forward pass has occured
+        state = self._forward_state(args, kwargs, options.get("state", None))
         ops = self.circuit.operations_in_order
         obs = self.circuit.observables_in_order
 
@@ -151,6 +154,230 @@ class ReversibleQNode(QubitQNode):
         self.device._pre_rotated_state = state
         return pd
 
+    def vjp(self, args, dy, kwargs=None, options=None):
+        r"""Compute the vector-Jacobian product of the QNode.
+
+        If all the outputs are expectation values, the product :math:`dy^T J` is computed in
+        a single backward sweep through the circuit, without the Jacobian. Starting from
+        the pre-measurement state :math:`\vert\psi\rangle` and the state
+        :math:`\vert\lambda\rangle = \sum_k dy_k \hat{O}_k\vert\psi\rangle`, the
+        operations are undone one at a time on both states. The contribution of a gate
+        :math:`G(\theta)=e^{i s\theta H}` is then
+        :math:`2 s\,\mathrm{Im}\langle\psi'\vert H\vert\lambda'\rangle`, where the primes
+        denote the states just after the gate.
+
+        Otherwise, or if the circuit contains gates that are not supported by the
+        reversible method, the product is computed from the Jacobian.
+
+        Args:
+            args (nested Iterable[float] or float): positional arguments to the quantum function (differentiable)
+            dy (array[float] or float): vector multiplying the Jacobian from the left (output side),
+                of size ``self.output_dim``
+            kwargs (dict[str, Any]): auxiliary arguments to the quantum function (not differentiable)
+            options (dict[str, Any]): additional options for the computation methods, see
+                :meth:`~.JacobianQNode.jacobian` and :meth:`forward_pass_options`
+
+        Returns:
+            array[float]: vector-Jacobian product, of size ``self.num_variables``
+        """
+        # pylint: disable=protected-access
+        if not isinstance(args, Iterable):
+            args = (args,)
+        kwargs = self._default_args(kwargs or {})
+        options = options or {}
+
+        # (re-)construct the circuit if necessary
+        if self.circuit is None or self.mutable:
+            self._construct(args, kwargs)
+
+        mutable = self.mutable
+        self.mutable = False
+
+        try:
+            if not self._supports_adjoint():
+                return super().vjp(args, dy, kwargs, options)
+
+            return self._adjoint_vjp(args, dy, kwargs, options)
+        finally:
+            self.mutable = mutable
+
+    def forward_pass_options(self, res):
+        """Options of :meth:`vjp` reusing the results of the forward pass.
+
+        In addition to the output of the QNode, the options hold the pre-measurement state
+        of the device, from which the backward pass starts.
+
+        Args:
+            res (array[float] or float): output of the QNode in the forward pass
+
+        Returns:
+            dict[str, Any]: options for :meth:`vjp` and :meth:`~.JacobianQNode.jacobian`
+        """
+        # pylint: disable=protected-access
+        options = super().forward_pass_options(res)
+
+        # results served from a result cache leave the state of the device untouched
+        if self.kwargs.get("cache", None) is None:
+            options["state"] = self.device._pre_rotated_state
+
+        return options
+
+    def _forward_state(self, args, kwargs, state=None):
+        """Pre-measurement state of the circuit at the given arguments.
+
+        Args:
+            args (nested Iterable[float]): positional arguments to the quantum function
+            kwargs (dict[str, Any]): auxiliary arguments to the quantum function
+            state (array[complex] or None): pre-measurement state recorded in the forward
+                pass at the same arguments, if any
+
+        Returns:
+            array[complex]: the pre-measurement state
+        """
+        # pylint: disable=protected-access
+        if state is not None:
+            # the operations of the circuit must still be evaluated at the given arguments
+            self._set_variables(args, self._default_args(kwargs))
+            return state
+
+        # the pre-measurement state is read from the device below, so the forward pass
+        # must run on the device rather than be served from a result cache
+        cache = self.kwargs.pop("cache", None)
+
+        try:
+            self.evaluate(args, kwargs)
+        finally:
+            if cache is not None:
+                self.kwargs["cache"] = cache
+
+        return self.device._pre_rotated_state
+
+    def _supports_adjoint(self):
+        """Whether the vector-Jacobian product can be computed in a single backward sweep.
+
+        Returns:
+            bool: ``True`` if all the outputs are expectation values, and all the parameters
+            are differentiated analytically through gates with an observable as generator
+        """
+        if any(
+            ob.return_type is not ObservableReturnTypes.Expectation
+            for ob in self.circuit.observables
+        ):
+            return False
+
+        for idx, deps in self.variable_deps.items():
+            if deps and self.par_to_grad_method[idx] != "A":
+                return False
+
+            for op, _ in deps:
+                if op.name == "Rot":
+                    continue
+
+                generator = op.generator[0]
+
+                if op.num_params != 1 or not (
+                    isinstance(generator, type) and issubclass(generator, Observable)
+                ):
+                    return False
+
+        return True
+
+    def _adjoint_vjp(self, args, dy, kwargs, options):
+        """Vector-Jacobian product computed in a single backward sweep through the circuit.
+
+        Args:
+            args (nested Iterable[float]): positional arguments to the quantum function
+            dy (array[float] or float): vector multiplying the Jacobian from the left
+            kwargs (dict[str, Any]): auxiliary arguments to the quantum function
+            options (dict[str, Any]): additional options, see :meth:`forward_pass_options`
+
+        Returns:
+            array[float]: vector-Jacobian product, of size ``self.num_variables``
+        """
+        # pylint: disable=protected-access
+        dy = np.reshape(np.asarray(dy, dtype=float), [-1])
+        res = np.zeros(self.num_variables, dtype=float)
+        ops = self.circuit.operations_in_order
+
+        trainable = [k for k, op in enumerate(ops) if any(self._trainable(p) for p in op.data)]
+
+        if not trainable or not np.any(dy):
+            return res
+
+        rotated_state = self.device._state
+        state = phi = self._forward_state(args, kwargs, options.get("state", None))
+
+        lam = 0
+        for g, ob in zip(dy, self.circuit.observables):
+            if g != 0:
+                lam = lam + g * self._apply_matrix(ob.matrix, ob.wires, state)
+
+        for k in range(len(ops) - 1, trainable[0] - 1, -1):
+            op = ops[k]
+
+            if op.name == "Rot":
+                gates = op.decomposition(*op.parameters, wires=op.wires)
+            else:
+                gates = [op]
+
+            for j in range(len(gates) - 1, -1, -1):
+                gate = gates[j]
+                p = op.data[j] if op.data else None
+
+                if self._trainable(p):
+                    generator, multiplier = gate.generator
+
+                    if gate.inverse:
+                        multiplier = -multiplier
+
+                    elem = self._matrix_elem(phi, generator(gate.wires), lam)
+                    res[p.idx] += 2 * multiplier * p.mult * np.imag(elem)
+
+                if k == trainable[0] and j == 0:
+                    break
+
+                # undo the gate on both states
+                undo = [copy(gate).inv()]
+                phi = self._apply_to_state(phi, undo)
+                lam = self._apply_to_state(lam, undo)
+
+        # reset the state back to its value after the forward pass
+        self.device._state = rotated_state
+        self.device._pre_rotated_state = state
+        return res
+
+    @staticmethod
+    def _trainable(p):
+        """Whether an operation parameter depends on a positional argument of the QNode."""
+        return isinstance(p, Variable) and not p.is_kwarg
+
+    def _apply_to_state(self, state, ops):
+        """Apply operations to a given state on the device, and return the new state."""
+        # pylint: disable=protected-access
+        self.device._state = state
+        self.device.apply(ops)
+        return self.device._pre_rotated_state
+
+    def _apply_matrix(self, mat, wires, vec):
+        """Applies a matrix acting on the given wires to the vector ``vec``."""
+        mat = self.device._reshape(mat, [2] * len(wires) * 2)
+        indices = self.device.wires.indices(wires)
+
+        vec_indices = ABC[: self.num_wires]
+        in_indices = "".join(ABC_ARRAY[indices].tolist())
+        out_indices = ABC[self.num_wires : self.num_wires + len(wires)]
+        res_indices = reduce(
+            lambda old_string, idx_pair: old_string.replace(idx_pair[0], idx_pair[1]),
+            zip(in_indices, out_indices),
+            vec_indices,
+        )
+
+        einsum_str = "{out}{inp},{vec}->{res}".format(
+            out=out_indices, inp=in_indices, vec=vec_indices, res=res_indices
+        )
+        mat = self.device._cast(mat, dtype=self.device.C_DTYPE)
+        return self.device._einsum(einsum_str, mat, vec)
+
     def _matrix_elem(self, vec1, obs, vec2):
         """Computes the matrix element of observable ``obs`` between the two vectors
         ``vec1`` and ``vec2``, i.e., <vec1|obs|vec2>.
@@ -161,7 +388,7 @@ class ReversibleQNode(QubitQNode):
         wires = obs.wires
 
         vec1_indices = ABC[: self.num_wires]
-        obs_in_indices = "".join(ABC_ARRAY[wires.tolist()].tolist())
+        obs_in_indices = "".join(ABC_ARRAY[self.device.wires.indices(wires)].tolist())
         obs_out_indices = ABC[self.num_wires : self.num_wires + len(wires)]
         obs_indices = "".join([obs_in_indices, obs_out_indices])
         vec2_indices = reduce(
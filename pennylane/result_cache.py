@@ -0,0 +1,351 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the :class:`ResultCache` class, which stores the results of
+device executions so that identical circuit evaluations are not repeated.
+"""
+from collections import OrderedDict
+import hashlib
+import inspect
+import numbers
+import pickle
+import sqlite3
+import threading
+
+import numpy as np
+
+from pennylane.operation import Sample, Tensor
+from pennylane.wires import Wires
+
+
+def _update_param(h, p):
+    """Feed a canonical byte representation of an operator parameter into a hash object.
+
+    Args:
+        h (hashlib._Hash): hash object to update
+        p (Any): parameter value
+
+    Returns:
+        bool: ``False`` if the parameter has no canonical representation, for instance
+        because it is a tensor of a machine learning framework
+    """
+    if isinstance(p, (list, tuple)):
+        h.update(b"[%d" % len(p))
+        return all(_update_param(h, q) for q in p)
+
+    if not isinstance(p, (numbers.Number, np.ndarray, np.generic)):
+        return False
+
+    p = np.asarray(p)
+
+    if p.dtype == object:
+        return False
+
+    h.update(p.dtype.str.encode())
+    h.update(repr(p.shape).encode())
+    h.update(np.ascontiguousarray(p).tobytes())
+    return True
+
+
+def _update_option(h, value):
+    """Feed a canonical byte representation of a device option into a hash object.
+
+    Args:
+        h (hashlib._Hash): hash object to update
+        value (Any): value of the option
+
+    Returns:
+        bool: ``False`` if the option has no canonical representation
+    """
+    if value is None or isinstance(value, (str, bool, type, np.dtype)):
+        h.update(repr(value).encode())
+        return True
+
+    if isinstance(value, (list, tuple, range, Wires)):
+        h.update(b"[%d" % len(value))
+        return all(_update_option(h, v) for v in value)
+
+    if isinstance(value, dict):
+        h.update(b"{%d" % len(value))
+        return all(
+            _update_option(h, k) and _update_option(h, v)
+            for k, v in sorted(value.items(), key=lambda item: repr(item[0]))
+        )
+
+    return _update_param(h, value)
+
+
+def _update_device(h, device):
+    """Feed the options a device was created with into a hash object.
+
+    The number of shots, the wires and whether the device is analytic are left out,
+    since they may be changed after the device is created.
+
+    Args:
+        h (hashlib._Hash): hash object to update
+        device (~.Device): device
+
+    Returns:
+        bool: ``False`` if an option of the device has no canonical representation
+    """
+    args, kwargs = getattr(device, "_init_args", ((), {}))
+
+    try:
+        options = inspect.signature(type(device).__init__).bind(device, *args, **kwargs)
+    except TypeError:
+        return False
+
+    options.apply_defaults()
+
+    for name, value in list(options.arguments.items())[1:]:
+        if name in ("wires", "shots", "analytic"):
+            continue
+
+        h.update(name.encode())
+
+        if not _update_option(h, value):
+            return False
+
+    return True
+
+
+def _update_operator(h, op):
+    """Feed the name, wires, return type and parameters of an operator into a hash object.
+
+    Args:
+        h (hashlib._Hash): hash object to update
+        op (~.Operator): operation or observable
+
+    Returns:
+        bool: ``False`` if a parameter of the operator has no canonical representation
+    """
+    if isinstance(op, Tensor):
+        h.update(b"Tensor%r" % getattr(op.return_type, "value", None))
+        return all(_update_operator(h, o) for o in op.obs)
+
+    h.update(repr((op.name, op.wires.labels, getattr(op, "return_type", None))).encode())
+    return all(_update_param(h, p) for p in getattr(op, "parameters", []))
+
+
+class ResultCache:
+    """Cache of device execution results.
+
+    Results are keyed on a digest of the device, including the options it was created
+    with, and of the operations and the observables of the executed circuit, including
+    the values of all parameters. The digest is
+    independent of the Python process, so that results stored on disk can be reused
+    across runs and by concurrent processes.
+
+    Executions on a device with ``analytic=False``, or which return samples, are
+    stochastic, and are only cached if a ``seed`` is provided. The random number
+    generator of NumPy is then seeded deterministically from the seed and the circuit
+    before executing, so that a cached result is the one a fresh execution would return.
+
+    Executions with parameters that cannot be represented canonically, such as
+    autograd, TensorFlow or PyTorch tensors passed to a device that supports
+    backpropagation, are never cached. Neither are executions on devices created with
+    options that cannot be represented canonically.
+
+    **Example**
+
+    >>> cache = qml.ResultCache(path="results.sqlite")
+    >>> dev = qml.device("default.qubit", wires=2)
+    >>> @qml.qnode(dev, cache=cache)
+    ... def circuit(x):
+    ...     qml.RX(x, wires=0)
+    ...     return qml.expval(qml.PauliZ(0))
+    >>> circuit(0.5)
+    0.8775825618903728
+    >>> cache.hits, cache.misses
+    (0, 1)
+    >>> circuit(0.5)
+    0.8775825618903728
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    Args:
+        max_size (int): maximum number of results held in memory. The least recently
+            used results are discarded first.
+        path (str or None): path of an SQLite database in which all results are
+            additionally stored. If ``None``, results are only kept in memory.
+        seed (int or None): seed used to make stochastic executions reproducible,
+            and thus cacheable
+    """
+
+    def __init__(self, max_size=1000, path=None, seed=None):
+        self.max_size = max_size
+        self.path = path
+        self.seed = seed
+
+        self.hits = 0  #: int: number of executions served from the cache
+        self.misses = 0  #: int: number of executions run on the device and stored
+
+        self._memory = OrderedDict()
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._memory)
+
+    def clear(self):
+        """Remove all results held in memory. Results stored on disk are kept."""
+        with self._lock:
+            self._memory.clear()
+
+    def key(self, device, operations, observables):
+        """Digest identifying an execution.
+
+        Args:
+            device (~.Device): device executing the circuit
+            operations (Iterable[~.Operation]): operations of the circuit
+            observables (Iterable[~.Observable]): observables of the circuit, with their
+                return types set
+
+        Returns:
+            str or None: hexadecimal digest, or ``None`` if the execution cannot be cached
+        """
+        sampled = not device.analytic or any(
+            getattr(ob, "return_type", None) is Sample for ob in observables
+        )
+
+        if sampled and self.seed is None:
+            return None
+
+        h = hashlib.sha256()
+        cls = type(device)
+        h.update(
+            repr(
+                (
+                    cls.__module__,
+                    cls.__qualname__,
+                    device.short_name,
+                    device.wires.labels,
+                    device.shots,
+                    device.analytic,
+                    self.seed if sampled else None,
+                )
+            ).encode()
+        )
+
+        if not _update_device(h, device):
+            return None
+
+        for op in operations:
+            if not _update_operator(h, op):
+                return None
+
+        h.update(b"|")
+
+        for ob in observables:
+            if not _update_operator(h, ob):
+                return None
+
+        return h.hexdigest()
+
+    def execute(self, device, operations, observables, fn):
+        """Return the cached result of an execution, running it on a cache miss.
+
+        Args:
+            device (~.Device): device executing the circuit
+            operations (Iterable[~.Operation]): operations of the circuit
+            observables (Iterable[~.Observable]): observables of the circuit, with their
+                return types set
+            fn (callable): function without arguments executing the circuit on the device
+
+        Returns:
+            Any: result of ``fn``
+        """
+        key = self.key(device, operations, observables)
+
+        if key is None:
+            return fn()
+
+        res = self._lookup(key)
+
+        if res is not None:
+            self.hits += 1
+            return res.copy()
+
+        if self.seed is None:
+            res = fn()
+        else:
+            rng_state = np.random.get_state()
+            np.random.seed(int(key[:8], 16))
+
+            try:
+                res = fn()
+            finally:
+                np.random.set_state(rng_state)
+
+        if isinstance(res, np.ndarray):
+            self.misses += 1
+            self._store(key, res.copy())
+
+        return res
+
+    def _db(self):
+        """The connection to the on-disk store, opened on first use."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)"
+            )
+            self._connection.commit()
+
+        return self._connection
+
+    def _lookup(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            if self.path is None:
+                return None
+
+            row = self._db().execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            res = pickle.loads(row[0])
+            self._remember(key, res)
+            return res
+
+    def _store(self, key, res):
+        with self._lock:
+            self._remember(key, res)
+
+            if self.path is not None:
+                db = self._db()
+                db.execute("INSERT OR REPLACE INTO results VALUES (?, ?)", (key, pickle.dumps(res)))
+                db.commit()
+
+    def _remember(self, key, res):
+        """Hold a result in memory, discarding the least recently used ones."""
+        self._memory[key] = res
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
@@ -14,9 +14,34 @@
 """
 This module contains the template decorator.
 """
+import itertools
 from functools import wraps
 
 from pennylane._queuing import OperationRecorder
+from pennylane.operation import _trusted_construction
+
+_TEMPLATE_CONSTRUCTORS = ("pennylane.templates.broadcast", "pennylane.templates.layer")
+
+
+def _passes_operators(args, kwargs):
+    """Whether operator classes or other callables are among the arguments of a template,
+    directly or in a list or tuple.
+
+    Args:
+        args (tuple): positional arguments of the template
+        kwargs (dict): keyword arguments of the template
+
+    Returns:
+        bool: whether a callable was passed
+    """
+    for arg in itertools.chain(args, kwargs.values()):
+        if callable(arg):
+            return True
+
+        if isinstance(arg, (list, tuple)) and any(callable(a) for a in arg):
+            return True
+
+    return False
 
 
 def template(func):
@@ -55,9 +80,29 @@ def template(func):
         callable: The wrapper function
     """
 
+    # the templates shipped with PennyLane validate their arguments, so that the operators
+    # they construct need not be validated again, unless the caller passes the operators
+    # to construct, e.g., as operator classes
+    trusted = func.__module__.startswith("pennylane.templates.")
+
+    if func.__module__ in _TEMPLATE_CONSTRUCTORS:
+        # the template constructors apply a callable given by their caller,
+        # and construct its operators with the trust of the caller
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with OperationRecorder() as rec:
+                func(*args, **kwargs)
+
+            return rec.queue
+
+        return wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        with OperationRecorder() as rec:
+        trust = trusted and not _passes_operators(args, kwargs)
+
+        with OperationRecorder() as rec, _trusted_construction(trust):
             func(*args, **kwargs)
 
         return rec.queue
@@ -55,15 +55,55 @@ arguments are stored in :attr:`Variable.positional_arg_values` and
 then returned by :meth:`Variable.val`, using the Variable's ``idx`` attribute, and, for
 keyword arguments, its ``name``, to return the correct value to the operation.
 
+The stored values are local to the thread that stores them, so that QNodes
+can be evaluated concurrently in different threads.
+
 .. note::
     The :meth:`Operation.parameters() <pennylane.operation.Operation.parameters>`
     property automates the process of unpacking the Variable value.
     The attribute :meth:`Variable.val` should not need to be accessed outside of advanced usage.
 """
 import copy
+import threading
+
+
+# the current parameter values, bound separately in each thread
+_bindings = threading.local()
+
+
+class VariableType(type):
+    """Metaclass of :class:`Variable`, storing the current parameter values per thread."""
+
+    @property
+    def positional_arg_values(cls):
+        """array[float]: current positional parameter values in this thread,
+        set in :meth:`.BaseQNode._set_variables`"""
+        return getattr(_bindings, "positional_arg_values", None)
+
+    @positional_arg_values.setter
+    def positional_arg_values(cls, values):
+        _bindings.positional_arg_values = values
 
+    @positional_arg_values.deleter
+    def positional_arg_values(cls):
+        _bindings.positional_arg_values = None
 
-class Variable:
+    @property
+    def kwarg_values(cls):
+        """dict[str->array[float]]: current auxiliary parameter values in this thread,
+        set in :meth:`.BaseQNode._set_variables`"""
+        return getattr(_bindings, "kwarg_values", None)
+
+    @kwarg_values.setter
+    def kwarg_values(cls, values):
+        _bindings.kwarg_values = values
+
+    @kwarg_values.deleter
+    def kwarg_values(cls):
+        _bindings.kwarg_values = None
+
+
+class Variable(metaclass=VariableType):
     """A reference to dynamically track and update circuit parameters.
 
     Represents a free quantum circuit parameter (with a non-fixed value),
@@ -88,12 +128,6 @@ class Variable:
 
     # pylint: disable=too-few-public-methods
 
-    #: array[float]: current positional parameter values, set in :meth:`.BaseQNode._set_variables`
-    positional_arg_values = None
-
-    #: dict[str->array[float]]: current auxiliary parameter values, set in :meth:`.BaseQNode._set_variables`
-    kwarg_values = None
-
     def __init__(self, idx, name=None, is_kwarg=False):
         self.idx = idx  #: int: parameter index
         self.name = name  #: str: parameter name
@@ -15,6 +15,7 @@
 This module contains the :class:`Wires` class, which takes care of wire bookkeeping.
 """
 from collections import Sequence, Iterable
+import weakref
 import numpy as np
 from numbers import Number
 
@@ -23,6 +24,16 @@ class WireError(Exception):
     """Exception raised by a :class:`~.pennylane.wires.Wire` object when it is unable to process wires."""
 
 
+# Wires objects whose labels are all integers or strings, keyed by their labels. The exact
+# types are required, since for instance ``1``, ``1.0`` and ``True`` compare equal.
+_interned = weakref.WeakValueDictionary()
+
+
+def _is_simple(labels):
+    """Whether all labels are integers or strings, so that the Wires object can be interned."""
+    return all(type(w) is int or type(w) is str for w in labels)
+
+
 def _process(wires):
     """Converts the input to a tuple of numbers or strings."""
 
@@ -30,7 +41,7 @@ def _process(wires):
         # if input is already a Wires object, just return its wire tuple
         return wires.labels
 
-    elif isinstance(wires, (Number, str)):
+    if isinstance(wires, (Number, str)):
         # interpret as a single wire
         return (wires,)
 
@@ -62,34 +73,106 @@ class Wires(Sequence):
 
     Indexing and slicing this sequence will return another ``Wires`` object.
 
+    Wires objects are immutable. Constructing a Wires object from another one returns it
+    unchanged, and Wires objects whose labels are all integers or strings are interned, so
+    that equal wires share a single object, along with its cached hash and index lookup table.
+
     Args:
          wires (Iterable[Number,str], Number): If iterable, interpreted as an ordered collection of unique objects
             representing wires. If a Number, the input is converted into an iterable of a single entry,
             and hence interpreted as a single wire.
     """
 
-    def __init__(self, wires):
+    def __new__(cls, wires):
+        if type(wires) is cls:
+            return wires
+
+        if type(wires) in (int, str):
+            return cls._from_labels((wires,), True, wires)
+
+        if type(wires) in (tuple, list, range) and _is_simple(wires):
+            return cls._from_labels(tuple(wires), True, wires)
+
+        labels = _process(wires)
+        return cls._from_labels(labels, _is_simple(labels), wires)
 
-        self._labels = _process(wires)
+    @classmethod
+    def _from_labels(cls, labels, simple, wires):
+        """Returns the Wires object with the given labels, interning it if possible.
+
+        Args:
+            labels (tuple[Number, str]): wire labels
+            simple (bool): whether all labels are integers or strings
+            wires (Any): input the labels were processed from, used in error messages
+
+        Returns:
+            Wires: the Wires object
+        """
+        if simple:
+            obj = _interned.get(labels, None)
+
+            if obj is not None:
+                return obj
 
         # check that all wires are unique
-        if len(set(self.labels)) != len(self.labels):
+        if len(set(labels)) != len(labels):
             raise WireError("Wires must be unique; got {}.".format(wires))
 
+        obj = super().__new__(cls)
+        obj._labels = labels
+        obj._simple = simple
+        obj._hash = hash(labels)
+        obj._index = None
+        obj._items = None
+
+        if simple:
+            _interned[labels] = obj
+
+        return obj
+
+    def __getnewargs__(self):
+        """Arguments passed to :meth:`__new__` when unpickling or copying."""
+        return (self._labels,)
+
+    def _lookup(self):
+        """Dictionary mapping each label to its index, built on first use."""
+        if self._index is None:
+            self._index = {w: i for i, w in enumerate(self._labels)}
+
+        return self._index
+
     def __getitem__(self, idx):
         """Method to support indexing. Returns a Wires object representing a single wire."""
+        if isinstance(idx, int):
+            return self._single()[idx]
+
         return Wires(self.labels[idx])
 
+    def _single(self):
+        """Tuple of the single-wire Wires objects of each label, built on first use."""
+        if self._items is None:
+            if len(self._labels) == 1:
+                self._items = (self,)
+            else:
+                self._items = tuple(Wires((w,)) for w in self._labels)
+
+        return self._items
+
+    def __iter__(self):
+        """Method to support iteration. Yields a Wires object representing each wire."""
+        return iter(self._single())
+
     def __len__(self):
         """Method to support ``len()``."""
-        return len(self.labels)
+        return len(self._labels)
 
     def __contains__(self, item):
         """Method checking if Wires object contains an object."""
         if isinstance(item, Wires):
-            item = item.tolist()
+            item = item.labels
         # if all wires can be found in tuple, return True, else False
-        return all(wire in self.labels for wire in item)
+        lookup = self._lookup()
+        return all(wire in lookup for wire in item)
 
     def __repr__(self):
         """Method defining the string representation of this class."""
@@ -98,13 +181,15 @@ class Wires(Sequence):
     def __eq__(self, other):
         """Method to support the '==' operator. This will also implicitly define the '!=' operator."""
         # The order is respected in comparison, so that ``assert Wires([0, 1]) != Wires([1,0])``
+        if other is self:
+            return True
         if isinstance(other, self.__class__):
             return self.labels == other.labels
         return False
 
     def __hash__(self):
         """Implements the hash function."""
-        return hash(repr(self.labels))
+        return self._hash
 
     def __add__(self, other):
         """Defines the addition to return a Wires object containing all wires of the two terms.
@@ -184,8 +269,8 @@ class Wires(Sequence):
             wire = wire.labels[0]
 
         try:
-            return self.labels.index(wire)
-        except ValueError:
+            return self._lookup()[wire]
+        except (KeyError, TypeError):
             raise WireError("Wire with label {} not found in {}.".format(wire, self))
 
     def indices(self, wires):
@@ -210,6 +295,14 @@ class Wires(Sequence):
         if not isinstance(wires, Iterable):
             return [self.index(wires)]
 
+        if isinstance(wires, Wires):
+            lookup = self._lookup()
+
+            try:
+                return [lookup[w] for w in wires.labels]
+            except KeyError:
+                pass
+
         return [self.index(w) for w in wires]
 
     def map(self, wire_map):
@@ -225,8 +318,10 @@ class Wires(Sequence):
         >>> wires.map(wire_map)
         <Wires = [4, 2, 3]>
         """
-        # Make sure wire_map has `Wires` keys and values so that the `in` operator always works
-        wire_map = {Wires(k): Wires(v) for k, v in wire_map.items()}
+        # Make sure wire_map has `Wires` keys and values so that the `in` operator always works.
+        # Since Wires objects are immutable, wire maps with Wires keys and values are used as is.
+        if not all(type(k) is Wires and type(v) is Wires for k, v in wire_map.items()):
+            wire_map = {Wires(k): Wires(v) for k, v in wire_map.items()}
 
         for w in self:
             if w not in wire_map:
@@ -289,8 +384,8 @@ class Wires(Sequence):
                     "Cannot subset wire at index {} from {} wires.".format(i, len(self.labels))
                 )
 
-        subset = [self.labels[i] for i in indices]
-        return Wires(subset)
+        subset = tuple(self.labels[i] for i in indices)
+        return Wires._from_labels(subset, self._simple, list(subset))
 
     def select_random(self, n_samples, seed=None):
         """
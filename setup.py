@@ -43,9 +43,11 @@ info = {
             'default.gaussian = pennylane.devices:DefaultGaussian',
             'default.qubit.tf = pennylane.devices.default_qubit_tf:DefaultQubitTF',
             'default.qubit.autograd = pennylane.devices.default_qubit_autograd:DefaultQubitAutograd',
+            'default.qubit.parallel = pennylane.devices.default_qubit_parallel:DefaultQubitParallel',
             'default.tensor = pennylane.beta.devices.default_tensor:DefaultTensor',
             'default.tensor.tf = pennylane.beta.devices.default_tensor_tf:DefaultTensorTF',
-            'default.mixed = pennylane.devices.default_mixed:DefaultMixed'
+            'default.mixed = pennylane.devices.default_mixed:DefaultMixed',
+            'default.clifford = pennylane.devices.default_clifford:DefaultClifford'
             ],
         'console_scripts': [
                 'pl-device-test=pennylane.devices.tests:cli'
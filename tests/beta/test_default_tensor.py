@@ -18,6 +18,8 @@ import cmath
 
 # pylint: disable=protected-access,cell-var-from-loop
 import math
+import os
+import threading
 
 import pytest
 
@@ -57,6 +59,8 @@ from pennylane.beta.devices.numpy_ops import (
 
 tn = pytest.importorskip("tensornetwork", minversion="0.3")
 
+from pennylane.beta.devices import default_tensor
+
 U = np.array(
     [
         [0.83645892 - 0.40533293j, -0.20215326 + 0.30850569j],
@@ -763,55 +767,323 @@ class TestDefaultTensorMPSExceptions:
         ):
             dev._add_initial_state_nodes(tensors, wires, names)
 
-    @pytest.mark.parametrize("wires", [[0, 1, 2], [3, 2, 4], [3, 4, 5]])
-    def test_ev_mps_observable_more_than_two_wires_exception(self, wires):
-        """Tests that the _ev_mps method raises an exception if the observable is distributed across
-        more than two wires."""
 
-        dev = qml.device("default.tensor", wires=6, representation="mps")
-        obs_node = tn.Node(np.eye(8).reshape(2, 2, 2, 2, 2, 2))
-        with pytest.raises(
-            NotImplementedError,
-            match="Multi-wire measurement only supported for nearest-neighbour wire pairs.",
-        ):
-            dev._ev_mps([obs_node], [wires])
+class TestDefaultTensorMPS:
+    """Tests for the gate application and measurement of the "mps" representation"""
+
+    @staticmethod
+    def exact_state(dev):
+        """Returns the dense state vector of an MPS device"""
+        tensors = [node.tensor for node in dev.mps.nodes]
+        state = tensors[0]
+        for tensor in tensors[1:]:
+            state = np.tensordot(state, tensor, axes=[[-1], [0]])
+        return state.reshape([2] * dev.num_wires)
+
+    @staticmethod
+    def check_canonical(dev, tol):
+        """Checks that the MPS is in mixed-canonical form"""
+        center = dev.mps.center_position
+        for site, node in enumerate(dev.mps.nodes):
+            A = node.tensor
+            if site < center:
+                assert np.allclose(np.einsum("abc,abd->cd", A.conj(), A), np.eye(A.shape[2]), atol=tol)
+            elif site > center:
+                assert np.allclose(np.einsum("abc,dbc->ad", A.conj(), A), np.eye(A.shape[0]), atol=tol)
 
-    @pytest.mark.parametrize("wires", [Wires([0, 2]), Wires([4, 1]), Wires([3, 5])])
-    def test_ev_mps_observable_two_wires_non_consecutive_exception(self, wires):
-        """Tests that the _ev_mps method raises an exception if the observable is distributed across
-        two non-consecutive wires."""
+    @pytest.mark.parametrize(
+        "gate,wires",
+        [
+            ("CNOT", [0, 1]),
+            ("CNOT", [1, 0]),
+            ("CNOT", [0, 4]),
+            ("CRX", [5, 2]),
+            ("SWAP", [1, 3]),
+            ("Toffoli", [0, 1, 2]),
+            ("Toffoli", [4, 0, 2]),
+            ("CSWAP", [5, 3, 0]),
+        ],
+    )
+    def test_multi_wire_gates_agree_with_exact(self, gate, wires, tol):
+        """Tests that multi-wire gates on arbitrary wires give the same state as the
+        exact representation, and preserve the canonical form"""
+        np.random.seed(42)
+        angles = np.random.random(6)
+        par = [0.543] if gate == "CRX" else []
+
+        devs = {}
+        for rep in ("exact", "mps"):
+            dev = qml.device("default.tensor", wires=6, representation=rep)
+            for w in range(6):
+                dev.apply("RY", Wires([w]), [angles[w]])
+            dev.apply("CNOT", Wires([2, 3]), [])
+            dev.apply(gate, Wires(wires), par)
+            devs[rep] = dev
+
+        expected = devs["exact"]._state()
+        assert np.allclose(self.exact_state(devs["mps"]), expected, atol=tol, rtol=0)
+        self.check_canonical(devs["mps"], tol)
+
+    @pytest.mark.parametrize("wires", [Wires([0, 2]), Wires([4, 1]), Wires([3, 5]), Wires([0, 1, 2])])
+    def test_ev_mps_multi_wire_observable(self, wires, tol):
+        """Tests that observables on arbitrary wires give the same expectation value
+        as the exact representation"""
+        np.random.seed(42)
+        angles = np.random.random(6)
+        A = np.random.random([2 ** len(wires)] * 2) + 1j * np.random.random([2 ** len(wires)] * 2)
+        A = A + A.conj().T
+
+        res = []
+        for rep in ("exact", "mps"):
+            dev = qml.device("default.tensor", wires=6, representation=rep)
+            for w in range(6):
+                dev.apply("RX", Wires([w]), [angles[w]])
+            for w in range(5):
+                dev.apply("CNOT", Wires([w, w + 1]), [])
+            res.append(dev.expval("Hermitian", wires, [A]))
+
+        assert np.allclose(res[0], res[1], atol=tol, rtol=0)
+
+    def test_max_bond_dim(self):
+        """Tests that the bond dimension of the MPS is bounded by ``max_bond_dim``"""
+        dev = qml.device("default.tensor", wires=8, representation="mps", max_bond_dim=2)
+
+        np.random.seed(42)
+        for layer in range(3):
+            for w in range(8):
+                dev.apply("RY", Wires([w]), [np.random.random()])
+            for w in range(7):
+                dev.apply("CNOT", Wires([w, w + 1]), [])
+
+        assert max(dev.mps.bond_dimensions) == 2
+
+    def test_vanishing_singular_values_discarded(self):
+        """Tests that entangling gates which do not create entanglement do not increase
+        the bond dimension of the MPS"""
+        dev = qml.device("default.tensor", wires=10, representation="mps")
+
+        for w in range(10):
+            dev.apply("Hadamard", Wires([w]), [])
+        for w in range(9):
+            dev.apply("CNOT", Wires([w, w + 1]), [])
+        dev.apply("CNOT", Wires([0, 9]), [])
+
+        assert max(dev.mps.bond_dimensions) == 1
+
+    def test_large_low_entanglement_circuit(self, tol):
+        """Tests that a GHZ state on many qubits can be simulated"""
+        dev = qml.device("default.tensor", wires=60, representation="mps")
 
-        dev = qml.device("default.tensor", wires=6, representation="mps")
-        obs_node = tn.Node(np.eye(4).reshape(2, 2, 2, 2))
-        with pytest.raises(
-            NotImplementedError,
-            match="Multi-wire measurement only supported for nearest-neighbour wire pairs.",
-        ):
-            dev._ev_mps([obs_node], [wires])
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            for w in range(59):
+                qml.CNOT(wires=[w, w + 1])
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(59)), qml.expval(qml.PauliX(30))
 
-    @pytest.mark.parametrize("wires", [Wires([0, 1, 2]), Wires([3, 2, 4]), Wires([3, 4, 5]), Wires([0, 2, 4, 1])])
-    def test_add_gate_nodes_more_than_two_wires_exception(self, wires):
-        """Tests that the _add_gate_nodes method raises an exception if the gate is distributed across
-        more than two wires."""
+        assert np.allclose(circuit(), [1, 0], atol=tol, rtol=0)
+        assert max(dev.mps.bond_dimensions) == 2
 
-        dev = qml.device("default.tensor", wires=6, representation="mps")
-        with pytest.raises(
-            NotImplementedError,
-            match="Multi-wire gates only supported for nearest-neighbour wire pairs.",
-        ):
-            dev._add_gate_nodes("Hermitian", wires, [np.eye(2 ** len(wires))])
 
-    @pytest.mark.parametrize("wires", [Wires([0, 2]), Wires([3, 1]), Wires([3, 5]), Wires([0, 4])])
-    def test_add_gate_nodes_two_wires_non_consecutive_exception(self, wires):
-        """Tests that the _add_gate_nodes method raises an exception if the gate is distributed across
-        two non-consecutive wires."""
+class TestContractionPathCache:
+    """Tests for the caching of contraction paths of the "exact" representation"""
 
-        dev = qml.device("default.tensor", wires=6, representation="mps")
-        with pytest.raises(
-            NotImplementedError,
-            match="Multi-wire gates only supported for nearest-neighbour wire pairs.",
-        ):
-            dev._add_gate_nodes("CNOT", wires, [])
+    @staticmethod
+    def circuit(dev, x, y):
+        """Applies a circuit to the device and returns its state"""
+        dev.reset()
+        dev.apply("RX", Wires([0]), [x])
+        dev.apply("CNOT", Wires([0, 1]), [])
+        dev.apply("RY", Wires([1]), [y])
+        dev.apply("CNOT", Wires([1, 2]), [])
+        return dev._state()
+
+    @pytest.mark.parametrize("method", ["auto", "greedy", "branch", "optimal"])
+    def test_path_searched_once_per_structure(self, method, monkeypatch):
+        """Tests that the contraction path is only searched for once for circuits
+        with the same structure and different parameters"""
+        dev = qml.device("default.tensor", wires=3, contraction_method=method)
+        algorithm = default_tensor.path_algorithms[method]
+        calls = []
+
+        def spy(*args, **kwargs):
+            calls.append(args)
+            return algorithm(*args, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setitem(default_tensor.path_algorithms, method, spy)
+            self.circuit(dev, 0.1, 0.2)
+            self.circuit(dev, 0.3, 0.4)
+            assert len(calls) == 1
+
+            # a different structure requires a new path
+            dev.reset()
+            dev.apply("CNOT", Wires([2, 0]), [])
+            dev._state()
+            assert len(calls) == 2
+
+    def test_cached_path_gives_correct_state(self, tol):
+        """Tests that the state obtained with a cached contraction path is correct"""
+        dev = qml.device("default.tensor", wires=3)
+        ref = qml.device("default.tensor", wires=3)
+
+        self.circuit(dev, 0.1, 0.2)
+        res = self.circuit(dev, 0.5, -0.3)
+        ref._contraction_paths.clear()
+        expected = self.circuit(ref, 0.5, -0.3)
+
+        assert len(dev._contraction_paths) == 1
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        ket = np.zeros(8)
+        ket[0] = 1
+        RX = np.kron(np.kron(Rotx(0.5), np.eye(2)), np.eye(2))
+        RY = np.kron(np.kron(np.eye(2), Roty(-0.3)), np.eye(2))
+        CNOT01 = np.kron(CNOT, np.eye(2))
+        CNOT12 = np.kron(np.eye(2), CNOT)
+        expected = CNOT12 @ RY @ CNOT01 @ RX @ ket
+
+        assert np.allclose(res.flatten(), expected, atol=tol, rtol=0)
+
+    def test_contraction_method_change(self):
+        """Tests that changing the contraction method searches for a new path"""
+        dev = qml.device("default.tensor", wires=3, contraction_method="greedy")
+        self.circuit(dev, 0.1, 0.2)
+
+        dev.contraction_method = "optimal"
+        self.circuit(dev, 0.1, 0.2)
+
+        assert len(dev._contraction_paths) == 2
+
+
+    def test_path_cache_bounded(self, monkeypatch):
+        """Tests that the least recently used paths are evicted once the cache is full"""
+        dev = qml.device("default.tensor", wires=3)
+        monkeypatch.setattr(default_tensor, "PATH_CACHE_SIZE", 2)
+
+        def contract(wires):
+            dev.reset()
+            dev.apply("RX", Wires([0]), [0.1])
+            dev.apply("CNOT", Wires(wires), [])
+            dev._state()
+            return list(dev._contraction_paths)[-1]
+
+        first = contract([0, 1])
+        contract([1, 2])
+        contract([0, 1])
+        third = contract([0, 2])
+
+        assert list(dev._contraction_paths) == [first, third]
+
+class TestExactExpectationNetwork:
+    """Tests for the contraction of expectation values of the "exact" representation"""
+
+    def test_light_cone_nodes(self, monkeypatch):
+        """Tests that only the nodes in the light cone of the measured wires are contracted"""
+        dev = qml.device("default.tensor", wires=4)
+        dev.apply("RX", Wires([0]), [0.1])
+        dev.apply("RX", Wires([3]), [0.2])
+        dev.apply("CNOT", Wires([0, 1]), [])
+        dev.apply("CNOT", Wires([2, 3]), [])
+        dev.apply("RY", Wires([1]), [0.3])
+
+        contracted = []
+        contract = dev._contract_exact_network
+
+        def spy(nodes, output_edge_order):
+            contracted.extend(node.name for node in nodes)
+            return contract(nodes, output_edge_order)
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "_contract_exact_network", spy)
+            dev.expval("PauliZ", Wires([1]), [])
+
+        assert set(contracted) == {
+            "PauliZ(1,)",
+            "ZeroState(0,)",
+            "BraZeroState(0,)",
+            "ZeroState(1,)",
+            "BraZeroState(1,)",
+            "RX(0,)",
+            "BraRX(0,)",
+            "CNOT(0, 1)",
+            "BraCNOT(0, 1)",
+            "RY(1,)",
+            "BraRY(1,)",
+        }
+
+    def test_many_wires_local_observable(self, tol):
+        """Tests that local expectation values of circuits on many wires can be computed"""
+        dev = qml.device("default.tensor", wires=40)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            for w in range(40):
+                qml.RX(x, wires=w)
+            for w in range(0, 40, 2):
+                qml.CNOT(wires=[w, w + 1])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1) @ qml.PauliZ(38))
+
+        x = 0.432
+        expected = [np.cos(x), np.cos(x) ** 2 * np.cos(x)]
+        assert np.allclose(circuit(x), expected, atol=tol, rtol=0)
+
+    def test_expvals_contracted_concurrently(self, tol, monkeypatch):
+        """Tests that the expectation values of several observables are contracted
+        on a thread pool before they are returned, while the observable nodes are added
+        to the network by the calling thread"""
+        dev = qml.device("default.tensor", wires=3)
+        node_threads = []
+        ev_threads = []
+        observable_nodes = dev._observable_nodes
+        ev = dev.ev
+
+        def spy_nodes(*args):
+            node_threads.append(threading.current_thread())
+            return observable_nodes(*args)
+
+        def spy_ev(*args):
+            ev_threads.append(threading.current_thread())
+            return ev(*args)
+
+        @qml.qnode(dev)
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=1)
+            qml.CNOT(wires=[0, 2])
+            return (
+                qml.expval(qml.PauliZ(0)),
+                qml.expval(qml.PauliX(1)),
+                qml.var(qml.PauliZ(2)),
+            )
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "_observable_nodes", spy_nodes)
+            m.setattr(dev, "ev", spy_ev)
+            res = circuit(0.1, 0.2)
+
+        assert node_threads == [threading.main_thread()] * 2
+        assert sum(t is not threading.main_thread() for t in ev_threads) == 2
+        assert len(dev._nodes["observables"]) == 4
+        assert dev._expvals == {}
+        assert np.allclose(res, [np.cos(0.1), np.sin(0.2), np.sin(0.1) ** 2], atol=tol, rtol=0)
+
+    def test_executor_shared(self, tol):
+        """Tests that the thread pool is shared by the devices"""
+        devs = [qml.device("default.tensor", wires=2) for _ in range(2)]
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        qml.QNode(circuit, devs[0])(0.1)
+        executor = default_tensor._executor
+        res = qml.QNode(circuit, devs[1])(0.2)
+
+        assert executor is not None
+        assert default_tensor._get_executor() is executor
+        assert executor._max_workers == os.cpu_count()
+        assert np.allclose(res, [np.cos(0.2), 1], atol=tol, rtol=0)
 
 
 @pytest.mark.parametrize("rep", ("exact", "mps"))
@@ -977,8 +1249,6 @@ class TestDefaultTensorIntegration:
     def test_supported_gate_three_wires_no_parameters(self, rep, tol, name, expected_output):
         """Tests supported gates that act on three wires that are not parameterized"""
 
-        if rep == "mps":
-            pytest.skip("Three-qubit gates are not supported with MPS representation.")
         dev = qml.device("default.tensor", wires=3, representation=rep)
         op = getattr(qml.ops, name)
 
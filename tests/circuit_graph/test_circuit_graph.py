@@ -17,6 +17,7 @@ Unit tests for the :mod:`pennylane.circuit_graph` module.
 # pylint: disable=no-self-use,too-many-arguments,protected-access
 
 import pytest
+import networkx as nx
 import numpy as np
 
 import pennylane as qml
@@ -130,6 +131,51 @@ class TestCircuitGraph:
         descendants = circuit.descendants([ops[6]])
         assert descendants == set([ops[8]])
 
+    def test_graph_created_lazily(self, ops, mocker):
+        """Test that the networkx graph is only created when requested, and kept in sync
+        with node updates"""
+        spy = mocker.spy(nx, "DiGraph")
+        circuit = CircuitGraph(ops, {}, Wires([0, 1, 2]))
+        circuit.ancestors([ops[6]])
+        circuit.nodes_between(ops[0], ops[8])
+        spy.assert_not_called()
+
+        graph = circuit.graph
+        assert circuit.graph is graph
+        spy.assert_called_once()
+
+        new = qml.RX(0.1, wires=0)
+        circuit.update_node(ops[0], new)
+        assert new in circuit.graph.nodes
+        assert ops[0] not in circuit.graph.nodes
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_agreement_with_networkx(self, seed):
+        """Test that the ancestors, descendants and nodes between operators agree with
+        networkx traversals of the graph for random circuits"""
+        np.random.seed(seed)
+        ops = []
+
+        for _ in range(30):
+            wires = np.random.choice(5, size=np.random.randint(1, 4), replace=False)
+            ops.append(qml.QubitUnitary(np.eye(2 ** len(wires)), wires=wires.tolist()))
+
+        circuit = CircuitGraph(ops, {}, Wires(range(5)))
+        graph = circuit.graph
+
+        for op in ops:
+            assert circuit.ancestors([op]) == nx.ancestors(graph, op)
+            assert circuit.descendants([op]) == nx.descendants(graph, op)
+
+        for a, b in [(ops[0], ops[-1]), (ops[3], ops[20]), (ops[10], ops[12])]:
+            expected = nx.descendants(graph, a) | {a}
+            expected &= nx.ancestors(graph, b) | {b}
+            assert circuit.nodes_between(a, b) == expected
+
+        assert circuit.ancestors(ops[5:8]) == set().union(
+            *(nx.ancestors(graph, op) for op in ops[5:8])
+        ) - set(ops[5:8])
+
     def test_update_node(self, ops):
         """Changing nodes in the graph."""
 
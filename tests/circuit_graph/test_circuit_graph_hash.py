@@ -19,7 +19,7 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.operation import Tensor
-from pennylane.circuit_graph import CircuitGraph
+from pennylane.circuit_graph import CircuitGraph, _op_signature
 from pennylane.qnodes import BaseQNode
 from pennylane.variable import Variable
 from pennylane.wires import Wires
@@ -190,6 +190,53 @@ class TestCircuitGraphHash:
         assert expected_string == circuit_graph_1.serialize()
 
 
+    def test_hash_cached(self, mocker):
+        """Tests that the hash is only computed once"""
+        circuit_graph = CircuitGraph([qml.RX(0.3, wires=[0])], {}, Wires([0]))
+        spy = mocker.patch("pennylane.circuit_graph._op_signature", wraps=_op_signature)
+
+        assert circuit_graph.hash == circuit_graph.hash
+        assert spy.call_count == 1
+
+    def test_hash_update_node(self):
+        """Tests that the hash is recomputed after a node is replaced"""
+        op = qml.RX(0.3, wires=[0])
+        circuit_graph = CircuitGraph([op], {}, Wires([0]))
+        h = circuit_graph.hash
+
+        circuit_graph.update_node(op, qml.RX(0.4, wires=[0]))
+        assert circuit_graph.hash != h
+
+        circuit_graph.update_node(circuit_graph.operations[0], qml.RX(0.3, wires=[0]))
+        assert circuit_graph.hash == h
+
+    def test_hash_array_parameters(self):
+        """Tests that numeric array parameters contribute their values to the hash"""
+        ops1 = [qml.QubitUnitary(np.eye(2), wires=[0])]
+        ops2 = [qml.QubitUnitary(np.eye(2), wires=[0])]
+        ops3 = [qml.QubitUnitary(np.diag([1, -1]), wires=[0])]
+
+        hashes = [CircuitGraph(ops, {}, Wires([0])).hash for ops in (ops1, ops2, ops3)]
+        assert hashes[0] == hashes[1]
+        assert hashes[0] != hashes[2]
+
+    def test_parameter_fingerprint(self):
+        """Tests that the parameter fingerprint depends on the values bound to free
+        parameters, while the hash does not"""
+        Variable.positional_arg_values = np.array([0.1, 0.2])
+        circuit_graph = CircuitGraph(
+            [qml.RX(Variable(0), wires=[0]), qml.RY(Variable(1), wires=[0])], {}, Wires([0])
+        )
+        h = circuit_graph.hash
+        fingerprint = circuit_graph.parameter_fingerprint()
+
+        assert circuit_graph.parameter_fingerprint() == fingerprint
+
+        Variable.positional_arg_values = np.array([0.1, 0.3])
+        assert circuit_graph.parameter_fingerprint() != fingerprint
+        assert circuit_graph.hash == h
+
+
 class TestQNodeCircuitHashIntegration:
     """Test for the circuit hash that is being created for a QNode during evaluation (inside of _construct)"""
 
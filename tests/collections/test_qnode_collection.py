@@ -14,6 +14,7 @@
 """
 Unit tests for the :mod:`pennylane.QNodeCollection`
 """
+import asyncio
 from collections.abc import Sequence
 
 import numpy as onp
@@ -21,6 +22,7 @@ import pytest
 from pennylane import numpy as np
 
 import pennylane as qml
+from pennylane.collections.qnode_collection import _clone_device
 
 try:
     import torch
@@ -287,3 +289,139 @@ class TestEvalation:
             expected = tape.gradient(cost, params).numpy()
 
         assert np.all(res == expected)
+
+
+def ansatz(params, wires):
+    """Ansatz used by the parallel evaluation tests"""
+    qml.RX(params[0], wires=wires[0])
+    qml.RY(params[1], wires=wires[1])
+    qml.CNOT(wires=wires)
+
+
+OBSERVABLES = [
+    qml.PauliZ(0),
+    qml.PauliX(1),
+    qml.PauliZ(0) @ qml.PauliZ(1),
+    qml.PauliY(0),
+    qml.PauliZ(1),
+    qml.PauliX(0) @ qml.PauliX(1),
+    qml.Identity(0),
+]
+
+
+class TestParallelEvaluation:
+    """Tests for the parallel evaluation of QNodeCollections without Dask"""
+
+    def test_without_dask(self, monkeypatch, tol):
+        """Test that the threads and processes schedulers do not require Dask"""
+        dev = qml.device("default.qubit", wires=2)
+        qc = qml.map(ansatz, OBSERVABLES, dev, interface=None)
+        params = [0.5643, -0.45]
+        expected = qc(params)
+
+        monkeypatch.setitem(__import__("sys").modules, "dask", None)
+
+        for scheduler in ["threads", "processes"]:
+            res = qc(params, parallel=True, scheduler=scheduler)
+            assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_shared_device(self, tol):
+        """Test that QNodes sharing a device are evaluated correctly in parallel"""
+        dev = qml.device("default.qubit", wires=2)
+        qc = qml.map(ansatz, OBSERVABLES, dev)
+
+        for params in [[0.5643, -0.45], [0.1, 0.2], [-1.2, 0.7]]:
+            expected = qc(params)
+
+            for _ in range(3):
+                res = qc(params, parallel=True)
+                assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_shared_device_settings_changed(self):
+        """Test that the clones of a shared device follow changes of its settings"""
+        dev = qml.device("default.qubit", wires=2)
+        qc = qml.map(ansatz, OBSERVABLES, dev, measure="sample", interface=None)
+        params = [0.5643, -0.45]
+
+        assert all(len(r) == 1000 for r in qc(params, parallel=True))
+
+        dev.shots = 10
+        assert all(len(r) == 10 for r in qc(params, parallel=True))
+
+    def test_clone_device(self):
+        """Test that a device is only cloned again if its settings changed"""
+        dev = qml.device("default.qubit", wires=2)
+        clone = _clone_device(dev)
+
+        assert clone is not dev
+        assert _clone_device(dev) is clone
+
+        dev.shots = 10
+        clone = _clone_device(dev)
+        assert clone.shots == 10
+        assert _clone_device(dev) is clone
+
+        dev.analytic = False
+        assert not _clone_device(dev).analytic
+
+    def test_shared_device_not_copyable(self, monkeypatch, tol):
+        """Test that QNodes sharing a device that cannot be copied are evaluated correctly"""
+
+        def deepcopy(*args, **kwargs):
+            raise TypeError("device cannot be copied")
+
+        dev = qml.device("default.qubit", wires=2)
+        qc = qml.map(ansatz, OBSERVABLES, dev, interface=None)
+        params = [0.5643, -0.45]
+        expected = qc(params)
+
+        monkeypatch.setattr("copy.deepcopy", deepcopy)
+        res = qc(params, parallel=True)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_gradient(self, tol):
+        """Test that the gradient of a collection evaluated in parallel is correct"""
+        dev = qml.device("default.qubit", wires=2)
+        qc = qml.map(ansatz, OBSERVABLES, dev)
+        params = np.array([0.5643, -0.45])
+
+        expected = qml.grad(lambda x: np.sum(qc(x)))(params)
+        res = qml.grad(lambda x: np.sum(qc(x, parallel=True)))(params)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_processes_gradient(self):
+        """Test that an exception is raised when computing gradients using processes"""
+        dev = qml.device("default.qubit", wires=2)
+        qc = qml.map(ansatz, OBSERVABLES, dev)
+        params = np.array([0.5643, -0.45])
+
+        with pytest.raises(ValueError, match="cannot be evaluated in parallel processes"):
+            qml.grad(lambda x: np.sum(qc(x, parallel=True, scheduler="processes")))(params)
+
+
+class TestGather:
+    """Tests for the asynchronous evaluation of QNodeCollections"""
+
+    @pytest.mark.parametrize("interface", ["autograd", "numpy", "torch", "tf"])
+    def test_gather(self, qnodes, interface, tol):
+        """Test that the asynchronous evaluation agrees with the synchronous one"""
+        qnode1, qnode2 = qnodes
+        qc = qml.QNodeCollection([qnode1, qnode2])
+        params = [0.5643, -0.45]
+
+        res = asyncio.run(qc.gather(params))
+        expected = qc(params)
+
+        if interface in ("torch", "tf"):
+            res, expected = res.numpy(), expected.numpy()
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_shared_device(self, tol):
+        """Test that QNodes sharing a device are evaluated correctly"""
+        dev = qml.device("default.qubit", wires=2)
+        qc = qml.map(ansatz, OBSERVABLES, dev)
+        params = [0.5643, -0.45]
+
+        res = asyncio.run(qc.gather(params))
+        assert np.allclose(res, qc(params), atol=tol, rtol=0)
@@ -161,5 +161,5 @@ def mock_device(monkeypatch):
 @pytest.fixture
 def tear_down_hermitian():
     yield None
-    qml.Hermitian._eigs = {}
+    qml.Hermitian._eigs.clear()
 
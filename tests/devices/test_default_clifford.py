@@ -0,0 +1,278 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.devices.DefaultClifford` device.
+"""
+import pytest
+import numpy as np
+
+import pennylane as qml
+from pennylane import DeviceError
+from pennylane.devices.default_clifford import DefaultClifford, _gf2_row_reduce
+
+
+PAULIS = {"I": qml.Identity, "X": qml.PauliX, "Y": qml.PauliY, "Z": qml.PauliZ}
+
+
+def random_clifford_circuit(num_wires, depth, seed):
+    """Returns a random sequence of Clifford gates as (gate, wires, inverse) tuples."""
+    rng = np.random.RandomState(seed)
+    gates = [
+        ("Hadamard", 1),
+        ("S", 1),
+        ("PauliX", 1),
+        ("PauliY", 1),
+        ("PauliZ", 1),
+        ("CNOT", 2),
+        ("CZ", 2),
+        ("SWAP", 2),
+    ]
+    circuit = []
+
+    for _ in range(depth):
+        name, num = gates[rng.randint(len(gates))]
+        wires = [int(w) for w in rng.choice(num_wires, num, replace=False)]
+        circuit.append((name, wires, bool(rng.randint(2))))
+
+    return circuit
+
+
+def apply_circuit(circuit):
+    """Queues the gates of a circuit generated by ``random_clifford_circuit``."""
+    for name, wires, inverse in circuit:
+        op = getattr(qml, name)(wires=wires)
+        if inverse:
+            op.inv()
+
+
+def pauli_word(word):
+    """Returns the tensor product observable of a string such as ``"XIZY"``."""
+    obs = PAULIS[word[0]](wires=0)
+    for wire, p in enumerate(word[1:], start=1):
+        obs = obs @ PAULIS[p](wires=wire)
+    return obs
+
+
+class TestTableau:
+    """Tests for the stabilizer tableau and its updates"""
+
+    def test_initial_tableau(self):
+        """Tests that the device starts in the all-zero state, stabilized by Z on every qubit"""
+        dev = DefaultClifford(wires=3)
+        assert np.all(dev._x == 0)
+        assert np.all(dev._z == np.eye(3))
+        assert np.all(dev._r == 0)
+
+    def test_reset(self):
+        """Tests that reset restores the initial tableau"""
+        dev = DefaultClifford(wires=2)
+        dev.apply([qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1]), qml.PauliX(wires=1)])
+        dev.reset()
+
+        assert np.all(dev._x == 0)
+        assert np.all(dev._z == np.eye(2))
+        assert np.all(dev._r == 0)
+        assert dev._outcomes is None
+
+    def test_bell_state_stabilizers(self):
+        """Tests that the Bell state is stabilized by XX and ZZ"""
+        dev = DefaultClifford(wires=2)
+        dev.apply([qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1])])
+
+        rows = {(tuple(x), tuple(z), r) for x, z, r in zip(dev._x, dev._z, dev._r)}
+        assert rows == {((1, 1), (0, 0), 0), ((0, 0), (1, 1), 0)}
+
+    def test_basis_state(self):
+        """Tests that BasisState prepares the corresponding computational basis state"""
+        dev = DefaultClifford(wires=3)
+        dev.apply([qml.BasisState(np.array([1, 0, 1]), wires=[0, 1, 2])])
+
+        offset, generators = dev.measurement_outcomes()
+        assert np.all(offset == [1, 0, 1])
+        assert generators.shape == (0, 3)
+
+    def test_basis_state_not_first(self):
+        """Tests that an exception is raised if BasisState is not the first operation"""
+        dev = DefaultClifford(wires=2)
+
+        with pytest.raises(DeviceError, match="cannot be used after other Operations"):
+            dev.apply([qml.PauliX(wires=0), qml.BasisState(np.array([1, 1]), wires=[0, 1])])
+
+    def test_basis_state_invalid(self):
+        """Tests that an exception is raised for a BasisState with invalid parameters"""
+        dev = DefaultClifford(wires=2)
+
+        with pytest.raises(ValueError, match="must consist of 0 or 1 integers"):
+            dev.apply([qml.BasisState(np.array([2, 0]), wires=[0, 1])])
+
+        with pytest.raises(ValueError, match="must be of equal length"):
+            dev.apply([qml.BasisState(np.array([1]), wires=[0, 1])])
+
+    def test_non_clifford_gate(self):
+        """Tests that non-Clifford gates are rejected"""
+        dev = qml.device("default.clifford", wires=1)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.RX(0.3, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(DeviceError, match="not supported on device"):
+            circuit()
+
+    def test_outcomes_cached(self):
+        """Tests that the measurement outcomes are only computed once per circuit"""
+        dev = DefaultClifford(wires=2)
+        dev.apply([qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1])])
+
+        assert dev.measurement_outcomes() is dev.measurement_outcomes()
+
+        dev.apply([qml.PauliX(wires=0)])
+        assert dev._outcomes is None
+
+
+def test_gf2_row_reduce():
+    """Tests the row reduction over GF(2)"""
+    matrix = np.array([[1, 1, 0], [1, 1, 0], [0, 1, 1]], dtype=bool)
+    rhs = np.array([1, 1, 0], dtype=bool)
+    reduced, reduced_rhs, pivots = _gf2_row_reduce(matrix, rhs)
+
+    assert pivots == [0, 1]
+    assert np.all(reduced == [[1, 0, 1], [0, 1, 1], [0, 0, 0]])
+    assert np.all(reduced_rhs == [1, 0, 0])
+
+
+class TestAgreementWithDefaultQubit:
+    """Tests that the stabilizer simulation agrees with the state vector simulation"""
+
+    @pytest.mark.parametrize("seed", range(10))
+    @pytest.mark.parametrize("word", ["ZIII", "XXXX", "YZIX", "IYYI", "ZXYZ"])
+    def test_expval(self, seed, word, tol):
+        """Tests expectation values of Pauli words"""
+        circuit = random_clifford_circuit(4, 20, seed)
+
+        def qfunc():
+            apply_circuit(circuit)
+            return qml.expval(pauli_word(word))
+
+        expected = qml.QNode(qfunc, qml.device("default.qubit", wires=4))()
+        res = qml.QNode(qfunc, qml.device("default.clifford", wires=4))()
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_var(self, seed, tol):
+        """Tests variances of single-qubit Pauli observables"""
+        circuit = random_clifford_circuit(3, 15, seed)
+
+        def qfunc():
+            apply_circuit(circuit)
+            return qml.var(qml.PauliX(0)), qml.var(qml.PauliY(1)), qml.var(qml.PauliZ(2))
+
+        expected = qml.QNode(qfunc, qml.device("default.qubit", wires=3))()
+        res = qml.QNode(qfunc, qml.device("default.clifford", wires=3))()
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("seed", range(10))
+    @pytest.mark.parametrize("wires", [[0], [2, 0], [1, 2, 3], [0, 1, 2, 3]])
+    def test_probs(self, seed, wires, tol):
+        """Tests marginal probabilities in the computational basis"""
+        circuit = random_clifford_circuit(4, 20, seed)
+
+        def qfunc():
+            apply_circuit(circuit)
+            return qml.probs(wires=wires)
+
+        expected = qml.QNode(qfunc, qml.device("default.qubit", wires=4))()
+        res = qml.QNode(qfunc, qml.device("default.clifford", wires=4))()
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_custom_wire_labels(self, tol):
+        """Tests that custom wire labels are supported"""
+
+        def qfunc():
+            qml.Hadamard(wires="a")
+            qml.CNOT(wires=["a", -1])
+            qml.S(wires=-1)
+            return qml.expval(qml.PauliY("a") @ qml.PauliX(-1)), qml.expval(qml.PauliZ("b"))
+
+        wires = ["b", -1, "a"]
+        expected = qml.QNode(qfunc, qml.device("default.qubit", wires=wires))()
+        res = qml.QNode(qfunc, qml.device("default.clifford", wires=wires))()
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+
+class TestSampling:
+    """Tests for sampling from the device"""
+
+    def test_bell_state_samples(self):
+        """Tests that the samples of a Bell state are perfectly correlated"""
+        dev = qml.device("default.clifford", wires=2, shots=100)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.sample(qml.PauliZ(0)), qml.sample(qml.PauliZ(1))
+
+        res = circuit()
+        assert res.shape == (2, 100)
+        assert np.all(res[0] == res[1])
+        assert set(res[0]) == {-1, 1}
+
+    def test_tensor_samples(self):
+        """Tests that the samples of a Pauli word are the products of the single-qubit samples"""
+        dev = qml.device("default.clifford", wires=3, shots=50)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.CNOT(wires=[1, 2])
+            return qml.sample(qml.PauliX(0) @ qml.PauliX(1) @ qml.PauliX(2))
+
+        assert np.all(circuit() == 1)
+
+    def test_finite_shots(self):
+        """Tests expectation values estimated from samples"""
+        dev = qml.device("default.clifford", wires=3, shots=1000, analytic=False)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.Hadamard(wires=2)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1)), qml.expval(qml.PauliZ(2))
+
+        res = circuit()
+        assert res[0] == 1
+        assert np.allclose(res[1], 0, atol=0.1)
+
+    def test_many_qubits(self):
+        """Tests a GHZ state on a number of qubits far out of reach of state vector simulation"""
+        num_wires = 200
+        dev = qml.device("default.clifford", wires=num_wires, shots=10)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            for i in range(num_wires - 1):
+                qml.CNOT(wires=[i, i + 1])
+            return qml.sample(qml.PauliZ(0)), qml.sample(qml.PauliZ(num_wires - 1))
+
+        res = circuit()
+        assert np.all(res[0] == res[1])
+
+        offset, generators = dev.measurement_outcomes()
+        assert np.all(offset == 0)
+        assert np.all(generators == 1)
@@ -28,7 +28,7 @@ from pennylane.devices.default_gaussian import (
     fock_prob,
     rotation, squeezing, quadratic_phase, beamsplitter, two_mode_squeezing, controlled_addition, controlled_phase,
     vacuum_state, coherent_state, squeezed_state, displaced_squeezed_state, thermal_state,
-    DefaultGaussian)
+    covariance_factor, DefaultGaussian)
 
 
 U = np.array(
@@ -596,6 +596,108 @@ class TestSample:
             sample = gaussian_device_2_wires.sample(observable, [0], [])
 
 
+class TestJointSample:
+    """Tests for the joint homodyne and heterodyne sampling."""
+
+    def test_covariance_factor(self, tol):
+        """Test that the covariance factor reproduces the reduced covariance matrix"""
+        dev = qml.device("default.gaussian", wires=3)
+        dev.apply("TwoModeSqueezing", Wires([0, 2]), [0.8, 0.3])
+        dev.apply("Beamsplitter", Wires([1, 2]), [0.5, 0.1])
+
+        mu, L = dev.covariance_factor(Wires([2, 0]))
+        ind = np.array([2, 0, 5, 3])
+        state_mu, state_cov = dev._state
+
+        assert np.allclose(mu, state_mu[ind], atol=tol, rtol=0)
+        assert np.allclose(L @ L.T, state_cov[np.ix_(ind, ind)], atol=tol, rtol=0)
+
+    def test_covariance_factor_cached(self, monkeypatch):
+        """Test that the covariance factor is only computed once until the state changes"""
+        dev = qml.device("default.gaussian", wires=2)
+        dev.apply("Squeezing", Wires([0]), [0.5, 0.0])
+
+        calls = []
+
+        with monkeypatch.context() as m:
+            m.setattr(np.linalg, "cholesky", lambda A: calls.append(A) or np.identity(len(A)))
+            dev.covariance_factor(Wires([0, 1]))
+            dev.sample_homodyne(Wires([0, 1]), [0.0, 0.0])
+            dev.sample_homodyne(Wires([0, 1]), [0.1, 0.4])
+            assert len(calls) == 1
+
+            dev.apply("Rotation", Wires([0]), [0.2])
+            dev.covariance_factor(Wires([0, 1]))
+            assert len(calls) == 2
+
+    def test_covariance_factor_semidefinite(self, tol):
+        """Test that a singular covariance matrix is factorized"""
+        cov = np.array([[1.0, 1.0], [1.0, 1.0]])
+        L = covariance_factor(cov)
+        assert np.allclose(L @ L.T, cov, atol=tol, rtol=0)
+
+    def test_sample_homodyne_shape(self):
+        """Test that the homodyne samples have the right shape"""
+        dev = qml.device("default.gaussian", wires=3, shots=17)
+        assert dev.sample_homodyne(Wires([0, 2]), [0.0, 0.1]).shape == (17, 2)
+        assert dev.sample_homodyne(Wires([1]), [0.0], shots=4).shape == (4, 1)
+
+    def test_sample_homodyne_angle_mismatch(self):
+        """Test that an error is raised if the number of angles and modes differ"""
+        dev = qml.device("default.gaussian", wires=2)
+
+        with pytest.raises(ValueError, match="homodyne angle must be provided for each mode"):
+            dev.sample_homodyne(Wires([0, 1]), [0.0])
+
+    def test_sample_homodyne_statistics(self):
+        """Test that the joint homodyne samples reproduce the rotated means and covariances"""
+        np.random.seed(123)
+        dev = qml.device("default.gaussian", wires=2, shots=200000)
+        dev.apply("DisplacedSqueezedState", Wires([0]), [0.4, 0.2, 0.3, 0.0])
+        dev.apply("Beamsplitter", Wires([0, 1]), [0.7, 0.0])
+
+        phis = [0.3, 1.1]
+        samples = dev.sample_homodyne(Wires([0, 1]), phis)
+
+        mu, cov = dev._state
+        R = np.zeros([2, 4])
+        R[0, [0, 2]] = [np.cos(phis[0]), np.sin(phis[0])]
+        R[1, [1, 3]] = [np.cos(phis[1]), np.sin(phis[1])]
+
+        assert np.allclose(np.mean(samples, axis=0), R @ mu, atol=0.02, rtol=0)
+        assert np.allclose(np.cov(samples.T), R @ cov @ R.T, atol=0.03, rtol=0)
+
+    def test_sample_heterodyne_statistics(self):
+        """Test that the heterodyne samples of a coherent state are centered at its amplitude"""
+        np.random.seed(123)
+        alpha = 0.6 - 0.2j
+        dev = qml.device("default.gaussian", wires=1, shots=200000)
+        dev.apply("CoherentState", Wires([0]), [alpha])
+
+        samples = dev.sample_heterodyne(Wires([0]))
+
+        assert samples.shape == (200000, 1)
+        assert np.allclose(np.mean(samples), alpha, atol=0.01, rtol=0)
+        # the Q function of a coherent state has unit variance
+        assert np.allclose(np.var(samples), 1, atol=0.02, rtol=0)
+
+    def test_qnode_samples_correlated(self):
+        """Test that samples of several modes returned by a QNode are correlated shot by shot"""
+        np.random.seed(123)
+        dev = qml.device("default.gaussian", wires=2, shots=20000)
+
+        @qml.qnode(dev)
+        def circuit(r):
+            qml.TwoModeSqueezing(r, 0, wires=[0, 1])
+            return qml.sample(qml.X(0)), qml.sample(qml.QuadOperator(np.pi, wires=1))
+
+        x0, x1 = circuit(1.0)
+        # X0 and X1 are correlated, and the second mode is measured at angle pi
+        expected = -np.tanh(2.0)
+
+        assert np.allclose(np.corrcoef(x0, x1)[0, 1], expected, atol=0.01, rtol=0)
+
+
 class TestDefaultGaussianIntegration:
     """Integration tests for default.gaussian. This test ensures it integrates
     properly with the PennyLane interface, in particular QNode."""
@@ -21,7 +21,7 @@ import math
 import pytest
 import pennylane as qml
 from pennylane import numpy as np, DeviceError
-from pennylane.devices.default_qubit import _get_slice
+from pennylane.devices.default_qubit import _get_slice, INPLACE_OPS
 from pennylane.operation import Operation
 
 U = np.array(
@@ -1849,3 +1849,527 @@ class TestApplyOps:
         matrix = matrix.reshape((2, 2, 2, 2))
         state_out_einsum = np.einsum("abcd,idc->iba", matrix, self.state)
         assert np.allclose(state_out, state_out_einsum)
+
+
+def memmap_circuit(x):
+    """A circuit containing gates on leading and trailing wires, diagonal gates,
+    multi-qubit gates, inverses and a state preparation on a subset of wires."""
+    qml.QubitStateVector(np.array([1, 1j, -1, 0.5]) / np.sqrt(3.25), wires=[3, 1])
+    for i in range(5):
+        qml.RX(x[i], wires=i)
+    qml.CNOT(wires=[0, 4])
+    qml.Toffoli(wires=[4, 1, 3])
+    qml.CSWAP(wires=[2, 4, 0])
+    qml.CRZ(x[0], wires=[4, 0])
+    qml.MultiRZ(x[1], wires=[0, 3, 4])
+    qml.S(wires=2).inv()
+    qml.CRot(x[2], x[3], x[4], wires=[1, 0])
+    qml.QubitUnitary(np.kron(U, U), wires=[2, 0])
+    return [
+        qml.expval(qml.PauliX(0) @ qml.PauliY(1)),
+        qml.var(qml.Hadamard(2)),
+        qml.probs(wires=[4, 3]),
+    ]
+
+
+class TestMemmapStorage:
+    """Tests for the out-of-core state vector with ``storage="memmap"``"""
+
+    @pytest.mark.parametrize("chunk_wires", [0, 1, 3, 5, 20])
+    def test_agrees_with_memory_storage(self, chunk_wires, tol):
+        """Test that the memory-mapped state vector reproduces the in-memory simulation
+        for any chunk size"""
+        x = np.array([0.1, -0.6, 1.2, 0.4, 2.1])
+        dev = qml.device("default.qubit", wires=5)
+        dev_memmap = qml.device(
+            "default.qubit", wires=5, storage="memmap", chunk_wires=chunk_wires
+        )
+
+        expected = qml.QNode(memmap_circuit, dev)(x)
+        res = qml.QNode(memmap_circuit, dev_memmap)(x)
+
+        for r, e in zip(res, expected):
+            assert np.allclose(r, e, atol=tol, rtol=0)
+
+        assert isinstance(dev_memmap.state, np.memmap)
+        assert np.allclose(dev_memmap.state, dev.state, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("wires", [[0], [2, 0], [1, 2, 0], [3, 0, 2, 1]])
+    def test_probability(self, wires, tol):
+        """Test that the streamed marginal probabilities are correct for
+        wires in arbitrary order"""
+        state = np.arange(1, 17) / np.linalg.norm(np.arange(1, 17))
+        dev = qml.device("default.qubit", wires=4, storage="memmap", chunk_wires=2)
+        dev.apply([qml.QubitStateVector(state, wires=[0, 1, 2, 3])])
+
+        prob = np.reshape(np.abs(state) ** 2, [2] * 4)
+        traced = tuple(w for w in range(4) if w not in wires)
+        expected = np.transpose(np.sum(prob, axis=traced), np.argsort(np.argsort(wires)))
+
+        res = dev.analytic_probability(wires=wires)
+        assert np.allclose(res, expected.ravel(), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("wires", [None, [3, 1, 0, 2]])
+    def test_probability_all_wires(self, wires, tol):
+        """Test that the probabilities of more wires than span a chunk are memory-mapped"""
+        state = np.arange(1, 17) / np.linalg.norm(np.arange(1, 17))
+        dev = qml.device("default.qubit", wires=4, storage="memmap", chunk_wires=2)
+        dev.apply([qml.QubitStateVector(state, wires=[0, 1, 2, 3])])
+
+        prob = np.reshape(np.abs(state) ** 2, [2] * 4)
+        expected = np.transpose(prob, wires or [0, 1, 2, 3])
+
+        res = dev.analytic_probability(wires=wires)
+        assert isinstance(res, np.memmap)
+        assert res.shape == (16,)
+        assert np.allclose(res, expected.ravel(), atol=tol, rtol=0)
+        assert np.allclose(dev.probability(), prob.ravel(), atol=tol, rtol=0)
+
+    def test_samples(self):
+        """Test that samples are streamed from the correct distribution"""
+        dev = qml.device("default.qubit", wires=3, storage="memmap", chunk_wires=1, shots=1000)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 2])
+            qml.PauliX(wires=1)
+            return [qml.sample(qml.PauliZ(i)) for i in range(3)]
+
+        res = circuit()
+        assert np.all(res[0] == res[2])
+        assert np.all(res[1] == -1)
+        assert np.allclose(np.mean(res[0]), 0, atol=0.1)
+
+    def test_reset(self):
+        """Test that resetting the device returns a memory-mapped |0...0> state"""
+        dev = qml.device("default.qubit", wires=3, storage="memmap", chunk_wires=1)
+        dev.apply([qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1])])
+        dev.reset()
+
+        assert isinstance(dev.state, np.memmap)
+        assert np.allclose(dev.state, np.eye(8)[0])
+
+    def test_memmap_dir(self, tmpdir):
+        """Test that the state vector files are created in the requested directory, and
+        are anonymous so that nothing is left behind"""
+        dev = qml.device("default.qubit", wires=3, storage="memmap", memmap_dir=str(tmpdir))
+        dev.apply([qml.PauliX(wires=0)])
+
+        assert np.allclose(dev.state, np.eye(8)[4])
+        assert tmpdir.listdir() == []
+
+    def test_invalid_storage(self):
+        """Test that an exception is raised for an unknown storage option"""
+        with pytest.raises(DeviceError, match="Storage disk is not supported"):
+            qml.device("default.qubit", wires=1, storage="disk")
+
+
+def dtype_circuit(x):
+    """A circuit containing the gates with specialized kernels, parametrized and
+    diagonal gates, and a state preparation."""
+    qml.QubitStateVector(np.array([1, 1j, -1, 0.5]) / np.sqrt(3.25), wires=[0, 1])
+    qml.PauliX(wires=0)
+    qml.PauliY(wires=1)
+    qml.Hadamard(wires=2)
+    qml.S(wires=1)
+    qml.T(wires=0).inv()
+    qml.CNOT(wires=[0, 2])
+    qml.SWAP(wires=[1, 2])
+    qml.CZ(wires=[2, 0])
+    qml.Toffoli(wires=[0, 1, 2])
+    qml.Rot(x, 0.2, -0.4, wires=1)
+    qml.CRY(x, wires=[1, 2])
+    qml.MultiRZ(x, wires=[0, 1, 2])
+    qml.QubitUnitary(U, wires=0)
+    return qml.expval(qml.PauliX(0) @ qml.PauliY(2)), qml.var(qml.Hadamard(1))
+
+
+class TestDtype:
+    """Tests for the single-precision mode of default.qubit"""
+
+    def test_complex64(self):
+        """Test that the state, gates, and probabilities are carried in single precision"""
+        dev = qml.device("default.qubit", wires=3, dtype=np.complex64)
+        assert dev.C_DTYPE is np.complex64
+        assert dev.R_DTYPE is np.float32
+
+        expected = qml.QNode(dtype_circuit, qml.device("default.qubit", wires=3))(0.3)
+        res = qml.QNode(dtype_circuit, dev)(0.3)
+
+        assert dev._state.dtype == np.complex64
+        assert dev.probability(wires=[0]).dtype == np.float32
+        assert np.allclose(res, expected, atol=1e-6, rtol=0)
+
+    def test_complex64_samples(self):
+        """Test sampling in single precision"""
+        dev = qml.device("default.qubit", wires=3, dtype=np.complex64, analytic=False)
+        expected = qml.QNode(dtype_circuit, qml.device("default.qubit", wires=3))(0.3)
+        res = qml.QNode(dtype_circuit, dev)(0.3)
+
+        assert np.allclose(res, expected, atol=0.15, rtol=0)
+
+    def test_complex64_memmap(self):
+        """Test that the single precision mode is compatible with the memmap storage"""
+        dev = qml.device(
+            "default.qubit", wires=3, dtype=np.complex64, storage="memmap", chunk_wires=1
+        )
+        expected = qml.QNode(dtype_circuit, qml.device("default.qubit", wires=3))(0.3)
+        res = qml.QNode(dtype_circuit, dev)(0.3)
+
+        assert dev._state.dtype == np.complex64
+        assert np.allclose(res, expected, atol=1e-6, rtol=0)
+
+    def test_invalid_dtype(self):
+        """Test that an exception is raised for a non-complex data type"""
+        with pytest.raises(DeviceError, match="Data type float64 is not supported"):
+            qml.device("default.qubit", wires=1, dtype=np.float64)
+
+
+class TestExecutionPlans:
+    """Tests for the compilation and caching of execution plans"""
+
+    def test_plan_compiled_once_per_structure(self, mocker, tol):
+        """Test that a circuit structure is compiled once, and that the cached plan
+        gives the correct results for new parameters"""
+        dev = qml.device("default.qubit", wires=3)
+        ref = qml.device("default.qubit", wires=3)
+        spy = mocker.spy(dev, "_compile_plan")
+
+        circuit = qml.QNode(dtype_circuit, dev)
+        expected = qml.QNode(dtype_circuit, ref)
+
+        for x in [0.1, -0.5, 1.2]:
+            ref._plans.clear()
+            assert np.allclose(circuit(x), expected(x), atol=tol, rtol=0)
+
+        assert spy.call_count == 1
+        assert len(dev._plans) == 1
+
+    def test_new_structure_compiled(self, mocker):
+        """Test that a different circuit structure compiles a new plan"""
+        dev = qml.device("default.qubit", wires=2)
+        spy = mocker.spy(dev, "_compile_plan")
+
+        @qml.qnode(dev)
+        def circuit1(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        @qml.qnode(dev)
+        def circuit2(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliX(0))
+
+        circuit1(0.1)
+        circuit2(0.1)
+        circuit1(0.2)
+        circuit2(0.2)
+
+        assert spy.call_count == 2
+        assert len(dev._plans) == 2
+
+    def test_plan_cache_bounded(self, monkeypatch):
+        """Test that the least recently used plans are evicted once the cache is full"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x, n=None):
+            for _ in range(n):
+                qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        monkeypatch.setattr("pennylane.devices.default_qubit.PLAN_CACHE_SIZE", 2)
+
+        circuit(0.1, n=1)
+        first = list(dev._plans)[-1]
+        circuit(0.1, n=2)
+        circuit(0.1, n=1)
+        circuit(0.1, n=3)
+        third = list(dev._plans)[-1]
+
+        assert len(dev._plans) == 2
+        assert list(dev._plans)[0] == first
+        assert list(dev._plans)[1] == third
+
+    def test_stale_hash(self, tol):
+        """Test that a cached plan is not used for operations that do not match it"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit(0.1)
+
+        # the hash of the last executed circuit is still set
+        dev._state = dev._create_basis_state(0)
+        dev.apply([qml.PauliX(wires=1)])
+        assert np.allclose(dev.probability(), [0, 1, 0, 0], atol=tol, rtol=0)
+
+    def test_same_hash_different_wires(self, tol):
+        """Test that a cached plan is not used for operations acting on other wires,
+        for instance for circuits that share a placeholder hash"""
+        dev = qml.device("default.qubit", wires=2)
+        dev._circuit_hash = 0
+
+        dev.apply([qml.PauliX(wires=0)])
+        assert np.allclose(dev.probability(), [0, 0, 1, 0], atol=tol, rtol=0)
+
+        dev.reset()
+        dev._circuit_hash = 0
+
+        dev.apply([qml.PauliX(wires=1)])
+        assert np.allclose(dev.probability(), [0, 1, 0, 0], atol=tol, rtol=0)
+
+    def test_plans_reused_reversible(self, mocker, tol):
+        """Test that the plans of the circuit and of the operations applied by the
+        reversible differentiation method are reused"""
+        dev = qml.device("default.qubit", wires=3)
+        x = np.array([0.3, -0.7, 1.1])
+
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 2])
+            qml.RZ(x[2], wires=2)
+            return qml.expval(qml.PauliX(1)), qml.expval(qml.PauliZ(2))
+
+        node = qml.QNode(circuit, dev, diff_method="reversible")
+        expected = qml.QNode(circuit, qml.device("default.qubit", wires=3)).jacobian([x])
+        node.jacobian([x])
+
+        spy = mocker.spy(dev, "_compile_plan")
+        node(x)
+        res = node.jacobian([x])
+
+        assert spy.call_count == 0
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_state_preparation_not_first(self):
+        """Test that compiling a plan checks the position of state preparations"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with pytest.raises(DeviceError, match="cannot be used after other Operations"):
+            dev.apply([qml.PauliX(wires=0), qml.BasisState(np.array([1, 1]), wires=[0, 1])])
+
+        assert dev._plans == {}
+
+
+class TestInplaceKernels:
+    """Tests for the gates applied in place to the state"""
+
+    @pytest.mark.parametrize("name", sorted(INPLACE_OPS))
+    @pytest.mark.parametrize("inverse", [False, True])
+    def test_agrees_with_dense_application(self, name, inverse, tol):
+        """Test that the in-place kernels agree with the application of the gate matrices,
+        for wires in arbitrary order"""
+        op_class = getattr(qml, name)
+        num_wires = 3 if op_class.num_wires == qml.operation.AnyWires else op_class.num_wires
+
+        if name == "QubitUnitary":
+            # only single-qubit unitaries are applied in place
+            num_wires = 1
+
+        wires = [3, 0, 2][:num_wires]
+
+        np.random.seed(42)
+        params = list(np.random.uniform(-np.pi, np.pi, op_class.num_params))
+
+        if name == "QubitUnitary":
+            params = [U]
+        elif name == "DiagonalQubitUnitary":
+            params = [np.exp(1j * np.random.uniform(-np.pi, np.pi, 2 ** num_wires))]
+
+        state = np.random.uniform(-1, 1, 16) + 1j * np.random.uniform(-1, 1, 16)
+        state /= np.linalg.norm(state)
+
+        def circuit():
+            qml.QubitStateVector(state, wires=range(4))
+            op = op_class(*params, wires=wires)
+            if inverse:
+                op.inv()
+            return qml.probs(wires=range(4))
+
+        dev = qml.device("default.qubit", wires=4)
+        qml.QNode(circuit, dev)()
+
+        # the autograd device applies the gates without the in-place kernels
+        ref = qml.device("default.qubit.autograd", wires=4)
+        qml.QNode(circuit, ref)()
+
+        assert np.allclose(dev.state, ref.state, atol=tol, rtol=0)
+
+    def test_state_updated_in_place(self):
+        """Test that the gates update the state owned by the device without copying it"""
+        dev = qml.device("default.qubit", wires=3)
+        state = dev._state
+
+        dev.apply([qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1]), qml.CRX(0.4, wires=[1, 2])])
+        assert dev._state is state
+
+    def test_input_state_not_modified(self):
+        """Test that the state passed to QubitStateVector is not modified"""
+        dev = qml.device("default.qubit", wires=2)
+        state = np.array([1, 0, 0, 1], dtype=np.complex128) / np.sqrt(2)
+
+        dev.apply([qml.QubitStateVector(state, wires=[0, 1]), qml.PauliX(wires=0)])
+
+        assert np.allclose(state, np.array([1, 0, 0, 1]) / np.sqrt(2))
+        assert np.allclose(dev.state, np.array([0, 1, 1, 0]) / np.sqrt(2))
+
+    def test_pre_rotated_state_not_modified(self, tol):
+        """Test that the rotations do not modify the pre-rotated state"""
+        dev = qml.device("default.qubit", wires=2)
+        dev.apply([qml.PauliX(wires=0)], rotations=[qml.Hadamard(wires=0), qml.RY(0.3, wires=1)])
+
+        assert np.allclose(dev.state, [0, 0, 1, 0], atol=tol, rtol=0)
+        assert dev._state is not dev._pre_rotated_state
+
+
+def prefix_circuit(x, y):
+    """A circuit whose variable gates are preceded by fixed gates."""
+    qml.Hadamard(wires=0)
+    qml.CRX(0.3, wires=[0, 1])
+    qml.RX(x, wires=0)
+    qml.CNOT(wires=[0, 1])
+    qml.RY(y, wires=1)
+    return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+
+class TestPrefixCache:
+    """Tests for the caching of intermediate states across executions"""
+
+    def test_resume_from_checkpoint(self, mocker, tol):
+        """Test that executions resume from the deepest state whose preceding operations
+        are unchanged"""
+        dev = qml.device("default.qubit", wires=2, prefix_cache_size=2 ** 20)
+        spy = mocker.spy(dev, "_run_inplace")
+
+        circuit = qml.QNode(prefix_circuit, dev)
+        expected = qml.QNode(prefix_circuit, qml.device("default.qubit", wires=2))
+
+        # the states before RX, before RY, and after the last operation are stored
+        assert np.allclose(circuit(0.1, 0.2), expected(0.1, 0.2), atol=tol, rtol=0)
+        assert len(dev._prefix_cache) == 3
+
+        # the rotation of PauliX is applied after RY
+        spy.reset_mock()
+        assert np.allclose(circuit(0.1, -0.5), expected(0.1, -0.5), atol=tol, rtol=0)
+        assert [c[0][0].name for c in spy.call_args_list] == ["RY", "Hadamard"]
+
+        spy.reset_mock()
+        assert np.allclose(circuit(0.7, 0.2), expected(0.7, 0.2), atol=tol, rtol=0)
+        assert [c[0][0].name for c in spy.call_args_list] == ["RX", "RY", "Hadamard"]
+
+        # a repeated execution resumes after the last operation
+        spy.reset_mock()
+        assert np.allclose(circuit(0.1, 0.2), expected(0.1, 0.2), atol=tol, rtol=0)
+        assert [c[0][0].name for c in spy.call_args_list] == ["Hadamard"]
+
+    def test_parameter_shift(self, tol):
+        """Test that the parameter-shift rule resumes from cached states, and gives the
+        correct gradient"""
+        dev = qml.device("default.qubit", wires=2, prefix_cache_size=2 ** 20)
+        circuit = qml.QNode(prefix_circuit, dev, diff_method="parameter-shift")
+        expected = qml.QNode(
+            prefix_circuit, qml.device("default.qubit", wires=2), diff_method="parameter-shift"
+        )
+
+        circuit(0.1, 0.2)
+        res = circuit.jacobian([0.1, 0.2])
+
+        assert np.allclose(res, expected.jacobian([0.1, 0.2]), atol=tol, rtol=0)
+
+        # the shifted executions record no states
+        assert len(dev._prefix_cache) == 3
+
+    def test_state_set_externally(self, tol):
+        """Test that no states are read from or written to the cache when the circuit
+        is not applied to the state set by the last reset"""
+        dev = qml.device("default.qubit", wires=2, prefix_cache_size=2 ** 20)
+        qml.QNode(prefix_circuit, dev)(0.1, 0.2)
+        cached = dict(dev._prefix_cache)
+
+        state = np.array([0, 1, 0, 0], dtype=np.complex128).reshape([2, 2])
+        dev._state = state
+        dev.apply([qml.PauliX(wires=0), qml.RX(0.4, wires=1)])
+
+        expected = np.kron([0, 1], [-1j * np.sin(0.2), np.cos(0.2)])
+        assert np.allclose(dev._pre_rotated_state.flatten(), expected, atol=tol, rtol=0)
+        assert dict(dev._prefix_cache) == cached
+
+        # applying operations again without a reset does not use the cache either
+        dev.apply([qml.RX(-0.4, wires=1)])
+        assert np.allclose(dev._pre_rotated_state.flatten(), [0, 0, 0, 1], atol=tol, rtol=0)
+        assert dict(dev._prefix_cache) == cached
+
+    @pytest.mark.parametrize("x", [0.1, 1.2])
+    def test_reversible_gradient(self, x, tol):
+        """Test that the reversible differentiation method gives the correct gradient,
+        since it applies operations to states it sets on the device"""
+        dev = qml.device("default.qubit", wires=2, prefix_cache_size=2 ** 20)
+        circuit = qml.QNode(prefix_circuit, dev, diff_method="reversible")
+        expected = qml.QNode(
+            prefix_circuit, qml.device("default.qubit", wires=2), diff_method="parameter-shift"
+        )
+
+        for _ in range(2):
+            res = circuit.jacobian([x, 0.7])
+            assert np.allclose(res, expected.jacobian([x, 0.7]), atol=tol, rtol=0)
+
+            res = qml.grad(circuit)(x, 0.7)
+            assert np.allclose(res, qml.grad(expected)(x, 0.7), atol=tol, rtol=0)
+
+    def test_memory_budget(self):
+        """Test that the least recently used states are evicted once the memory
+        budget is exceeded"""
+        state_bytes = 4 * np.dtype(np.complex128).itemsize
+        dev = qml.device("default.qubit", wires=2, prefix_cache_size=2 * state_bytes)
+        circuit = qml.QNode(prefix_circuit, dev)
+
+        circuit(0.1, 0.2)
+
+        # the state before RX was evicted
+        assert len(dev._prefix_cache) == 2
+        assert dev._prefix_cache_bytes == 2 * state_bytes
+        keys = dev._prefix_keys(circuit.circuit.operations, [4, 5])
+        assert list(dev._prefix_cache) == [keys[4], keys[5]]
+
+    def test_keys(self):
+        """Test that the keys are fixed-size digests, which depend on the names, wires and
+        parameters of the preceding operations"""
+        dev = qml.device("default.qubit", wires=2)
+        ops = [qml.RX(0.1, wires=0), qml.CNOT(wires=[0, 1]), qml.RY(0.2, wires=1)]
+        keys = dev._prefix_keys(ops, [1, 2, 3])
+
+        assert all(isinstance(key, bytes) and len(key) == 16 for key in keys.values())
+        assert len(set(keys.values())) == 3
+
+        assert dev._prefix_keys(ops[:2] + [qml.RY(0.3, wires=1)], [2])[2] == keys[2]
+        assert dev._prefix_keys([qml.RX(0.2, wires=0)] + ops[1:], [2])[2] != keys[2]
+        assert dev._prefix_keys([qml.RX(0.1, wires=1)] + ops[1:], [1])[1] != keys[1]
+
+    def test_states_copied(self, tol):
+        """Test that the cached states do not share memory with the input state
+        of the circuit"""
+        dev = qml.device("default.qubit", wires=2, prefix_cache_size=2 ** 20)
+        state = np.array([0, 1, 0, 0], dtype=np.complex128)
+
+        def circuit(x):
+            qml.QubitStateVector(state, wires=[0, 1])
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(1))
+
+        qml.QNode(circuit, dev)(0.3)
+
+        assert len(dev._prefix_cache) == 2
+        assert not any(np.may_share_memory(s, state) for s in dev._prefix_cache.values())
+
+    def test_disabled_by_default(self):
+        """Test that no states are cached by default"""
+        dev = qml.device("default.qubit", wires=2)
+        qml.QNode(prefix_circuit, dev)(0.1, 0.2)
+
+        assert len(dev._prefix_cache) == 0
@@ -368,3 +368,29 @@ class TestHighLevelIntegration:
 
         grad = qml.grad(cost)(weights)[0]
         assert grad.shape == weights.shape
+
+
+class TestDtype:
+    """Tests for the single-precision mode of default.qubit.autograd"""
+
+    def test_complex64_backprop(self, tol):
+        """Test that the state is carried in single precision, and that
+        gradients can be computed via backpropagation"""
+        dev = qml.device("default.qubit.autograd", wires=2, dtype=np.complex64)
+
+        @qml.qnode(dev, interface="autograd", diff_method="backprop")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.T(wires=0)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        x = np.array([0.4, -0.7], requires_grad=True)
+        res = circuit(x)
+        grad = qml.grad(circuit)(x)[0]
+
+        assert dev._state.dtype == np.complex64
+        assert np.allclose(res, np.cos(x[1]), atol=1e-6, rtol=0)
+        expected = [0, -np.sin(x[1])]
+        assert np.allclose(grad, expected, atol=1e-6, rtol=0)
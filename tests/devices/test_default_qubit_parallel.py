@@ -0,0 +1,172 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.devices.DefaultQubitParallel` device.
+"""
+import gc
+
+import pytest
+import numpy as np
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+import pennylane as qml
+from pennylane import DeviceError
+from pennylane.devices.default_qubit_parallel import DefaultQubitParallel
+
+
+U = np.array(
+    [
+        [0.83645892 - 0.40533293j, -0.20215326 + 0.30850569j],
+        [-0.23889780 - 0.28101519j, -0.88031770 - 0.29832709j],
+    ]
+)
+
+
+def circuit(x):
+    """A circuit containing local and global gates, diagonal gates, multi-qubit gates,
+    inverses and a state preparation on a subset of wires."""
+    qml.QubitStateVector(np.array([1, 1j, -1, 0.5]) / np.sqrt(3.25), wires=[3, 1])
+    for i in range(5):
+        qml.RX(x[i], wires=i)
+    qml.CNOT(wires=[0, 4])
+    qml.Toffoli(wires=[4, 1, 3])
+    qml.CSWAP(wires=[2, 4, 0])
+    qml.CRZ(x[0], wires=[4, 0])
+    qml.MultiRZ(x[1], wires=[0, 3, 4])
+    qml.S(wires=2).inv()
+    qml.CRot(x[2], x[3], x[4], wires=[1, 0])
+    qml.QubitUnitary(np.kron(U, U), wires=[4, 3])
+    return [
+        qml.expval(qml.PauliX(0) @ qml.PauliY(1)),
+        qml.var(qml.Hadamard(2)),
+        qml.probs(wires=[4, 3]),
+    ]
+
+
+class TestDefaultQubitParallel:
+    """Tests for the default.qubit.parallel device"""
+
+    @pytest.mark.parametrize("num_workers", [1, 2, 3, 8])
+    def test_agrees_with_default_qubit(self, num_workers, tol):
+        """Test that the parallel simulation reproduces default.qubit"""
+        x = np.array([0.1, -0.6, 1.2, 0.4, 2.1])
+        dev = qml.device("default.qubit", wires=5)
+        dev_parallel = qml.device("default.qubit.parallel", wires=5, num_workers=num_workers)
+
+        expected = qml.QNode(circuit, dev)(x)
+        res = qml.QNode(circuit, dev_parallel)(x)
+
+        for r, e in zip(res, expected):
+            assert np.allclose(r, e, atol=tol, rtol=0)
+
+        assert np.allclose(dev_parallel.state, dev.state, atol=tol, rtol=0)
+
+    def test_partitioning(self):
+        """Test that the state is partitioned on the leading wires into at least
+        one partition per worker"""
+        dev = DefaultQubitParallel(wires=6, num_workers=3)
+        assert dev._chunk_wires == 4
+
+        dev = DefaultQubitParallel(wires=2, num_workers=8)
+        assert dev._chunk_wires == 0
+
+    def test_local_gates_batched(self, mocker):
+        """Test that consecutive gates on the trailing wires are applied in a
+        single round, while gates on the leading wires are applied one by one"""
+        dev = DefaultQubitParallel(wires=4, num_workers=2)
+        spy = mocker.spy(dev, "_run")
+
+        dev.apply(
+            [
+                qml.Hadamard(wires=1),
+                qml.CNOT(wires=[1, 2]),
+                qml.RZ(0.3, wires=3),
+                qml.CNOT(wires=[0, 3]),
+                qml.PauliX(wires=0),
+                qml.RY(0.2, wires=2),
+            ]
+        )
+
+        num_gates = [len(call[0][0]) for call in spy.call_args_list if call[0][0]]
+        assert num_gates == [3, 1, 1, 1]
+
+    def test_state_in_shared_memory(self):
+        """Test that the gates are applied to the state in shared memory, and that the
+        pre-rotated and rotated states are stored as copies"""
+        dev = DefaultQubitParallel(wires=3, num_workers=2)
+        dev.apply([qml.Hadamard(wires=0)], rotations=[qml.Hadamard(wires=0)])
+
+        assert np.allclose(dev.state, np.array([1, 0, 0, 0, 1, 0, 0, 0]) / np.sqrt(2))
+        assert np.allclose(dev.probability(wires=[0]), [1, 0])
+        assert np.allclose(dev._shared_state(), np.eye(8)[0])
+        assert not np.may_share_memory(dev._state, dev._shared_state())
+        assert not np.may_share_memory(dev._pre_rotated_state, dev._shared_state())
+
+    def test_state_set_externally(self, tol):
+        """Test that the gates are applied to a state set from outside the device,
+        which is left unchanged"""
+        dev = DefaultQubitParallel(wires=2, num_workers=2)
+        state = np.array([[1, 0], [0, 1]], dtype=np.complex128) / np.sqrt(2)
+        dev._state = state
+
+        dev.apply([qml.CNOT(wires=[0, 1]), qml.Hadamard(wires=0)])
+
+        assert np.allclose(dev.state, np.eye(4)[0], atol=tol, rtol=0)
+        assert np.allclose(state, np.eye(2) / np.sqrt(2), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("num_workers", [1, 4])
+    def test_reversible_gradient(self, num_workers, tol):
+        """Test that the reversible gradient method agrees with default.qubit"""
+
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 2])
+            qml.Rot(x[2], x[0], x[1], wires=2)
+            qml.CNOT(wires=[2, 1])
+            return qml.expval(qml.PauliZ(1)), qml.expval(qml.PauliX(2))
+
+        x = np.array([0.3, -0.7, 1.1])
+        dev = qml.device("default.qubit", wires=3)
+        dev_parallel = qml.device("default.qubit.parallel", wires=3, num_workers=num_workers)
+
+        node = qml.QNode(circuit, dev, diff_method="reversible")
+        node_parallel = qml.QNode(circuit, dev_parallel, diff_method="reversible")
+
+        expected = node.jacobian([x])
+        assert np.allclose(node_parallel.jacobian([x]), expected, atol=tol, rtol=0)
+
+        dy = np.array([0.5, -1.2])
+        assert np.allclose(node_parallel.vjp([x], dy), dy @ expected, atol=tol, rtol=0)
+
+    def test_basis_state_not_first(self):
+        """Test that an exception is raised if a state preparation is not the first operation"""
+        dev = DefaultQubitParallel(wires=2, num_workers=2)
+
+        with pytest.raises(DeviceError, match="cannot be used after other Operations"):
+            dev.apply([qml.PauliX(wires=0), qml.BasisState(np.array([1, 1]), wires=[0, 1])])
+
+    def test_shared_memory_released(self):
+        """Test that the shared memory is freed when the device is deleted"""
+        dev = DefaultQubitParallel(wires=3, num_workers=2)
+        dev.apply([qml.Hadamard(wires=0), qml.CNOT(wires=[0, 2])])
+        blocks = list(dev._blocks)
+
+        del dev
+        gc.collect()
+
+        for shm in blocks:
+            with pytest.raises(FileNotFoundError):
+                type(shm)(name=shm.name)
@@ -1257,3 +1257,36 @@ class TestHighLevelIntegration:
 
         assert isinstance(grad, tf.Tensor)
         assert grad.shape == weights.shape
+
+
+class TestDtype:
+    """Tests for the single-precision mode of default.qubit.tf"""
+
+    @pytest.mark.parametrize("dtype", [tf.complex64, np.complex64])
+    def test_complex64_backprop(self, dtype):
+        """Test that the state and the results are carried in single precision, and that
+        gradients can be computed via backpropagation"""
+        dev = qml.device("default.qubit.tf", wires=2, dtype=dtype)
+        assert dev.C_DTYPE == tf.complex64
+        assert dev.R_DTYPE == tf.float32
+
+        @qml.qnode(dev, interface="tf", diff_method="backprop")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.S(wires=1)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        x = tf.Variable([0.4, -0.7], dtype=tf.float32)
+
+        with tf.GradientTape() as tape:
+            res = circuit(x)
+
+        grad = tape.gradient(res, x)
+
+        assert dev._state.dtype == tf.complex64
+        assert res.dtype == tf.float32
+        assert np.allclose(res, np.cos(-0.7), atol=1e-6, rtol=0)
+        expected = [0, -np.sin(-0.7)]
+        assert np.allclose(grad, expected, atol=1e-6, rtol=0)
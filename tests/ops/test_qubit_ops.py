@@ -21,6 +21,7 @@ from numpy.linalg import multi_dot
 
 import pennylane as qml
 from pennylane.wires import Wires
+from pennylane.ops.qubit import _fingerprint
 
 from gate_data import I, X, Y, Z, H, CNOT, SWAP, CZ, S, T, CSWAP, Toffoli
 
@@ -109,7 +110,7 @@ class TestObservables:
         assert np.allclose(eigendecomp["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(eigendecomp["eigvec"], eigvecs, atol=tol, rtol=0)
 
-        key = tuple(observable.flatten().tolist())
+        key = _fingerprint(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
         assert len(qml.Hermitian._eigs) == 1
@@ -127,7 +128,7 @@ class TestObservables:
         assert np.allclose(eigendecomp["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(eigendecomp["eigvec"], eigvecs, atol=tol, rtol=0)
 
-        key = tuple(observable.flatten().tolist())
+        key = _fingerprint(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
         assert len(qml.Hermitian._eigs) == 1
@@ -144,7 +145,7 @@ class TestObservables:
         observable_1_eigvals = obs1[1]
         observable_1_eigvecs = obs1[2]
 
-        key = tuple(observable_1.flatten().tolist())
+        key = _fingerprint(observable_1)
 
         qml.Hermitian(observable_1, 0).eigvals
         assert np.allclose(
@@ -159,7 +160,7 @@ class TestObservables:
         observable_2_eigvals = obs2[1]
         observable_2_eigvecs = obs2[2]
 
-        key_2 = tuple(observable_2.flatten().tolist())
+        key_2 = _fingerprint(observable_2)
 
         qml.Hermitian(observable_2, 0).eigvals
         assert np.allclose(
@@ -175,7 +176,7 @@ class TestObservables:
         self, observable, eigvals, eigvecs, tol
     ):
         """Tests that the eigvals method of the Hermitian class keeps the same dictionary entries upon multiple calls."""
-        key = tuple(observable.flatten().tolist())
+        key = _fingerprint(observable)
 
         qml.Hermitian(observable, 0).eigvals
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
@@ -192,7 +193,7 @@ class TestObservables:
         """Tests that the diagonalizing_gates method of the Hermitian class returns the correct results."""
         qubit_unitary = qml.Hermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = _fingerprint(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -213,7 +214,7 @@ class TestObservables:
 
         qubit_unitary = qml.Hermitian(observable_1, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable_1.flatten().tolist())
+        key = _fingerprint(observable_1)
         assert np.allclose(
             qml.Hermitian._eigs[key]["eigval"], observable_1_eigvals, atol=tol, rtol=0
         )
@@ -230,7 +231,7 @@ class TestObservables:
 
         qubit_unitary_2 = qml.Hermitian(observable_2, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable_2.flatten().tolist())
+        key = _fingerprint(observable_2)
         assert np.allclose(
             qml.Hermitian._eigs[key]["eigval"], observable_2_eigvals, atol=tol, rtol=0
         )
@@ -250,7 +251,7 @@ class TestObservables:
         """Tests that the diagonalizing_gates method of the Hermitian class keeps the same dictionary entries upon multiple calls."""
         qubit_unitary = qml.Hermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = _fingerprint(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -259,7 +260,7 @@ class TestObservables:
 
         qubit_unitary = qml.Hermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = _fingerprint(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -281,6 +282,48 @@ class TestObservables:
         x = U @ tensor_obs @ U.conj().T
         assert np.allclose(np.diag(np.sort(eigvals)), x, atol=tol, rtol=0)
 
+    def test_hermitian_eigendecomposition_shared(self, mocker):
+        """Tests that Hermitian observables with equal matrices share their eigendecomposition"""
+        spy = mocker.spy(np.linalg, "eigh")
+        A = np.array([[1, 2j], [-2j, 0]])
+
+        res = qml.Hermitian(A, wires=0).eigendecomposition
+        assert qml.Hermitian(A.copy(), wires=1).eigendecomposition is res
+        assert qml.Hermitian(np.asfortranarray(A), wires=0).eigendecomposition is res
+        assert qml.Hermitian(A.astype(np.complex64), wires=0).eigendecomposition is not res
+        assert spy.call_count == 2
+
+    def test_hermitian_eigendecomposition_lru(self, monkeypatch):
+        """Tests that the least recently used eigendecompositions are discarded"""
+        monkeypatch.setattr(qml.Hermitian._eigs, "max_size", 2)
+        obs = [np.diag([1.0, k]) for k in range(3)]
+
+        qml.Hermitian(obs[0], wires=0).eigvals
+        qml.Hermitian(obs[1], wires=0).eigvals
+        qml.Hermitian(obs[0], wires=0).eigvals
+        qml.Hermitian(obs[2], wires=0).eigvals
+
+        assert list(qml.Hermitian._eigs) == [_fingerprint(obs[0]), _fingerprint(obs[2])]
+
+    def test_hermitian_eigendecomposition_memory(self, monkeypatch):
+        """Tests that the memory occupied by the eigendecompositions is bounded"""
+        obs = [np.diag(np.arange(4.0) + k) for k in range(3)]
+
+        qml.Hermitian(obs[0], wires=[0, 1]).eigvals
+        nbytes = qml.Hermitian._eigs.nbytes
+        assert nbytes == 4 * 8 + 16 * 8
+
+        monkeypatch.setattr(qml.Hermitian._eigs, "max_bytes", 2 * nbytes)
+
+        for A in obs:
+            qml.Hermitian(A, wires=[0, 1]).eigvals
+
+        assert list(qml.Hermitian._eigs) == [_fingerprint(obs[1]), _fingerprint(obs[2])]
+        assert qml.Hermitian._eigs.nbytes == 2 * nbytes
+
+        qml.Hermitian._eigs.clear()
+        assert qml.Hermitian._eigs.nbytes == 0
+
     def test_hermitian_matrix(self, tol):
         """Test that the hermitian matrix method produces the correct output."""
         H = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
@@ -14,6 +14,7 @@
 """
 Unit tests for the :mod:`pennylane` :class:`QNode` class.
 """
+import asyncio
 import contextlib
 import io
 import textwrap
@@ -953,6 +954,79 @@ class TestQNodeCaching:
         assert np.allclose(res, exp, atol=tol, rtol=0)
 
 
+    def test_mutable_same_structure_reused(self, mocker, tol):
+        """Test that a mutable QNode keeps its circuit graph if the quantum function
+        queues a circuit with the same structure"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x, *, c=None):
+            qml.RX(x[0], wires=0)
+            qml.RX(-x[1], wires=c)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0))
+
+        node = BaseQNode(circuit, dev, mutable=True)
+        spy = mocker.spy(qml.qnodes.base, "CircuitGraph")
+
+        node([0.1, 0.2], c=1)
+        graph = node.circuit
+        ops = node.ops
+
+        res = node([0.4, 0.5], c=1)
+        assert node.circuit is graph
+        assert node.ops is ops
+        assert spy.call_count == 1
+        assert np.allclose(res, np.cos(0.4), atol=tol, rtol=0)
+
+        # a different wire for the second gate changes the structure
+        res = node([0.4, 0.5], c=0)
+        assert node.circuit is not graph
+        assert spy.call_count == 2
+        assert np.allclose(res, np.cos(0.4 - 0.5), atol=tol, rtol=0)
+
+    def test_mutable_structure_changes(self, tol):
+        """Test that a mutable QNode is reconstructed if the free parameters the circuit depends
+        on, its constant parameters or its returned observables change"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x, *, sign=1, phi=0.0, obs="Z"):
+            qml.RX(sign * x, wires=0)
+            qml.RX(phi, wires=0)
+            return qml.expval(getattr(qml, "Pauli" + obs)(0))
+
+        node = BaseQNode(circuit, dev, mutable=True)
+        node(0.3)
+        graph = node.circuit
+
+        assert np.allclose(node(0.3, sign=-1), np.cos(0.3), atol=tol, rtol=0)
+        assert node.circuit is not graph
+
+        graph = node.circuit
+        assert np.allclose(node(0.3, sign=-1, phi=0.3), 1, atol=tol, rtol=0)
+        assert node.circuit is not graph
+
+        graph = node.circuit
+        assert np.allclose(node(0.3, sign=-1, phi=0.3, obs="X"), 0, atol=tol, rtol=0)
+        assert node.circuit is not graph
+
+    def test_mutable_structure_reused_gradient(self, tol):
+        """Test that the gradient of a mutable QNode is correct when its circuit is reused"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        grad = qml.grad(circuit)
+
+        for x, y in [(0.1, 0.2), (0.5, -0.3)]:
+            expected = [-np.sin(x) * np.cos(y), -np.cos(x) * np.sin(y)]
+            assert np.allclose(grad(x, y), expected, atol=tol, rtol=0)
+
+
 class TestQNodeEvaluate:
     """Test for observable statistic evaluation"""
 
@@ -1019,6 +1093,56 @@ class TestQNodeEvaluate:
         assert res.shape == (10,)
 
 
+class TestQNodeEvaluateAsync:
+    """Tests for the asynchronous evaluation of QNodes"""
+
+    @staticmethod
+    def circuit(x, y):
+        """Quantum function used by the tests"""
+        qml.RX(x, wires=[0])
+        qml.RY(y, wires=[1])
+        qml.CNOT(wires=[0, 1])
+        return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+    def test_evaluate_async(self, tol):
+        """Tests that the asynchronous evaluation agrees with the synchronous one"""
+        dev = qml.device("default.qubit", wires=2)
+        node = BaseQNode(self.circuit, dev)
+
+        res = asyncio.run(node.evaluate_async([0.432, 0.12], {}))
+        assert np.allclose(res, node.evaluate([0.432, 0.12], {}), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("mutable", [True, False])
+    def test_in_flight(self, mutable, tol):
+        """Tests that many evaluations of the same QNode can be in flight at once"""
+        dev = qml.device("default.qubit", wires=2)
+        node = BaseQNode(self.circuit, dev, mutable=mutable)
+        x = np.linspace(-2 * np.pi, 2 * np.pi, 20)
+        y = x ** 2 / 11
+
+        async def evaluate():
+            return await asyncio.gather(*[node.evaluate_async([a, b], {}) for a, b in zip(x, y)])
+
+        res = asyncio.run(evaluate())
+        assert np.allclose(res, np.sin(y) * np.cos(x), atol=tol, rtol=0)
+
+    def test_cache(self, mocker, tol):
+        """Tests that the asynchronous evaluation uses the result cache"""
+        dev = qml.device("default.qubit", wires=2)
+        cache = qml.ResultCache()
+        node = BaseQNode(self.circuit, dev, cache=cache)
+        spy = mocker.spy(dev, "execute")
+
+        async def evaluate():
+            res = await node.evaluate_async([0.432, 0.12], {})
+            return res, await node.evaluate_async([0.432, 0.12], {})
+
+        res1, res2 = asyncio.run(evaluate())
+        assert np.allclose(res1, res2, atol=tol, rtol=0)
+        assert spy.call_count == 1
+        assert cache.hits == 1
+
+
 class TestDecomposition:
     """Test for queue decomposition"""
 
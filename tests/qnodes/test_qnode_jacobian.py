@@ -239,3 +239,109 @@ def test_finite_difference_options(qubit_device_1_wire, order, h, monkeypatch):
 
         assert call_kwargs["order"] == order
         assert call_kwargs["h"] == h
+
+
+class TestVJP:
+    """Tests for the vector-Jacobian product of a JacobianQNode"""
+
+    @staticmethod
+    def circuit(x, y):
+        """Circuit whose outputs depend on different parameters"""
+        qml.RX(x[0], wires=0)
+        qml.RY(x[1], wires=1)
+        qml.CNOT(wires=[0, 1])
+        qml.RX(y, wires=2)
+        return qml.expval(qml.PauliZ(1)), qml.expval(qml.PauliZ(2))
+
+    @pytest.mark.parametrize("dy", [[0.5, -1.2], [1.0, 0.0], [0.0, 2.0], [0.0, 0.0]])
+    def test_agrees_with_jacobian(self, dy, tol):
+        """Tests that the vector-Jacobian product is the product with the Jacobian"""
+        dev = qml.device("default.qubit", wires=3)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+        args = (np.array([0.3, -0.4]), 0.7)
+
+        res = node.vjp(args, dy)
+        assert res.shape == (3,)
+        assert np.allclose(res, np.array(dy) @ node.jacobian(args), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("dy, wrt", [([1.0, 0.0], [0, 1]), ([0.0, 1.0], [2])])
+    def test_zero_contributions_skipped(self, dy, wrt, mocker):
+        """Tests that the partial derivatives are only computed with respect to the
+        parameters affecting an output with a nonzero entry in the vector"""
+        dev = qml.device("default.qubit", wires=3)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+        spy = mocker.spy(node, "_pd_analytic")
+
+        node.vjp((np.array([0.3, -0.4]), 0.7), dy)
+        assert sorted(call[0][0] for call in spy.call_args_list) == wrt
+
+    def test_zero_vector(self, mocker):
+        """Tests that the circuit is not executed for a vanishing vector"""
+        dev = qml.device("default.qubit", wires=3)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+        spy = mocker.spy(dev, "execute")
+
+        assert np.all(node.vjp((np.array([0.3, -0.4]), 0.7), [0.0, 0.0]) == 0)
+        assert spy.call_count == 0
+
+    def test_probabilities(self, tol):
+        """Tests the vector-Jacobian product of a QNode returning probabilities"""
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.probs(wires=0)
+
+        dev = qml.device("default.qubit", wires=1)
+        node = qml.qnodes.QubitQNode(circuit, dev)
+
+        res = node.vjp(0.3, [1.0, -1.0])
+        assert np.allclose(res, [-np.sin(0.3)], atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "dy", [[1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, -0.5]]
+    )
+    def test_several_probabilities(self, dy, tol):
+        """Tests the vector-Jacobian product of a QNode returning several probabilities"""
+
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RX(x[1], wires=1)
+            return qml.probs(wires=[0]), qml.probs(wires=[1])
+
+        dev = qml.device("default.qubit", wires=2)
+        node = qml.qnodes.QubitQNode(circuit, dev)
+        x = np.array([0.3, 0.5])
+
+        res = node.vjp((x,), dy)
+        expected = np.array(dy) @ node.jacobian((x,))
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert np.any(res != 0)
+
+    def test_several_probabilities_grad(self, tol):
+        """Tests the gradient of an entry of the probabilities of a QNode returning
+        several probabilities"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RX(x[1], wires=1)
+            return qml.probs(wires=[0]), qml.probs(wires=[1])
+
+        x = np.array([0.3, 0.5])
+        res = qml.grad(lambda x: circuit(x)[1, 0])(x)
+        assert np.allclose(res, [0, -np.sin(0.5) / 2], atol=tol, rtol=0)
+
+    def test_forward_pass_reused(self, mocker, tol):
+        """Tests that the finite difference method reuses the output of the forward pass"""
+        dev = qml.device("default.qubit", wires=3)
+        node = JacobianQNode(self.circuit, dev)
+        args = (np.array([0.3, -0.4]), 0.7)
+        expected = np.array([0.5, -1.2]) @ node.jacobian(args)
+
+        options = node.forward_pass_options(node(*args))
+        spy = mocker.spy(dev, "execute")
+
+        res = node.vjp(args, [0.5, -1.2], options=options)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count == 3
@@ -663,6 +663,131 @@ class TestIntegration:
             ReversibleQNode(circuit, dev)
 
 
+class TestVJP:
+    """Tests for the vector-Jacobian product computed in a single backward sweep"""
+
+    @staticmethod
+    def circuit(x, y, z):
+        """Circuit with decomposed, inverted and fixed-parameter gates"""
+        qml.Hadamard(wires=1)
+        qml.RX(x, wires="a")
+        qml.Rot(y, z, 2 * x, wires=3)
+        qml.CNOT(wires=[3, "a"])
+        qml.RY(z, wires=1).inv()
+        qml.CRot(0.3, 0.1, 0.2, wires=[1, 3])
+        qml.RZ(-y, wires="a")
+        qml.CNOT(wires=[1, "b"])
+        qml.RX(y, wires="b")
+        return (
+            qml.expval(qml.PauliX("a") @ qml.PauliY(1)),
+            qml.expval(qml.Hermitian(np.array([[1, 2j], [-2j, 0.5]]), wires=3)),
+            qml.expval(qml.PauliZ("b")),
+        )
+
+    @pytest.mark.parametrize("dy", [[0.7, -1.3, 0.4], [0.0, 0.0, 1.0], [0.0, 0.0, 0.0]])
+    def test_agrees_with_jacobian(self, dy, mocker, tol):
+        """Tests that the vector-Jacobian product agrees with the parameter-shift Jacobian,
+        and is computed without it"""
+        dev = qml.device("default.qubit", wires=["a", 3, 1, "b"])
+        args = (0.3, -0.5, 1.1)
+        expected = np.array(dy) @ qml.qnodes.QubitQNode(self.circuit, dev).jacobian(args)
+
+        node = ReversibleQNode(self.circuit, dev)
+        spy = mocker.spy(node, "_pd_analytic")
+
+        res = node.vjp(args, dy)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count == 0
+
+    def test_device_state_restored(self):
+        """Tests that the state of the device after the forward pass is restored"""
+        dev = qml.device("default.qubit", wires=["a", 3, 1, "b"])
+        node = ReversibleQNode(self.circuit, dev)
+
+        node(0.3, -0.5, 1.1)
+        state = dev.state
+        node.vjp((0.3, -0.5, 1.1), [1.0, 1.0, 1.0])
+        assert np.allclose(dev.state, state)
+
+    @pytest.mark.parametrize("dy", [[0.7, -1.3, 0.4], [0.0, 1.0, 0.0]])
+    def test_forward_pass_reused(self, dy, mocker, tol):
+        """Tests that the backward sweep starts from the state recorded in the forward pass,
+        even if the device executed other circuits in between"""
+        dev = qml.device("default.qubit", wires=["a", 3, 1, "b"])
+        args = (0.3, -0.5, 1.1)
+        expected = np.array(dy) @ qml.qnodes.QubitQNode(self.circuit, dev).jacobian(args)
+
+        node = ReversibleQNode(self.circuit, dev)
+        options = node.forward_pass_options(node(*args))
+        node(0.1, 0.2, 0.3)
+        spy = mocker.spy(node, "evaluate")
+
+        res = node.vjp(args, dy, options=options)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count == 0
+
+    def test_forward_pass_reused_jacobian(self, mocker, tol):
+        """Tests that the Jacobian is computed from the state recorded in the forward pass"""
+
+        def circuit(x, y, z):
+            qml.RX(x, wires="a")
+            qml.Rot(y, z, 2 * x, wires=3)
+            qml.CNOT(wires=[3, "a"])
+            qml.RY(z, wires=3)
+            return qml.expval(qml.PauliX("a")), qml.expval(qml.PauliY(3))
+
+        dev = qml.device("default.qubit", wires=["a", 3])
+        args = (0.3, -0.5, 1.1)
+        expected = qml.qnodes.QubitQNode(circuit, dev).jacobian(args)
+
+        node = ReversibleQNode(circuit, dev)
+        options = node.forward_pass_options(node(*args))
+        spy = mocker.spy(node, "evaluate")
+
+        res = node.jacobian(args, options=options)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count == 0
+
+    def test_forward_pass_cached(self):
+        """Tests that the state is not recorded if the results may be served from a cache"""
+        dev = qml.device("default.qubit", wires=["a", 3, 1, "b"])
+        node = ReversibleQNode(self.circuit, dev, cache=qml.ResultCache())
+
+        options = node.forward_pass_options(node(0.3, -0.5, 1.1))
+        assert "state" not in options
+
+    def test_variance(self, mocker, tol):
+        """Tests that the vector-Jacobian product of variances is computed from the Jacobian"""
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.var(qml.PauliZ(0))
+
+        dev = qml.device("default.qubit", wires=1)
+        node = ReversibleQNode(circuit, dev)
+        spy = mocker.spy(node, "jacobian")
+
+        res = node.vjp(0.3, 2.0)
+        assert np.allclose(res, [2 * 2 * np.cos(0.3) * np.sin(0.3)], atol=tol, rtol=0)
+        assert spy.call_count == 1
+
+    def test_autograd(self, mocker, tol):
+        """Tests that the gradients of the autograd interface use the backward sweep"""
+        dev = qml.device("default.qubit", wires=["a", 3, 1, "b"])
+        node = qml.QNode(self.circuit, dev, diff_method="reversible")
+        spy = mocker.spy(node, "_pd_analytic")
+        expected = qml.grad(lambda *args: qml.QNode(self.circuit, dev)(*args)[2])(0.3, -0.5, 1.1)
+
+        execute = mocker.spy(dev, "execute")
+
+        res = qml.grad(lambda *args: node(*args)[2])(0.3, -0.5, 1.1)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count == 0
+
+        # only the forward pass executes the circuit
+        assert execute.call_count == 1
+
+
 class TestHelperFunctions:
     """Tests for additional helper functions."""
 
@@ -245,6 +245,12 @@ class TestBuiltinPatterns:
         with pytest.raises(ValueError, match="the ring pattern with 2 wires is an exception"):
             circuit(pars)
 
+    def test_validates_unitary(self):
+        """Tests that the operators constructed by the broadcast unitary are validated."""
+
+        with pytest.raises(ValueError, match="wrong number of wires"):
+            broadcast(unitary=CNOT, wires=range(2), pattern="single")
+
     @pytest.mark.parametrize("function, wires, target", [(wires_pyramid, [8, 2, 0, 4, 6, 1],
                                                           [[8, 2], [0, 4], [6, 1], [2, 0], [4, 6], [0, 4]]),
                                                          (wires_pyramid, [5, 10, 1, 0, 3, 4, 6],
@@ -116,6 +116,17 @@ class TestLayer:
         with pytest.raises(ValueError, match=r"Each positional argument must have length matching 'depth'; expected 3"):
             layer(unitary, 3, params, wires=[0])
 
+    def test_validates_template(self):
+        """Tests that the operators constructed by the repeated template are validated"""
+
+        params = [1, 1]
+
+        def unitary(param):
+            qml.RX(param, param, wires=0)
+
+        with pytest.raises(ValueError, match=r"wrong number of parameters"):
+            layer(unitary, 2, params)
+
     @pytest.mark.parametrize(("unitary", "depth", "arguments", "keywords", "gates"), REPEAT)
     def test_layer(self, unitary, depth, arguments, keywords, gates):
         """Tests that the layering function is yielding the correct sequence of gates"""
@@ -253,6 +253,11 @@ class TestStronglyEntangling:
         with pytest.raises(ValueError, match="the range for all layers needs to be smaller than"):
             qnode(weights)
 
+    def test_strong_ent_layers_invalid_imprimitive(self):
+        """Test that the operators constructed from the given imprimitive class are validated."""
+        with pytest.raises(ValueError, match="Hadamard: wrong number of wires"):
+            StronglyEntanglingLayers(np.ones((1, 2, 3)), wires=[0, 1], imprimitive=qml.Hadamard)
+
     def test_strong_ent_layers_illegal_ranges_exception(self):
         """Test that StronglyEntanglingLayers throws and exception if ``ranges`` parameter of illegal type."""
         n_wires = 2
@@ -477,6 +482,16 @@ class TestRandomLayers:
         params_flat = [item for p in params for item in p]
         assert np.allclose(weights.flatten(), params_flat, atol=tol)
 
+    def test_invalid_rotations(self):
+        """Test that the operators constructed from the given rotation classes are validated."""
+        with pytest.raises(ValueError, match="CRX: wrong number of wires"):
+            RandomLayers(np.array([[0.1, 0.2]]), wires=[0, 1], rotations=[qml.CRX])
+
+    def test_invalid_imprimitive(self):
+        """Test that the operators constructed from the given imprimitive class are validated."""
+        with pytest.raises(ValueError, match="RX: wrong number of wires"):
+            RandomLayers(np.ones((1, 10)), wires=[0, 1], imprimitive=RX)
+
 
 class TestSimplifiedTwoDesign:
     """Tests for the SimplifiedTwoDesign method from the pennylane.templates.layers module."""
@@ -642,3 +657,8 @@ class TestBasicEntangler:
         expectations = circuit(weights)
         for exp, target_exp in zip(expectations, target):
             assert exp == target_exp
+
+    def test_invalid_rotation(self):
+        """Tests that the operators constructed from the given rotation class are validated."""
+        with pytest.raises(ValueError, match="Rot: wrong number of parameters"):
+            BasicEntanglerLayers(np.array([[0.1, 0.2]]), wires=[0, 1], rotation=qml.Rot)
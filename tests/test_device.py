@@ -15,7 +15,12 @@
 Unit tests for the :mod:`pennylane` :class:`Device` class.
 """
 
+import asyncio
+import threading
+import time
+
 import pytest
+import numpy as np
 import pennylane as qml
 from pennylane import Device, DeviceError
 from pennylane.qnodes import QuantumFunctionError
@@ -694,3 +699,51 @@ class TestDeviceInit:
             m.setattr(qml, "version", lambda: "0.0.1")
             with pytest.raises(DeviceError, match="plugin requires PennyLane versions"):
                 qml.device("default.qubit", wires=0)
+
+
+class TestExecuteAsync:
+    """Tests for the asynchronous execution of circuits"""
+
+    def test_execute_async(self, tol):
+        """Test that the asynchronous execution agrees with the synchronous one"""
+        dev = qml.device("default.gaussian", wires=1)
+        queue = [qml.Displacement(0.5, 0, wires=0)]
+        observables = [qml.expval(qml.X(0))]
+
+        res = asyncio.run(dev.execute_async(queue, observables, {}))
+        dev.reset()
+        assert np.allclose(res, dev.execute(queue, observables, {}), atol=tol, rtol=0)
+
+    def test_executions_serialized(self, monkeypatch):
+        """Test that asynchronous executions on the same device are run one at a time,
+        while the event loop is not blocked"""
+        dev = qml.device("default.gaussian", wires=1)
+        running = []
+        overlapping = []
+        lock = threading.Lock()
+
+        def execute(*args, **kwargs):
+            with lock:
+                running.append(None)
+                overlapping.append(len(running) > 1)
+
+            time.sleep(0.01)
+            running.pop()
+            return 0.0
+
+        monkeypatch.setattr(dev, "execute", execute)
+
+        async def main():
+            ticks = 0
+            tasks = asyncio.gather(*[dev.execute_async([], []) for _ in range(5)])
+
+            while not tasks.done():
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+            return await tasks, ticks
+
+        res, ticks = asyncio.run(main())
+        assert res == [0.0] * 5
+        assert not any(overlapping)
+        assert ticks > 1
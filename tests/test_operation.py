@@ -339,9 +339,141 @@ class TestOperatorConstruction:
             DummyOp(0.5, wires=0)
 
 
+class TestTrustedConstruction:
+    """Test the construction of operators without validation."""
+
+    def test_validation_skipped(self):
+        """Test that the wires and parameters are not validated"""
+        with qml.operation._trusted_construction():
+            op = qml.RX(0.1, 0.2, wires=[0, 1], do_queue=False)
+
+        assert op.data == [0.1, 0.2]
+        assert op.wires == Wires([0, 1])
+
+    def test_wires_reused(self):
+        """Test that a Wires object passed to the operator is reused"""
+        wires = Wires([0, 1])
+
+        with qml.operation._trusted_construction():
+            op = qml.CNOT(wires=wires, do_queue=False)
+
+        assert op.wires is wires
+
+    def test_validation_restored(self):
+        """Test that the validation is restored on exit, and can be restored in a nested block"""
+        with qml.operation._trusted_construction():
+            with qml.operation._trusted_construction(False):
+                with pytest.raises(ValueError, match="wrong number of parameters"):
+                    qml.RX(0.1, 0.2, wires=0, do_queue=False)
+
+            qml.RX(0.1, 0.2, wires=0, do_queue=False)
+
+        with pytest.raises(ValueError, match="wrong number of parameters"):
+            qml.RX(0.1, 0.2, wires=0, do_queue=False)
+
+    def test_user_template_validated(self):
+        """Test that the operators of a user-defined template are validated, even when
+        the template is called from a template shipped with PennyLane"""
+
+        @qml.template
+        def unitary(wires):
+            qml.RX(0.1, 0.2, wires=wires)
+
+        with pytest.raises(ValueError, match="wrong number of parameters"):
+            unitary(wires=0)
+
+        with pytest.raises(ValueError, match="wrong number of parameters"):
+            qml.broadcast(unitary, wires=[0, 1], pattern="single")
+
+    def test_templates_trusted(self, monkeypatch):
+        """Test that the operators of the templates shipped with PennyLane are constructed
+        without validation, and agree with validated operators"""
+        weights = np.array([[0.1, 0.2], [0.3, 0.4]])
+
+        def check_domain(self, p, flattened=False):
+            raise AssertionError("parameter validated")
+
+        ops = qml.templates.BasicEntanglerLayers(weights, wires=[0, 1])
+
+        with monkeypatch.context() as m:
+            m.setattr(qml.operation.Operator, "check_domain", check_domain)
+            trusted_ops = qml.templates.BasicEntanglerLayers(weights, wires=[0, 1])
+
+        assert [(op.name, op.wires, op.data) for op in ops] == [
+            (op.name, op.wires, op.data) for op in trusted_ops
+        ]
+
+
+class TestMemoizedMatrices:
+    """Test the reuse of the matrices and eigenvalues of operators."""
+
+    def test_parameterless(self):
+        """Test that the matrix of an operation without parameters is computed once"""
+        res = qml.S(wires=0, do_queue=False).matrix
+
+        assert qml.S(wires=1, do_queue=False).matrix is res
+        assert qml.S(wires=1, do_queue=False).inv().matrix is not res
+        assert not res.flags.writeable
+
+    def test_parametrized(self, tol):
+        """Test that the matrix of an operation is reused for equal parameters only"""
+        res = qml.CRot(0.1, 0.2, 0.3, wires=[0, 1], do_queue=False).matrix
+
+        assert qml.CRot(0.1, 0.2, 0.3, wires=[1, 0], do_queue=False).matrix is res
+        assert qml.CRot(0.1, 0.2, 0.4, wires=[0, 1], do_queue=False).matrix is not res
+        assert np.allclose(res, qml.CRot._matrix(0.1, 0.2, 0.3), atol=tol, rtol=0)
+
+    def test_parameter_types(self):
+        """Test that parameters of different types are not confused"""
+        qml.PhaseShift(1, wires=0, do_queue=False).matrix
+        res = qml.PhaseShift(True, wires=0, do_queue=False).matrix
+
+        assert res is not qml.PhaseShift(1, wires=0, do_queue=False).matrix
+
+    def test_inverse(self, tol):
+        """Test that the matrix and eigenvalues of the inverse of an operation are memoized"""
+        op = qml.CRX(0.3, wires=[0, 1], do_queue=False).inv()
+        res = op.matrix
+
+        assert op.matrix is res
+        assert np.allclose(res, qml.CRX._matrix(0.3).conj().T, atol=tol, rtol=0)
+        assert np.allclose(
+            qml.RZ(0.3, wires=0, do_queue=False).inv().eigvals,
+            qml.RZ._eigvals(-0.3),
+            atol=tol,
+            rtol=0,
+        )
+
+    def test_number_of_wires(self, tol):
+        """Test that the matrices of operations on any number of wires are not confused"""
+        res2 = qml.MultiRZ(0.1, wires=[0, 1], do_queue=False).matrix
+        res3 = qml.MultiRZ(0.1, wires=[0, 1, 2], do_queue=False).matrix
+
+        assert res2.shape == (4, 4)
+        assert res3.shape == (8, 8)
+        assert qml.MultiRZ(0.1, wires=[2, 3], do_queue=False).matrix is res2
+
+    def test_array_parameters_not_memoized(self):
+        """Test that the matrices of operations with array parameters are computed anew"""
+        U = np.diag([1, 1j])
+        res = qml.QubitUnitary(U, wires=0, do_queue=False).inv().matrix
+
+        assert qml.QubitUnitary(U, wires=0, do_queue=False).inv().matrix is not res
+        assert res.flags.writeable
+
+
 class TestOperationConstruction:
     """Test custom operations construction."""
 
+    def test_default_grad_recipe(self):
+        """Test that each instance of an operation using the parameter-shift method
+        receives its own default gradient recipe"""
+        op1 = qml.CRX(0.1, wires=[0, 1], do_queue=False)
+        op2 = qml.CRX(0.2, wires=[0, 1], do_queue=False)
+
+        assert op1.grad_recipe == [None]
+        assert op1.grad_recipe is not op2.grad_recipe
+
     def test_incorrect_grad_recipe_length(self):
         """Test that an exception is raised if len(grad_recipe)!=len(num_params)"""
 
@@ -540,6 +540,94 @@ class TestVar:
         assert res == obs
 
 
+class TestParityExpval:
+    """Test the evaluation of tensor products of Pauli observables from the parity of
+    the computational basis states"""
+
+    WIRES = ["a", 2, 0, "b"]
+
+    @staticmethod
+    def random_state(wires, seed=42):
+        """Queue the preparation of a random state on the given wires."""
+        rng = np.random.RandomState(seed)
+        state = rng.randn(2 ** len(wires)) + 1j * rng.randn(2 ** len(wires))
+        qml.QubitStateVector(state / np.linalg.norm(state), wires=wires)
+
+    @pytest.mark.parametrize(
+        "obs",
+        [
+            lambda: qml.PauliZ("a") @ qml.PauliZ(0),
+            lambda: qml.PauliX(0) @ qml.PauliY("a"),
+            lambda: qml.PauliY("b") @ qml.Identity(2) @ qml.PauliX("a"),
+            lambda: qml.PauliX("a") @ qml.PauliY(2) @ qml.PauliZ(0) @ qml.PauliX("b"),
+        ],
+    )
+    @pytest.mark.parametrize("measure", [qml.expval, qml.var])
+    def test_agrees_with_eigenvalues(self, obs, measure, tol):
+        """Tests that the result agrees with the one computed from the matrix of the observable"""
+        dev = qml.device("default.qubit", wires=self.WIRES)
+        ob = obs()
+
+        def circuit():
+            self.random_state(self.WIRES)
+            return measure(obs())
+
+        def hermitian():
+            self.random_state(self.WIRES)
+            return measure(qml.Hermitian(ob.matrix, wires=ob.wires))
+
+        res = qml.QNode(circuit, dev)()
+        assert np.allclose(res, qml.QNode(hermitian, dev)(), atol=tol, rtol=0)
+
+    def test_eigenvalues_not_computed(self, monkeypatch, tol):
+        """Tests that the eigenvalues of a tensor product of Pauli observables are not used"""
+        dev = qml.device("default.qubit", wires=3)
+        dev.apply([qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1]), qml.CNOT(wires=[1, 2])])
+
+        with monkeypatch.context() as m:
+            m.setattr(qml.operation.Tensor, "eigvals", None)
+            res = dev.expval(qml.PauliZ(0) @ qml.PauliZ(2))
+
+        assert np.allclose(res, 1, atol=tol, rtol=0)
+
+    def test_marginal_probabilities(self, mocker, tol):
+        """Tests that only the marginal probabilities of the wires of the observable are
+        computed, in the order of the device wires"""
+        dev = qml.device("default.qubit", wires=self.WIRES)
+        dev.apply([qml.PauliX(wires=2)])
+        spy = mocker.spy(dev, "analytic_probability")
+
+        res = dev.expval(qml.PauliZ(0) @ qml.Identity("b") @ qml.PauliZ(2))
+
+        assert np.allclose(res, -1, atol=tol, rtol=0)
+        assert spy.call_count == 1
+        assert spy.call_args[1]["wires"] == Wires([2, 0])
+
+    def test_memmap_storage(self, tol):
+        """Tests that the marginal probabilities are streamed from a memory-mapped state"""
+        dev = qml.device("default.qubit", wires=4, storage="memmap", chunk_wires=1)
+        dev.apply([qml.Hadamard(wires=0), qml.CNOT(wires=[0, 3]), qml.PauliX(wires=3)])
+
+        res = dev.expval(qml.PauliZ(3) @ qml.PauliZ(0))
+        assert np.allclose(res, -1, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "obs",
+        [
+            qml.PauliZ(0),
+            qml.Identity(0) @ qml.Identity(1),
+            qml.PauliZ(0) @ qml.Hermitian(np.diag([1, 2]), wires=1),
+        ],
+    )
+    def test_unsupported(self, obs):
+        """Tests that other observables are evaluated from their eigenvalues"""
+        dev = qml.device("default.qubit", wires=2)
+        dev.apply([qml.PauliX(wires=1)])
+
+        assert dev._parity_expval(obs) is None
+        assert dev.expval(obs) == dev._dot(obs.eigvals, dev.probability(wires=obs.wires))
+
+
 class TestSample:
     """Test the sample method"""
 
@@ -645,6 +733,7 @@ class TestMarginalProb:
             np.array([0.3970422, 0.28090525, 0.11116351, 0.21088904]),
             [2, 0],
         ),
+        (np.arange(8) / 28, np.array([0, 4, 1, 5, 2, 6, 3, 7]) / 28, [1, 2, 0]),
     ]
 
     @pytest.mark.parametrize("probs, marginals, wires", marginal_test_data)
@@ -15,6 +15,8 @@
 Unit tests for the :mod:`pennylane` :class:`QueuingContext` class.
 """
 
+import threading
+
 import pytest
 import pennylane as qml
 import numpy as np
@@ -102,6 +104,39 @@ class TestQueuingContext:
         """Test that if there are no active contexts, active_context() returns None"""
         assert mock_queuing_context.active_context() is None
 
+    def test_contexts_per_thread(self):
+        """Test that the active contexts are local to each thread, so that operations
+        created concurrently are only queued by the contexts of their thread"""
+        num_threads = 4
+        barrier = threading.Barrier(num_threads)
+        queues = [None] * num_threads
+
+        def build(i):
+            with qml._queuing.Queue() as q:
+                # all the contexts are active at the same time
+                barrier.wait()
+
+                for _ in range(50):
+                    qml.RX(0.1, wires=i)
+
+                assert QueuingContext.active_context() is q
+
+            queues[i] = q.queue
+
+        threads = [threading.Thread(target=build, args=(i,)) for i in range(num_threads)]
+
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        for i, queue in enumerate(queues):
+            assert len(queue) == 50
+            assert all(op.wires.labels == (i,) for op in queue)
+
+        assert not QueuingContext._active_contexts
+
 
 class TestQueue:
     """Test the Queue class."""
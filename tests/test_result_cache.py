@@ -0,0 +1,275 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.result_cache` module.
+"""
+import pickle
+
+import pytest
+import numpy as np
+
+import pennylane as qml
+from pennylane import ResultCache
+from pennylane.beta.tapes import QuantumTape, QNode
+from pennylane.beta.queuing import expval
+
+
+def circuit(x, y):
+    """Quantum function used by the tests"""
+    qml.RX(x, wires=0)
+    qml.RY(y, wires=1)
+    qml.CNOT(wires=[0, 1])
+    qml.CNOT(wires=[1, 2])
+    return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1)), qml.expval(qml.Hermitian(np.diag([1, 2]), 2))
+
+
+class TestResultCache:
+    """Tests for the cache of device executions"""
+
+    def test_hit(self, mocker, tol):
+        """Tests that a repeated evaluation is served from the cache"""
+        cache = ResultCache()
+        dev = qml.device("default.qubit", wires=3)
+        node = qml.QNode(circuit, dev, cache=cache)
+        spy = mocker.spy(dev, "execute")
+
+        res1 = node(0.1, 0.2)
+        res2 = node(0.1, 0.2)
+
+        assert np.allclose(res1, res2, atol=tol, rtol=0)
+        assert spy.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_parameters_in_key(self, tol):
+        """Tests that evaluations with different parameters are not confused"""
+        cache = ResultCache()
+        dev = qml.device("default.qubit", wires=3)
+        node = qml.QNode(circuit, dev, cache=cache)
+        expected = qml.QNode(circuit, dev)
+
+        for x, y in [(0.1, 0.2), (0.2, 0.1), (0.1, 0.3)]:
+            assert np.allclose(node(x, y), expected(x, y), atol=tol, rtol=0)
+
+        assert cache.misses == 3
+
+    def test_device_in_key(self):
+        """Tests that the same circuit on differently configured devices is not confused"""
+        cache = ResultCache()
+        ops = [qml.RX(0.4, wires=0)]
+        obs = [qml.expval(qml.PauliZ(0))]
+
+        keys = {
+            cache.key(qml.device("default.qubit", wires=1), ops, obs),
+            cache.key(qml.device("default.qubit", wires=["a"]), ops, obs),
+            cache.key(qml.device("default.qubit", wires=3), ops, obs),
+            cache.key(qml.device("default.qubit.autograd", wires=1), ops, obs),
+        }
+        assert len(keys) == 4
+
+    def test_device_options_in_key(self):
+        """Tests that the options a device is created with are part of the key, after
+        applying the defaults of the device"""
+        cache = ResultCache()
+        ops = [qml.Displacement(0.4, 0, wires=0)]
+        obs = [qml.expval(qml.X(0))]
+
+        assert cache.key(qml.device("default.gaussian", wires=1), ops, obs) == cache.key(
+            qml.device("default.gaussian", wires=1, hbar=2), ops, obs
+        )
+        assert cache.key(qml.device("default.gaussian", wires=1), ops, obs) != cache.key(
+            qml.device("default.gaussian", wires=1, hbar=1), ops, obs
+        )
+
+        ops = [qml.RX(0.4, wires=0)]
+        obs = [qml.expval(qml.PauliZ(0))]
+
+        keys = {
+            cache.key(qml.device("default.qubit", wires=1), ops, obs),
+            cache.key(qml.device("default.qubit", wires=1, dtype=np.complex64), ops, obs),
+            cache.key(qml.device("default.qubit", wires=1, prefix_cache_size=2 ** 10), ops, obs),
+        }
+        assert len(keys) == 3
+
+    def test_device_options_not_canonical(self):
+        """Tests that executions on devices created with options that have no canonical
+        representation are not cached"""
+        cache = ResultCache()
+        ops = [qml.RX(0.4, wires=0)]
+        obs = [qml.expval(qml.PauliZ(0))]
+
+        dev = qml.device("default.qubit", wires=1, memmap_dir=object())
+        assert cache.key(dev, ops, obs) is None
+
+    def test_result_copied(self):
+        """Tests that modifying a returned result does not modify the cache"""
+        cache = ResultCache()
+        dev = qml.device("default.qubit", wires=3)
+        node = qml.QNode(circuit, dev, cache=cache)
+
+        res = node(0.1, 0.2)
+        res[0] = 5
+        assert node(0.1, 0.2)[0] != 5
+
+    def test_lru_eviction(self):
+        """Tests that the least recently used results are discarded"""
+        cache = ResultCache(max_size=2)
+        dev = qml.device("default.qubit", wires=3)
+        node = qml.QNode(circuit, dev, cache=cache)
+
+        node(0.1, 0.2)
+        node(0.3, 0.2)
+        node(0.1, 0.2)
+        node(0.5, 0.2)
+        assert len(cache) == 2
+
+        node(0.1, 0.2)
+        assert cache.hits == 2
+
+        node(0.3, 0.2)
+        assert cache.misses == 4
+
+    def test_disk(self, tmp_path, mocker, tol):
+        """Tests that results stored on disk are reused by another cache"""
+        path = str(tmp_path / "results.sqlite")
+        dev = qml.device("default.qubit", wires=3)
+        expected = qml.QNode(circuit, dev, cache=ResultCache(path=path))(0.1, 0.2)
+
+        cache = ResultCache(path=path)
+        node = qml.QNode(circuit, dev, cache=cache)
+        spy = mocker.spy(dev, "execute")
+
+        assert np.allclose(node(0.1, 0.2), expected, atol=tol, rtol=0)
+        assert spy.call_count == 0
+        assert cache.hits == 1
+
+    def test_pickle(self, tmp_path):
+        """Tests that a cache can be pickled, and keeps its results"""
+        cache = ResultCache(path=str(tmp_path / "results.sqlite"))
+        dev = qml.device("default.qubit", wires=3)
+        qml.QNode(circuit, dev, cache=cache)(0.1, 0.2)
+
+        cache = pickle.loads(pickle.dumps(cache))
+        qml.QNode(circuit, dev, cache=cache)(0.1, 0.2)
+        assert cache.hits == 1
+
+    def test_sampled_unseeded(self, mocker):
+        """Tests that stochastic executions are not cached without a seed"""
+        cache = ResultCache()
+        dev = qml.device("default.qubit", wires=3, analytic=False)
+        node = qml.QNode(circuit, dev, cache=cache)
+        spy = mocker.spy(dev, "execute")
+
+        node(0.1, 0.2)
+        node(0.1, 0.2)
+
+        assert spy.call_count == 2
+        assert len(cache) == 0
+
+    def test_sampled_seeded(self, tmp_path):
+        """Tests that seeded stochastic executions are cached and reproducible"""
+        path = str(tmp_path / "results.sqlite")
+        dev = qml.device("default.qubit", wires=3, analytic=False, shots=10)
+
+        def sampled(x):
+            qml.RX(x, wires=0)
+            return qml.sample(qml.PauliZ(0))
+
+        res1 = qml.QNode(sampled, dev, cache=ResultCache(path=path, seed=42))(0.7)
+
+        cache = ResultCache(seed=42)
+        res2 = qml.QNode(sampled, dev, cache=cache)(0.7)
+        assert np.all(res1 == res2)
+        assert cache.misses == 1
+
+        cache = ResultCache(path=path, seed=42)
+        assert np.all(qml.QNode(sampled, dev, cache=cache)(0.7) == res1)
+        assert cache.hits == 1
+
+    def test_gradient(self, tol):
+        """Tests that the gradient of a QNode using the cache is unchanged"""
+        dev = qml.device("default.qubit", wires=3)
+        x = np.array([0.1, 0.2])
+
+        def cost(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.RX(x[0], wires=1)
+            return qml.expval(qml.PauliZ(1))
+
+        expected = qml.grad(qml.QNode(cost, dev))(x)
+
+        for diff_method in ["parameter-shift", "finite-diff", "reversible"]:
+            cache = ResultCache()
+            node = qml.QNode(cost, dev, diff_method=diff_method, cache=cache)
+
+            node(x)
+            assert np.allclose(qml.grad(node)(x), expected, atol=1e-6, rtol=0)
+            assert np.allclose(qml.grad(node)(x), expected, atol=1e-6, rtol=0)
+
+    def test_backprop_not_cached(self):
+        """Tests that executions with autograd parameters are not cached"""
+        cache = ResultCache()
+        dev = qml.device("default.qubit.autograd", wires=3)
+        node = qml.QNode(circuit, dev, diff_method="backprop", cache=cache)
+
+        x = qml.numpy.array(0.1, requires_grad=True)
+        qml.grad(lambda x: node(x, 0.2)[0])(x)
+        assert cache.misses == 0
+
+
+class TestTapes:
+    """Tests for caching the execution of quantum tapes"""
+
+    def test_tape(self, mocker, tol):
+        """Tests that repeated tape executions are served from the cache"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            expval(qml.PauliZ(0))
+
+        tape.cache = ResultCache()
+        spy = mocker.spy(dev, "execute")
+
+        res = tape.execute(dev)
+        assert np.allclose(tape.execute(dev), res, atol=tol, rtol=0)
+        assert np.allclose(tape.execute(dev, params=[0.2]), np.cos(0.2), atol=tol, rtol=0)
+        assert spy.call_count == 2
+
+    @pytest.mark.parametrize("diff_method", ["parameter-shift", "reversible", "finite-diff"])
+    def test_qnode(self, diff_method, tol):
+        """Tests that a cached beta QNode returns the correct result and gradient"""
+        dev = qml.device("default.qubit", wires=2)
+        cache = ResultCache()
+
+        def func(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=1)
+            return expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        node = QNode(func, dev, diff_method=diff_method, cache=cache)
+        x = qml.numpy.array(0.1, requires_grad=True)
+        y = qml.numpy.array(0.2, requires_grad=True)
+
+        expected = np.cos(0.1) * np.cos(0.2)
+        assert np.allclose(node(x, y), expected, atol=tol, rtol=0)
+        assert np.allclose(node(x, y), expected, atol=tol, rtol=0)
+        assert cache.hits >= 1
+
+        expected = [-np.sin(0.1) * np.cos(0.2), -np.cos(0.1) * np.sin(0.2)]
+
+        for _ in range(2):
+            res = qml.grad(node)(x, y)
+            assert np.allclose(res, expected, atol=1e-6, rtol=0)
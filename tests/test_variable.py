@@ -14,9 +14,14 @@
 """
 Unit tests for :mod:`pennylane.variable`.
 """
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
 import pytest
+import numpy as np
 import numpy.random as nr
 
+import pennylane as qml
 from pennylane.variable import Variable
 
 
@@ -101,3 +106,46 @@ def test_keyword_variable(par_keyword, name, ind, mult, tol):
     assert v.mult == 1
     assert v.idx == ind
     variable_eval_asserts(v, par_keyword[name][ind], mult, tol)
+
+
+def test_values_thread_local():
+    """Variable values stored in one thread are not visible in another thread."""
+    Variable.positional_arg_values = [0.1, 0.2]
+    Variable.kwarg_values = {"foo": [0.3]}
+    barrier = threading.Barrier(2)
+
+    def evaluate(values):
+        Variable.positional_arg_values = values
+        barrier.wait()  # both threads have stored their values
+        return Variable(1).val
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(evaluate, [0, k]) for k in (1, 2)]
+        assert [f.result() for f in futures] == [1, 2]
+
+    # the values stored in the main thread are unaffected
+    assert Variable(1).val == 0.2
+    assert Variable(0, name="foo", is_kwarg=True).val == 0.3
+
+
+def test_concurrent_qnodes(tol):
+    """QNodes evaluated concurrently in threads use their own parameter values."""
+    dev1 = qml.device("default.qubit", wires=1)
+    dev2 = qml.device("default.qubit", wires=1)
+
+    def circuit(x):
+        qml.RX(x, wires=0)
+        qml.RY(x, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    qnodes = [qml.QNode(circuit, dev1), qml.QNode(circuit, dev2)]
+    params = [np.linspace(0, np.pi, 50), np.linspace(np.pi, 2 * np.pi, 50)]
+
+    def evaluate(qnode, xs):
+        return [qnode(x) for x in xs]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        res = list(executor.map(evaluate, qnodes, params))
+
+    for r, xs in zip(res, params):
+        assert np.allclose(r, np.cos(xs) ** 2, atol=tol, rtol=0)
@@ -14,6 +14,9 @@
 """
 Unit tests for :mod:`pennylane.wires`.
 """
+import copy
+import pickle
+
 import pytest
 import numpy as np
 import pennylane as qml
@@ -326,3 +329,85 @@ class TestWires:
 
         with pytest.raises(WireError, match="Expected a Wires object"):
             Wires.unique_wires([[2, 1], [8, 5]])
+
+
+class TestInterning:
+    """Tests for the interning and cached lookups of ``Wires`` objects."""
+
+    def test_interned(self):
+        """Tests that equal Wires objects with integer or string labels are the same object."""
+        assert Wires([0, "a"]) is Wires((0, "a"))
+        assert Wires(3) is Wires([3])
+        assert Wires(range(2)) is Wires([0, 1])
+
+    def test_wires_input_returned(self):
+        """Tests that a Wires object constructed from another one is the same object."""
+        wires = Wires([0.5, -1])
+        assert Wires(wires) is wires
+
+    def test_equal_labels_of_different_types(self):
+        """Tests that labels which compare equal, but have different types, are kept apart."""
+        assert type(Wires([1]).labels[0]) is int
+        assert type(Wires([1.0]).labels[0]) is float
+        assert type(Wires([True]).labels[0]) is bool
+        assert type(Wires(np.array([1])).labels[0]) is np.int64
+
+    def test_error_not_interned(self):
+        """Tests that an invalid input is not interned."""
+        with pytest.raises(WireError, match="Wires must be unique"):
+            Wires([7, 7])
+
+        with pytest.raises(WireError, match="Wires must be unique"):
+            Wires([7, 7])
+
+    def test_iteration_cached(self):
+        """Tests that iterating and indexing return the same single-wire Wires objects."""
+        wires = Wires([0.5, 2, "a"])
+        assert list(wires) == [Wires(0.5), Wires(2), Wires("a")]
+        assert all(w1 is w2 for w1, w2 in zip(wires, wires))
+        assert wires[1] is list(wires)[1]
+        assert wires[0][0] is wires[0]
+
+    def test_hash(self):
+        """Tests that equal Wires objects have equal hashes."""
+        assert hash(Wires([1, 2])) == hash(Wires(np.array([1, 2])))
+        assert Wires(np.array([1, 2])) in {Wires([1, 2])}
+
+    def test_index_lookup(self):
+        """Tests that indices are found for labels, single-wire Wires objects, and Wires objects."""
+        wires = Wires(["a", 4, 0.5])
+        assert wires.index(0.5) == 2
+        assert wires.index(Wires("a")) == 0
+        assert wires.indices(Wires([0.5, 4])) == [2, 1]
+        assert wires.indices([4, "a"]) == [1, 0]
+
+        with pytest.raises(WireError, match="not found"):
+            wires.indices(Wires([4, 3]))
+
+        with pytest.raises(WireError, match="not found"):
+            wires.index([4])
+
+    @pytest.mark.parametrize("labels", [[0, "a"], [0.5, -1]])
+    def test_copy_and_pickle(self, labels):
+        """Tests that Wires objects can be copied and pickled."""
+        wires = Wires(labels)
+
+        for res in [copy.copy(wires), copy.deepcopy(wires), pickle.loads(pickle.dumps(wires))]:
+            assert res == wires
+            assert res.indices(wires) == list(range(len(labels)))
+
+    def test_unpickled_interned(self):
+        """Tests that unpickled Wires objects with integer or string labels are interned."""
+        wires = Wires([0, "a"])
+        assert pickle.loads(pickle.dumps(wires)) is wires
+
+    def test_map_wires_cached(self):
+        """Tests that devices cache the mapped wires."""
+        dev = qml.device("default.qubit", wires=["a", "b", 5])
+        mapped = dev.map_wires(Wires([5, "a"]))
+
+        assert mapped == Wires([2, 0])
+        assert dev.map_wires(Wires([5, "a"])) is mapped
+
+        with pytest.raises(WireError, match="Did not find some of the wires"):
+            dev.map_wires(Wires([6]))